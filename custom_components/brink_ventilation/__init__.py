@@ -3,31 +3,57 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from collections.abc import Collection
 import logging
 from typing import Any
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME, Platform
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_URL,
+    CONF_USERNAME,
+    Platform,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from .const import (
+    ACTIVITY_POLL_DURATION,
+    BASE_URL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
     DATA_CLIENT,
     DATA_COORDINATOR,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_MODEL,
     DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    GATEWAY_STATE_ONLINE,
+    GATEWAY_STATE_TTL,
     PARAM_DEVICE_TYPE,
+    PARAM_NAME_MAP,
     PARAM_SOFTWARE_LABEL,
+    POLL_BACKOFF_FACTOR,
 )
+from .coordinator import BrinkHomeCoordinator
 from .core.brink_home_cloud import BrinkAuthError, BrinkHomeCloud
+from .core.poll_interval import AdaptivePollInterval
+from .labels import async_get_labels
+from .token_store import (
+    BrinkTokenStore,
+    async_pop_login_handoff,
+    async_remove_tokens,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,12 +67,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
     scan_interval = int(entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+    # Entries saved before the bounds existed must not lose their interval.
+    poll_interval = AdaptivePollInterval(
+        scan_interval,
+        int(
+            entry.options.get(
+                CONF_MIN_SCAN_INTERVAL,
+                min(DEFAULT_MIN_SCAN_INTERVAL, scan_interval),
+            )
+        ),
+        int(
+            entry.options.get(
+                CONF_MAX_SCAN_INTERVAL,
+                max(DEFAULT_MAX_SCAN_INTERVAL, scan_interval),
+            )
+        ),
+        activity_duration=ACTIVITY_POLL_DURATION,
+        backoff_factor=POLL_BACKOFF_FACTOR,
+    )
+    max_concurrency = int(
+        entry.options.get(
+            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
+    )
 
     session = async_get_clientsession(hass)
-    brink_client = BrinkHomeCloud(session, username, password)
+    brink_client = BrinkHomeCloud(
+        session,
+        username,
+        password,
+        stream_decode=True,
+        http_cache=True,
+        # Not offered by the config flow; lets tools/ point an entry elsewhere.
+        base_url=entry.data.get(CONF_URL, BASE_URL),
+        labels=await async_get_labels(hass),
+    )
+
+    token_store = BrinkTokenStore(hass, entry)
+    tokens = await token_store.async_load()
+    if handoff := async_pop_login_handoff(hass, entry.unique_id):
+        tokens = handoff["tokens"]
+        brink_client.seed_systems(handoff["systems"], handoff["fetched_at"])
+        token_store.async_delay_save(tokens)
+    if tokens:
+        brink_client.restore_tokens(tokens)
+    brink_client.set_token_listener(
+        lambda: token_store.async_delay_save(brink_client.export_tokens())
+    )
 
     try:
-        await brink_client.login()
+        if not brink_client.has_tokens:
+            await brink_client.login()
     except BrinkAuthError as ex:
         await brink_client.close()
         raise ConfigEntryAuthFailed from ex
@@ -61,7 +132,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def async_update_data() -> dict[int, dict[str, Any]]:
         try:
-            return await async_get_devices(brink_client)
+            return await async_get_devices(
+                brink_client,
+                max_concurrency,
+                coordinator.refresh_tiers,
+                coordinator.data,
+            )
         except BrinkAuthError as ex:
             raise ConfigEntryAuthFailed from ex
         except aiohttp.ClientResponseError as ex:
@@ -71,14 +147,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             raise UpdateFailed(ex) from ex
 
-    coordinator = DataUpdateCoordinator(
+    coordinator = BrinkHomeCoordinator(
         hass,
         _LOGGER,
         name=DOMAIN,
         update_method=async_update_data,
-        update_interval=timedelta(seconds=scan_interval),
+        poll_interval=poll_interval,
     )
 
+    # Platforms create entities from the parameters of the first refresh, so
+    # everything they may read is registered before it. Diagnostics fetch the
+    # remaining parameters on demand.
+    brink_client.register_consumer(*PARAM_NAME_MAP.values())
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         DATA_CLIENT: brink_client,
@@ -95,27 +176,81 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_get_devices(brink_client: BrinkHomeCloud) -> dict[int, dict[str, Any]]:
-    """Fetch and normalize Brink systems plus the parameters this integration uses."""
-    systems = await brink_client.get_systems()
+async def async_get_devices(
+    brink_client: BrinkHomeCloud,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    tiers: Collection[str] | None = None,
+    previous: dict[int, dict[str, Any]] | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Fetch and normalize Brink systems plus the parameters this integration uses.
+
+    Systems are fetched concurrently. A system that fails is left out so its
+    entities become unavailable, unless every system failed. The systems
+    list, which carries the gateway states, is refreshed every
+    GATEWAY_STATE_TTL seconds, after failures and when a system listed as not
+    online answers, once per listed state as compared with the previous
+    devices. Only values in the given refresh tiers are refreshed, all of
+    them by default.
+    """
+    systems = await brink_client.get_systems(max_age=GATEWAY_STATE_TTL)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def async_fetch(system_id: int):
+        async with semaphore:
+            return await brink_client.get_device_data(system_id, tiers=tiers)
+
+    results = await asyncio.gather(
+        *(async_fetch(system["system_id"]) for system in systems),
+        return_exceptions=True,
+    )
 
     devices: dict[int, dict[str, Any]] = {}
-    for system in systems:
+    errors: list[Exception] = []
+    for system, parameters in zip(systems, results):
         system_id = system["system_id"]
-        parameters = await brink_client.get_device_data(system_id)
+        if isinstance(parameters, BaseException):
+            if not isinstance(parameters, Exception) or _is_auth_error(parameters):
+                raise parameters
+            _LOGGER.warning(
+                "Error fetching Brink system %s: %s", system_id, parameters
+            )
+            errors.append(parameters)
+            continue
+
+        gateway_state = system.get("gateway_state")
+        previous_device = (previous or {}).get(system_id)
+        if gateway_state != GATEWAY_STATE_ONLINE and (
+            previous_device is None
+            or previous_device.get("gateway_state") != gateway_state
+        ):
+            brink_client.invalidate_systems()
+
+        device_type = parameters.get(PARAM_DEVICE_TYPE)
+        software_label = parameters.get(PARAM_SOFTWARE_LABEL)
         devices[system_id] = {
             "system_id": system_id,
             "name": system.get("name") or DEFAULT_NAME,
             "serial_number": system.get("serial_number"),
-            "gateway_state": system.get("gateway_state"),
-            "model": parameters.get(PARAM_DEVICE_TYPE, {}).get("value") or DEFAULT_MODEL,
-            "sw_version": parameters.get(PARAM_SOFTWARE_LABEL, {}).get("value"),
+            "gateway_state": gateway_state,
+            "model": (device_type and device_type.value) or DEFAULT_MODEL,
+            "sw_version": software_label.value if software_label else None,
             "parameters": parameters,
         }
 
+    if errors:
+        brink_client.invalidate_systems()
+        if not devices:
+            raise errors[0]
     return devices
 
 
+def _is_auth_error(err: Exception) -> bool:
+    """Return True when the error needs re-authentication."""
+    if isinstance(err, BrinkAuthError):
+        return True
+    return isinstance(err, aiohttp.ClientResponseError) and err.status == 401
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -123,3 +258,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         runtime = hass.data[DOMAIN].pop(entry.entry_id)
         await runtime[DATA_CLIENT].close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored tokens of a deleted config entry."""
+    await async_remove_tokens(hass, entry)
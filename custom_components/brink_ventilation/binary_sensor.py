@@ -102,7 +102,7 @@ class BrinkFilterNeedChangeBinarySensor(BrinkHomeDeviceEntity, BinarySensorEntit
         param = self.data
         if param is None:
             return None
-        return str(param.get("value")) == "1"
+        return str(param.value) == "1"
 
     @property
     def device_class(self):
@@ -13,8 +13,18 @@ from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
 from .core.brink_home_cloud import BrinkAuthError, BrinkHomeCloud
+from .token_store import async_store_login_handoff
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +38,15 @@ DATA_SCHEMA = vol.Schema(
 OPTIONS_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_SCAN_INTERVAL): int,
+        vol.Required(CONF_MIN_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Required(CONF_MAX_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Required(CONF_MAX_CONCURRENT_REQUESTS): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
     }
 )
 
@@ -60,6 +79,7 @@ class BrinkHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             try:
                 await brink_client.login()
+                systems = await brink_client.get_systems()
             except BrinkAuthError as err:
                 errors["base"] = "invalid_auth" if err.is_credentials_error else "cannot_connect"
             except aiohttp.ClientResponseError as err:
@@ -70,6 +90,7 @@ class BrinkHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
+                async_store_login_handoff(self.hass, unique_id, brink_client, systems)
                 if self.source != config_entries.SOURCE_REAUTH:
                     return self.async_create_entry(title=username, data=user_input)
                 return self.async_update_reload_and_abort(
@@ -95,18 +116,38 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithReload):
 
     async def async_step_init(self, user_input=None):
         """Handle options flow."""
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
-
+            if (
+                user_input[CONF_MIN_SCAN_INTERVAL]
+                <= user_input[CONF_SCAN_INTERVAL]
+                <= user_input[CONF_MAX_SCAN_INTERVAL]
+            ):
+                return self.async_create_entry(title="", data=user_input)
+            errors["base"] = "invalid_scan_interval_range"
+
+        options = user_input or self.config_entry.options
+        scan_interval = options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         return self.async_show_form(
             step_id="init",
             data_schema=self.add_suggested_values_to_schema(
                 OPTIONS_SCHEMA,
                 {
-                    CONF_SCAN_INTERVAL: self.config_entry.options.get(
-                        CONF_SCAN_INTERVAL,
-                        DEFAULT_SCAN_INTERVAL,
-                    )
+                    CONF_SCAN_INTERVAL: scan_interval,
+                    # The default bounds always include the configured interval.
+                    CONF_MIN_SCAN_INTERVAL: options.get(
+                        CONF_MIN_SCAN_INTERVAL,
+                        min(DEFAULT_MIN_SCAN_INTERVAL, scan_interval),
+                    ),
+                    CONF_MAX_SCAN_INTERVAL: options.get(
+                        CONF_MAX_SCAN_INTERVAL,
+                        max(DEFAULT_MAX_SCAN_INTERVAL, scan_interval),
+                    ),
+                    CONF_MAX_CONCURRENT_REQUESTS: options.get(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        DEFAULT_MAX_CONCURRENT_REQUESTS,
+                    ),
                 },
             ),
+            errors=errors,
         )
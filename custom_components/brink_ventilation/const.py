@@ -8,15 +8,68 @@ DEFAULT_MODEL = "Brink ventilation"
 
 DATA_CLIENT = "brink_client"
 DATA_COORDINATOR = "coordinator"
+# hass.data key of the logins validated by the config flow, by unique id.
+DATA_LOGIN_HANDOFF = f"{DOMAIN}_login_handoff"
+# hass.data key of the parameter labels, by language.
+DATA_LABELS = f"{DOMAIN}_labels"
 
 DEFAULT_SCAN_INTERVAL = 30
 
-API_V1_URL = "https://www.brink-home.com/portal/api/v1.1/"
+# Bounds of the adaptive polling interval, in seconds.
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 10
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL = 300
 
-OIDC_AUTH_URL = "https://www.brink-home.com/idsrv/connect/authorize"
-OIDC_TOKEN_URL = "https://www.brink-home.com/idsrv/connect/token"
+# Seconds of polling at the minimum interval after a write or mode change,
+# and the factor the interval grows by per poll without changed values.
+ACTIVITY_POLL_DURATION = 120
+POLL_BACKOFF_FACTOR = 1.5
+
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Upper bound for a single uidescription response body.
+UIDESCRIPTION_MAX_BODY_SIZE = 4 * 1024 * 1024
+
+# Seconds between full uidescription discoveries; polls in between only
+# refresh parameter values.
+DISCOVERY_INTERVAL = 3600
+
+# The systems list is cached between polls and fetched page by page.
+SYSTEMS_CACHE_TTL = 900
+SYSTEMS_PAGE_SIZE = 50
+
+# Polls refresh the systems list at least this often, so a gateway going
+# offline shows up while its system still answers from the cloud.
+GATEWAY_STATE_TTL = 60
+
+# Writes to one system arriving within this many seconds share one request.
+WRITE_COALESCE_WINDOW = 0.25
+
+# Consecutive failed requests that open the circuit breaker, and seconds
+# before a probe may close it again.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 60
+
+# Fraction of the access token lifetime after which it is refreshed in the
+# background, and the random spread applied to that point.
+TOKEN_REFRESH_FRACTION = 0.75
+TOKEN_REFRESH_JITTER = 0.1
+
+# Refresh cycles whose timing breakdown is kept for diagnostics.
+REFRESH_HISTORY = 10
+
+# The Brink Home cloud; the client can be pointed at another server such as
+# tools/mock_cloud.py.
+BASE_URL = "https://www.brink-home.com"
+API_V1_PATH = "/portal/api/v1.1/"
+
+OIDC_AUTH_PATH = "/idsrv/connect/authorize"
+OIDC_DISCOVERY_PATH = "/idsrv/.well-known/openid-configuration"
+OIDC_TOKEN_PATH = "/idsrv/connect/token"
 OIDC_CLIENT_ID = "spa"
-OIDC_REDIRECT_URI = "https://www.brink-home.com/app/"
+OIDC_REDIRECT_PATH = "/app/"
 OIDC_SCOPE = "openid api role locale"
 
 PARAM_DEVICE_TYPE = "device_type"
@@ -41,6 +94,27 @@ PARAM_CO2_SENSOR_3 = "co2_sensor_3"
 PARAM_CO2_SENSOR_4 = "co2_sensor_4"
 PARAM_DAYS_SINCE_FILTER_RESET = "days_since_filter_reset"
 
+# How often the value of a parameter is refreshed: on every poll, on every
+# SLOW_REFRESH_POLLS-th poll, or only at discovery and on demand. Parameters
+# not listed are live.
+TIER_LIVE = "live"
+TIER_SLOW = "slow"
+TIER_STATIC = "static"
+SLOW_REFRESH_POLLS = 10
+PARAMETER_TIERS: dict[str, str] = {
+    PARAM_DEVICE_TYPE: TIER_STATIC,
+    PARAM_SOFTWARE_LABEL: TIER_STATIC,
+    PARAM_DAYS_SINCE_FILTER_RESET: TIER_SLOW,
+    PARAM_FILTER_STATUS: TIER_SLOW,
+}
+
+# Parameters whose change counts as user activity for the polling interval.
+ACTIVITY_PARAMETERS = (
+    PARAM_OPERATING_MODE,
+    PARAM_VENTILATION_LEVEL,
+    PARAM_BYPASS_OPERATION,
+)
+
 PARAM_NAME_MAP: dict[str, str] = {
     "deviceTypeTitle": PARAM_DEVICE_TYPE,
     "softwareLabel": PARAM_SOFTWARE_LABEL,
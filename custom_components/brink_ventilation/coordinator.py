@@ -0,0 +1,127 @@
+"""Data update coordinator for Brink Home."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import timedelta
+import time
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    ACTIVITY_PARAMETERS,
+    REFRESH_HISTORY,
+    SLOW_REFRESH_POLLS,
+    TIER_LIVE,
+    TIER_SLOW,
+)
+from .core.metrics import PHASE_ENTITY_WRITES, RefreshTrace, current_trace
+from .core.poll_interval import AdaptivePollInterval
+
+_LIVE = frozenset({TIER_LIVE})
+_LIVE_AND_SLOW = frozenset({TIER_LIVE, TIER_SLOW})
+
+
+class BrinkHomeCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]]):
+    """Coordinator keeping a timing breakdown of its last refresh cycles.
+
+    With a poll interval, the update interval follows it: fast after writes
+    and mode changes, slower while the device states stay the same. Only
+    parameters with options count as states; measurements drift on nearly
+    every poll and would keep the interval at its base. refresh_tiers
+    tells the update method which values to refresh: live ones on every
+    poll, slow ones on every slow_refresh_polls-th. Static values are only
+    refreshed by discovery, and the client merges every refresh into the
+    previous parameters so each poll still yields one complete snapshot.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        history: int = REFRESH_HISTORY,
+        poll_interval: AdaptivePollInterval | None = None,
+        slow_refresh_polls: int = SLOW_REFRESH_POLLS,
+        **kwargs: Any,
+    ):
+        """Initialize the coordinator."""
+        if poll_interval is not None:
+            kwargs["update_interval"] = timedelta(seconds=poll_interval.interval)
+        super().__init__(*args, **kwargs)
+        self.cycles: deque[RefreshTrace] = deque(maxlen=history)
+        self.poll_interval = poll_interval
+        self.slow_refresh_polls = slow_refresh_polls
+        self.refresh_tiers: frozenset[str] = _LIVE_AND_SLOW
+        self._polls_since_slow = 0
+
+    @callback
+    def async_record_activity(self) -> None:
+        """Poll fast for a while, for instance after a write."""
+        if self.poll_interval is not None:
+            self.update_interval = timedelta(
+                seconds=self.poll_interval.record_activity()
+            )
+
+    async def _async_update_data(self) -> dict[int, dict[str, Any]]:
+        """Fetch the data while tracing where the time goes."""
+        refresh_slow = self._polls_since_slow + 1 >= self.slow_refresh_polls
+        self.refresh_tiers = _LIVE_AND_SLOW if refresh_slow else _LIVE
+        trace = RefreshTrace()
+        token = current_trace.set(trace)
+        started = time.monotonic()
+        try:
+            data = await super()._async_update_data()
+        except Exception as ex:
+            trace.error = repr(ex)
+            raise
+        finally:
+            current_trace.reset(token)
+            trace.duration = time.monotonic() - started
+            self.cycles.append(trace)
+        # A failed slow refresh is retried on the next poll.
+        self._polls_since_slow = 0 if refresh_slow else self._polls_since_slow + 1
+        if self.poll_interval is not None and self.data is not None:
+            self._adapt_interval(self.data, data)
+        return data
+
+    def _adapt_interval(
+        self, previous: dict[int, dict[str, Any]], data: dict[int, dict[str, Any]]
+    ) -> None:
+        """Set the update interval from what changed since the last poll."""
+        changed = False
+        for system_id, device in data.items():
+            old_device = previous.get(system_id)
+            if old_device is None:
+                changed = True
+                continue
+            parameters = device["parameters"]
+            old_parameters = old_device["parameters"]
+            if any(
+                _value(parameters.get(key)) != _value(old_parameters.get(key))
+                for key in ACTIVITY_PARAMETERS
+            ):
+                self.poll_interval.record_activity()
+            # Unchanged parameters keep their objects between polls.
+            changed = changed or any(
+                param.options
+                and old_parameters.get(key) is not param
+                and _value(old_parameters.get(key)) != _value(param)
+                for key, param in parameters.items()
+            )
+        self.update_interval = timedelta(
+            seconds=self.poll_interval.record_poll(changed)
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the entities and time their state writes."""
+        started = time.monotonic()
+        super().async_update_listeners()
+        if self.cycles and PHASE_ENTITY_WRITES not in self.cycles[-1].phases:
+            self.cycles[-1].add(PHASE_ENTITY_WRITES, time.monotonic() - started)
+
+
+def _value(param: Any) -> tuple[Any, Any] | None:
+    """Return the value and value state of a parameter for comparison."""
+    return None if param is None else (param.value, param.value_state)
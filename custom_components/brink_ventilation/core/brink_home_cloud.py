@@ -5,30 +5,89 @@ from __future__ import annotations
 import asyncio
 import base64
 import hashlib
+import json
 import logging
+import math
+import random
 import secrets
 import time
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterator,
+    Mapping,
+)
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from html.parser import HTMLParser
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TypeVar
 from urllib.parse import parse_qs, urlparse
 
 import aiohttp
 import async_timeout
 
 from ..const import (
-    API_V1_URL,
-    OIDC_AUTH_URL,
+    API_V1_PATH,
+    BASE_URL,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    DISCOVERY_INTERVAL,
+    OIDC_AUTH_PATH,
     OIDC_CLIENT_ID,
-    OIDC_REDIRECT_URI,
+    OIDC_DISCOVERY_PATH,
+    OIDC_REDIRECT_PATH,
     OIDC_SCOPE,
-    OIDC_TOKEN_URL,
+    OIDC_TOKEN_PATH,
     PARAM_NAME_MAP,
+    PARAMETER_TIERS,
+    SYSTEMS_CACHE_TTL,
+    SYSTEMS_PAGE_SIZE,
+    TIER_LIVE,
+    TOKEN_REFRESH_FRACTION,
+    TOKEN_REFRESH_JITTER,
+    UIDESCRIPTION_MAX_BODY_SIZE,
+    WRITE_COALESCE_WINDOW,
     WRITE_VALUE_STATE,
 )
-from ..translations import TRANSLATIONS
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .metrics import (
+    ENDPOINT_CREDENTIALS,
+    ENDPOINT_DEVICE_DATA,
+    ENDPOINT_LOGIN_PAGE,
+    ENDPOINT_SYSTEMS,
+    ENDPOINT_TOKEN_EXCHANGE,
+    ENDPOINT_TOKEN_REFRESH,
+    ENDPOINT_WRITE,
+    PHASE_DECODE,
+    PHASE_EXTRACT,
+    PHASE_NETWORK,
+    PHASE_TOKEN,
+    ClientMetrics,
+    current_system,
+    record_phase,
+    record_system,
+    trace_phase,
+)
+from .models import BrinkOption, BrinkParameter, BrinkParameterMeta
+from .retry import RetryPolicy
+from .uidescription_stream import UiDescriptionStreamParser
 
 _LOGGER = logging.getLogger(__name__)
-_TRUSTED_HOST = "www.brink-home.com"
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_NO_LABELS: Mapping[str, str] = MappingProxyType({})
+_STREAM_CHUNK_SIZE = 16384
+_T = TypeVar("_T")
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_PROBE_TIMEOUT = 5
+_LOGIN_KEEPALIVE_TIMEOUT = 60
+_KNOWN_PARAMETER_KEYS = frozenset(PARAM_NAME_MAP.values())
+# Statuses that mean the values-only endpoint is not offered at all.
+_VALUES_UNSUPPORTED_STATUSES = frozenset({400, 404, 405, 501})
+# Statuses after which the values-only refresh is worth retrying right away.
+_VALUES_TRANSIENT_STATUSES = frozenset({401, 429})
 
 
 class _InputFieldExtractor(HTMLParser):
@@ -56,74 +115,763 @@ class BrinkAuthError(Exception):
         self.is_credentials_error = is_credentials_error
 
 
+class BrinkPayloadTooLargeError(aiohttp.ClientPayloadError):
+    """Raised when a Brink Home response exceeds the allowed body size."""
+
+
+class BrinkCircuitOpenError(aiohttp.ClientConnectionError):
+    """Raised instead of a request while the Brink cloud is considered down."""
+
+
+class ParameterIndex:
+    """Secondary lookups from API identifiers to parameter keys."""
+
+    __slots__ = ("by_component_id", "by_numeric_id", "by_value_id")
+
+    def __init__(self) -> None:
+        self.by_value_id: dict[int, str] = {}
+        self.by_numeric_id: dict[int, str] = {}
+        self.by_component_id: dict[Any, list[str]] = {}
+
+    def add(self, key: str, param: BrinkParameter) -> None:
+        """Index one extracted parameter."""
+        if param.value_id is not None:
+            self.by_value_id[param.value_id] = key
+        if param.numeric_id is not None:
+            self.by_numeric_id[param.numeric_id] = key
+        if param.component_id is not None:
+            self.by_component_id.setdefault(param.component_id, []).append(key)
+
+    def update(self, other: ParameterIndex) -> None:
+        """Merge the entries of another index into this one."""
+        self.by_value_id.update(other.by_value_id)
+        self.by_numeric_id.update(other.by_numeric_id)
+        for component_id, keys in other.by_component_id.items():
+            self.by_component_id.setdefault(component_id, []).extend(keys)
+
+
+def _as_int(value: Any) -> int | None:
+    """Return value as an int, or None when it is not numeric."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
+class _WriteBatch:
+    """Writes to one system waiting for their coalescing window to pass."""
+
+    values: dict[int, str] = field(default_factory=dict)
+    futures: list[asyncio.Future[None]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Validators and decoded result of a cacheable GET response."""
+
+    etag: str | None
+    last_modified: str | None
+    payload: Any
+
+
+async def _decode_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body."""
+    return await response.json()
+
+
+def _origin(url: str) -> tuple[str, str | None, int | None] | None:
+    """Return the scheme, host and port of a URL, or None when invalid."""
+    try:
+        parsed = urlparse(url)
+        port = parsed.port or _DEFAULT_PORTS.get(parsed.scheme)
+    except ValueError:
+        return None
+    return parsed.scheme, parsed.hostname, port
+
+
+def _raise_for_server_error(response: aiohttp.ClientResponse) -> None:
+    """Raise a ClientResponseError when the identity server failed.
+
+    A 5xx during login means an outage, not rejected credentials, so it must
+    count against the circuit breaker instead of asking for new credentials.
+    """
+    if response.status >= 500:
+        response.raise_for_status()
+
+
+def _first_int(payload: dict[str, Any], *keys: str) -> int | None:
+    """Return the first of the given payload fields that holds an int."""
+    for key in keys:
+        value = _as_int(payload.get(key))
+        if value is not None:
+            return value
+    return None
+
+
+_MetadataCatalog = dict[
+    tuple[Any, str], tuple[tuple[Any, ...], BrinkParameterMeta]
+]
+_NavigationItemCache = dict[
+    tuple[int, ...],
+    tuple[tuple[Any, ...], dict[str, BrinkParameter], ParameterIndex],
+]
+# A parameter key, or a predicate on parameter keys.
+ParameterSelector = str | Callable[[str], bool]
+
+
 class BrinkHomeCloud:
     """Interact with Brink Home through the v1.1 API."""
 
-    def __init__(self, session: aiohttp.ClientSession, username: str, password: str):
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        password: str,
+        *,
+        stream_decode: bool = False,
+        max_body_size: int = UIDESCRIPTION_MAX_BODY_SIZE,
+        http_cache: bool = False,
+        write_coalesce_window: float = WRITE_COALESCE_WINDOW,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        token_refresh_fraction: float = TOKEN_REFRESH_FRACTION,
+        base_url: str = BASE_URL,
+        labels: Mapping[str, str] = _NO_LABELS,
+    ):
         self._session = session
+        self._labels = labels
+        base_url = base_url.rstrip("/")
+        self._api_url = f"{base_url}{API_V1_PATH}"
+        self._oidc_auth_url = f"{base_url}{OIDC_AUTH_PATH}"
+        self._oidc_discovery_url = f"{base_url}{OIDC_DISCOVERY_PATH}"
+        self._oidc_token_url = f"{base_url}{OIDC_TOKEN_PATH}"
+        self._oidc_redirect_uri = f"{base_url}{OIDC_REDIRECT_PATH}"
+        self._trusted_origin = _origin(base_url)
         self._username = username
         self._password = password
         self._timeout = 20
+        self._retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+        )
+        self._probe_lock = asyncio.Lock()
+        self.metrics = ClientMetrics()
+        self._stream_decode = stream_decode
+        self._max_body_size = max_body_size
+        self._http_cache_enabled = http_cache
+        self._http_cache: dict[str, _CachedResponse] = {}
         self._access_token: str | None = None
         self._token_expiry: float = 0.0
         self._refresh_token: str | None = None
         self._token_lock = asyncio.Lock()
+        self._token_listener: Callable[[], None] | None = None
+        self._token_refresh_fraction = token_refresh_fraction
+        self._token_refresh_task: asyncio.Task[None] | None = None
+        self._login_session: aiohttp.ClientSession | None = None
+        self._login_lock = asyncio.Lock()
+        self.login_timings: dict[str, float] = {}
+        self._group_cache: dict[int, _NavigationItemCache] = {}
+        self._parameters: dict[int, dict[str, BrinkParameter]] = {}
+        self._indexes: dict[int, ParameterIndex] = {}
+        self._catalogs: dict[int, _MetadataCatalog] = {}
+        self._discovered_at: dict[int, float] = {}
+        self._consumers: dict[object, tuple[ParameterSelector, ...]] = {}
+        self._consumed_keys: frozenset[str] = frozenset()
+        self._consumer_predicates: tuple[Callable[[str], bool], ...] = ()
+        self._values_endpoint_available = True
+        # Value ids the values endpoint left out, skipped until the next
+        # scheduled discovery, and when systems whose values responses were
+        # unusable may use the endpoint again.
+        self._values_skipped: dict[int, set[int]] = {}
+        self._values_retry_at: dict[int, float] = {}
+        self._systems: list[dict[str, Any]] | None = None
+        self._systems_fetched_at = 0.0
+        self._systems_lock = asyncio.Lock()
+        self._write_coalesce_window = write_coalesce_window
+        self._write_batches: dict[int, _WriteBatch] = {}
+        self._write_locks: dict[int, asyncio.Lock] = {}
+        self._write_tasks: set[asyncio.Task[None]] = set()
 
     async def login(self) -> None:
         """Perform an OIDC login and cache the bearer token."""
-        await self._oidc_login()
+        async with self._circuit_guard():
+            await self._oidc_login()
+
+    @property
+    def has_tokens(self) -> bool:
+        """Return True when a bearer or refresh token is available."""
+        return bool(self._access_token or self._refresh_token)
+
+    def export_tokens(self) -> dict[str, Any] | None:
+        """Return the current tokens with a wall-clock expiry, for persistence."""
+        if not self.has_tokens:
+            return None
+        return {
+            "access_token": self._access_token,
+            "refresh_token": self._refresh_token,
+            "expires_at": time.time() + self._token_expiry - time.monotonic(),
+        }
+
+    def restore_tokens(self, tokens: dict[str, Any]) -> None:
+        """Restore tokens previously returned by export_tokens."""
+        remaining = float(tokens.get("expires_at", 0)) - time.time()
+        if tokens.get("access_token") and remaining > 0:
+            self._access_token = tokens["access_token"]
+            self._token_expiry = time.monotonic() + remaining
+            self._schedule_token_refresh(remaining)
+        self._refresh_token = tokens.get("refresh_token") or self._refresh_token
+
+    def set_token_listener(self, listener: Callable[[], None] | None) -> None:
+        """Set a callback invoked whenever new tokens are issued."""
+        self._token_listener = listener
 
     async def close(self) -> None:
         """Clear sensitive state."""
         self._access_token = None
         self._token_expiry = 0.0
         self._refresh_token = None
+        if self._token_refresh_task is not None:
+            self._token_refresh_task.cancel()
+            self._token_refresh_task = None
+        self._group_cache.clear()
+        self._parameters.clear()
+        self._indexes.clear()
+        self._catalogs.clear()
+        self._systems = None
+        self._http_cache.clear()
+        for task in self._write_tasks:
+            task.cancel()
+        self._write_batches.clear()
+        self._discovered_at.clear()
+        self._values_skipped.clear()
+        self._values_retry_at.clear()
+        self._token_listener = None
+        if self._login_session is not None:
+            await self._login_session.close()
+            self._login_session = None
         self._username = ""
         self._password = ""
 
-    async def get_systems(self) -> list[dict[str, Any]]:
-        """Return the systems visible to the current account."""
-        response = await self._api_request("GET", f"{API_V1_URL}systems?pageSize=5")
-        try:
-            payload = await response.json()
-        finally:
-            await response.release()
+    async def get_systems(
+        self, *, force_refresh: bool = False, max_age: float = SYSTEMS_CACHE_TTL
+    ) -> list[dict[str, Any]]:
+        """Return the systems visible to the current account.
+
+        The list is cached for max_age seconds unless it is invalidated or a
+        refresh is forced.
+        """
+        async with self._systems_lock:
+            if (
+                force_refresh
+                or self._systems is None
+                or time.monotonic() - self._systems_fetched_at > max_age
+            ):
+                async with self.metrics.measure(ENDPOINT_SYSTEMS):
+                    self._systems = await self._fetch_systems()
+                self._systems_fetched_at = time.monotonic()
+            return list(self._systems)
+
+    def seed_systems(
+        self, systems: list[dict[str, Any]], fetched_at: float | None = None
+    ) -> None:
+        """Prime the systems cache with a list fetched by another client.
+
+        fetched_at is the time.monotonic() of the fetch and defaults to now.
+        """
+        self._systems = list(systems)
+        self._systems_fetched_at = (
+            time.monotonic() if fetched_at is None else fetched_at
+        )
+
+    def invalidate_systems(self) -> None:
+        """Fetch the systems list again on the next call to get_systems."""
+        self._systems_fetched_at = 0.0
+
+    def register_consumer(self, *selectors: ParameterSelector) -> Callable[[], None]:
+        """Register the parameters a consumer reads.
+
+        Once a consumer is registered, polls extract only the parameters
+        selected by any consumer instead of the whole uidescription. The
+        first consumer, or one selecting parameters that were not extracted
+        so far, rediscovers every system on its next poll. Return a callback
+        that removes the consumer again.
+        """
+        invalidate = not self._consumers or any(
+            callable(selector) or not self._is_consumed(selector)
+            for selector in selectors
+        )
+        token = object()
+        self._consumers[token] = selectors
+        self._update_consumers()
+        if invalidate:
+            self._invalidate_extraction()
+
+        def remove_consumer() -> None:
+            if self._consumers.pop(token, None) is None:
+                return
+            self._update_consumers()
+            if not self._consumers:
+                # Without consumers everything is extracted again.
+                self._invalidate_extraction()
+
+        return remove_consumer
+
+    def _update_consumers(self) -> None:
+        """Rebuild the lookups of the consumed parameters."""
+        selectors = [
+            selector
+            for consumer in self._consumers.values()
+            for selector in consumer
+        ]
+        self._consumed_keys = frozenset(
+            selector for selector in selectors if isinstance(selector, str)
+        )
+        self._consumer_predicates = tuple(
+            selector for selector in selectors if not isinstance(selector, str)
+        )
+
+    def _invalidate_extraction(self) -> None:
+        """Rediscover every system on its next poll."""
+        self._group_cache.clear()
+        self._discovered_at.clear()
+        # Cached uidescriptions hold parameter maps pruned to the old set.
+        self._http_cache.clear()
+
+    def _is_consumed(self, key: str) -> bool:
+        """Return True when a registered consumer reads a parameter."""
+        return key in self._consumed_keys or any(
+            predicate(key) for predicate in self._consumer_predicates
+        )
+
+    @property
+    def _extraction_filter(self) -> Callable[[str], bool] | None:
+        """Return the filter of the parameters to extract, None for all."""
+        return self._is_consumed if self._consumers else None
+
+    async def _fetch_systems(self) -> list[dict[str, Any]]:
+        """Fetch every page of the systems list.
+
+        The first page reveals the total, the remaining pages are then
+        fetched concurrently.
+        """
+        first_page = await self._fetch_systems_page(1)
+        items = list(first_page.get("items", []))
+        page_count = _first_int(first_page, "pageCount", "totalPages")
+        if page_count is None:
+            total = _first_int(first_page, "totalCount", "totalItems", "total")
+            page_size = _first_int(first_page, "pageSize") or len(items)
+            if total is not None and page_size:
+                page_count = math.ceil(total / page_size)
+        if page_count is not None and page_count > 1:
+            pages = await asyncio.gather(
+                *(
+                    self._fetch_systems_page(page_number)
+                    for page_number in range(2, page_count + 1)
+                )
+            )
+            for page in pages:
+                items.extend(page.get("items", []))
 
         systems: list[dict[str, Any]] = []
-        for item in payload.get("items", []):
+        seen: set[Any] = set()
+        for item in items:
             system_id = item.get("systemShareId")
-            if system_id is None:
+            if system_id is None or system_id in seen:
                 continue
+            seen.add(system_id)
             systems.append(
                 {
                     "system_id": system_id,
                     "name": item.get("systemName") or "Brink",
                     "serial_number": item.get("serialNumber"),
-                    "gateway_state": item.get("gatewayState"),
+                    "gateway_state": _as_int(item.get("gatewayState")),
                 }
             )
         return systems
 
-    async def get_device_data(self, system_id: int) -> dict[str, dict[str, Any]]:
-        """Return a flattened parameter map for a system."""
-        response = await self._api_request(
-            "GET", f"{API_V1_URL}systems/{system_id}/uidescription"
+    async def _fetch_systems_page(self, page_number: int) -> dict[str, Any]:
+        """Fetch one page of the systems list."""
+        return await self._get_cached(
+            f"{self._api_url}systems?pageSize={SYSTEMS_PAGE_SIZE}"
+            f"&pageNumber={page_number}",
+            _decode_json,
+            endpoint=ENDPOINT_SYSTEMS,
         )
+
+    async def _get_cached(
+        self,
+        url: str,
+        decode: Callable[[aiohttp.ClientResponse], Awaitable[_T]],
+        *,
+        endpoint: str,
+        copy: Callable[[_T], _T] | None = None,
+        conditional: bool = True,
+    ) -> _T:
+        """GET a URL and decode it, revalidating the cached result if enabled.
+
+        With the HTTP cache enabled, the validators of the last response are
+        sent along and a 304 returns the previously decoded result without
+        reading the body. Without conditional the body is always fetched, and
+        the result is cached for later requests. The received body size is
+        added to the metrics of endpoint.
+        """
+        cached = (
+            self._http_cache.get(url)
+            if self._http_cache_enabled and conditional
+            else None
+        )
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self._api_request("GET", url, headers=headers)
         try:
-            payload = await response.json()
+            if response.status == 304 and cached is not None:
+                return cached.payload
+            payload = await decode(response)
+            received = response.content.total_bytes
+            self.metrics.endpoint(endpoint).bytes_received += received
+            record_system(received=received)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
         finally:
             await response.release()
 
-        parameters: dict[str, dict[str, Any]] = {}
-        self._extract_parameters(
-            (payload.get("root") or {}).get("navigationItems", []), parameters
+        if self._http_cache_enabled:
+            if etag or last_modified:
+                self._http_cache[url] = _CachedResponse(
+                    etag,
+                    last_modified,
+                    payload if copy is None else copy(payload),
+                )
+            else:
+                self._http_cache.pop(url, None)
+        return payload
+
+    async def get_device_data(
+        self,
+        system_id: int,
+        *,
+        discover: bool = False,
+        tiers: Collection[str] | None = None,
+    ) -> dict[str, BrinkParameter]:
+        """Return a flattened parameter map for a system.
+
+        The full uidescription is fetched for discovery, which happens on the
+        first call, every DISCOVERY_INTERVAL seconds and when requested. In
+        between only the values of the known parameters are refreshed, limited
+        to the given refresh tiers; the other parameters keep their previous
+        values. A requested discovery also rebuilds the cached parameter
+        metadata.
+        """
+        system_token = current_system.set(system_id)
+        try:
+            async with self.metrics.measure(ENDPOINT_DEVICE_DATA):
+                parameters = await self._get_device_data(
+                    system_id, discover, tiers
+                )
+            record_system(parameters=len(parameters))
+        finally:
+            current_system.reset(system_token)
+        return parameters
+
+    async def _get_device_data(
+        self, system_id: int, discover: bool, tiers: Collection[str] | None
+    ) -> dict[str, BrinkParameter]:
+        """Discover or refresh the parameters of a system."""
+        if discover:
+            self._group_cache.pop(system_id, None)
+            self._catalogs.pop(system_id, None)
+
+        previous = self._parameters.get(system_id)
+        discovered_at = self._discovered_at.get(system_id)
+        now = time.monotonic()
+        if (
+            discover
+            or previous is None
+            or discovered_at is None
+            or now - discovered_at > DISCOVERY_INTERVAL
+        ):
+            self._values_skipped.pop(system_id, None)
+            return await self._discover_parameters(
+                system_id, conditional=not discover
+            )
+        if (
+            not self._values_endpoint_available
+            or now < self._values_retry_at.get(system_id, 0.0)
+        ):
+            return await self._discover_parameters(system_id)
+
+        try:
+            parameters = await self._refresh_parameter_values(
+                system_id, previous, tiers
+            )
+        except aiohttp.ClientResponseError as ex:
+            if ex.status in _VALUES_UNSUPPORTED_STATUSES:
+                _LOGGER.info(
+                    "Values-only refresh unavailable (HTTP %s), using uidescription",
+                    ex.status,
+                )
+                self._values_endpoint_available = False
+            elif ex.status >= 500 or ex.status in _VALUES_TRANSIENT_STATUSES:
+                raise
+            else:
+                # Includes a 200 with another content type than JSON.
+                self._skip_values_refresh(system_id, ex)
+            parameters = None
+        except ValueError as ex:
+            self._skip_values_refresh(system_id, ex)
+            parameters = None
+
+        if parameters is None:
+            return await self._discover_parameters(system_id)
+        self._parameters[system_id] = parameters
+        return parameters
+
+    def _skip_values_refresh(self, system_id: int, err: Exception) -> None:
+        """Discover a system on every poll until the next scheduled discovery."""
+        _LOGGER.debug("Unusable parameter-values response for %s: %s", system_id, err)
+        self._values_retry_at[system_id] = time.monotonic() + DISCOVERY_INTERVAL
+
+    async def _discover_parameters(
+        self, system_id: int, *, conditional: bool = True
+    ) -> dict[str, BrinkParameter]:
+        """Fetch the full uidescription and flatten its parameters.
+
+        Without conditional the body is fetched even when it is unchanged, so
+        the parameters are rebuilt from it.
+        """
+
+        async def decode(
+            response: aiohttp.ClientResponse,
+        ) -> dict[str, BrinkParameter]:
+            content_length = response.content_length
+            if content_length is not None and content_length > self._max_body_size:
+                raise BrinkPayloadTooLargeError(
+                    f"uidescription body of {content_length} bytes exceeds "
+                    f"the {self._max_body_size} byte limit"
+                )
+            if self._stream_decode:
+                return await self._stream_parameters(system_id, response)
+            with trace_phase(PHASE_NETWORK):
+                body = await self._read_body(response)
+            with trace_phase(PHASE_DECODE):
+                payload = json.loads(body)
+            with trace_phase(PHASE_EXTRACT):
+                return self._extract_parameters_incremental(
+                    system_id, (payload.get("root") or {}).get("navigationItems", [])
+                )
+
+        # The cached map is copied both ways so optimistic entity updates
+        # never leak into it.
+        parameters = dict(
+            await self._get_cached(
+                f"{self._api_url}systems/{system_id}/uidescription",
+                decode,
+                endpoint=ENDPOINT_DEVICE_DATA,
+                copy=dict,
+                conditional=conditional,
+            )
         )
+        self._parameters[system_id] = parameters
+        self._discovered_at[system_id] = time.monotonic()
+        return parameters
+
+    async def _refresh_parameter_values(
+        self,
+        system_id: int,
+        previous: dict[str, BrinkParameter],
+        tiers: Collection[str] | None = None,
+    ) -> dict[str, BrinkParameter] | None:
+        """Refresh the values of the known parameters in the given tiers only.
+
+        Return None when the response is unusable or does not cover every
+        requested value, which may mean the parameter layout changed and
+        discovery is needed. Value ids left out are not requested again until
+        the next scheduled discovery, and after an unusable response the
+        system is discovered on every poll until then, so a misbehaving
+        endpoint never costs two requests per poll for long.
+        """
+        index = self._indexes[system_id]
+        skipped = self._values_skipped.get(system_id, ())
+        # With consumers registered previous only holds what they read.
+        refresh_all = bool(self._consumers)
+        wanted = [
+            (key, value_id)
+            for value_id, key in index.by_value_id.items()
+            if key in previous
+            and value_id not in skipped
+            and (refresh_all or key in _KNOWN_PARAMETER_KEYS)
+            and (tiers is None or previous[key].tier in tiers)
+        ]
+        if not wanted:
+            return previous
+
+        value_ids = ",".join(str(value_id) for _, value_id in wanted)
+        values = await self._get_cached(
+            f"{self._api_url}systems/{system_id}/parameter-values?valueIds={value_ids}",
+            self._decode_parameter_values,
+            endpoint=ENDPOINT_DEVICE_DATA,
+        )
+        if values is None:
+            self._skip_values_refresh(system_id, ValueError("unexpected shape"))
+            return None
+
+        missing = {value_id for _, value_id in wanted if value_id not in values}
+        if missing:
+            _LOGGER.debug(
+                "Parameter-values response for %s lacks %s value ids",
+                system_id,
+                len(missing),
+            )
+            self._values_skipped.setdefault(system_id, set()).update(missing)
+            return None
+
+        parameters = dict(previous)
+        for key, value_id in wanted:
+            item = values[value_id]
+            param = parameters[key]
+            value = item.get("value")
+            if value is not None and isinstance(param.value, str):
+                value = str(value)
+            value_state = item.get("valueState", item.get("state", param.value_state))
+            if value != param.value or value_state != param.value_state:
+                parameters[key] = param.with_value(value, value_state)
+        return parameters
+
+    def get_parameter_by_value_id(
+        self, system_id: int, value_id: int
+    ) -> BrinkParameter | None:
+        """Return the parameter of a system that owns a value id."""
+        index = self._indexes.get(system_id)
+        if index is None:
+            return None
+        key = index.by_value_id.get(value_id)
+        return None if key is None else self._parameters[system_id].get(key)
+
+    def get_parameter_by_numeric_id(
+        self, system_id: int, numeric_id: int
+    ) -> BrinkParameter | None:
+        """Return the parameter of a system with a numeric API id."""
+        index = self._indexes.get(system_id)
+        if index is None:
+            return None
+        key = index.by_numeric_id.get(numeric_id)
+        return None if key is None else self._parameters[system_id].get(key)
+
+    def get_parameters_by_component_id(
+        self, system_id: int, component_id: Any
+    ) -> dict[str, BrinkParameter]:
+        """Return the parameters of a system that belong to a component."""
+        index = self._indexes.get(system_id)
+        if index is None:
+            return {}
+        parameters = self._parameters[system_id]
+        return {
+            key: parameters[key]
+            for key in index.by_component_id.get(component_id, ())
+            if key in parameters
+        }
+
+    async def get_all_parameters(self, system_id: int) -> dict[str, BrinkParameter]:
+        """Return every parameter of a system, consumed or not.
+
+        The uidescription is streamed and extracted in full without touching
+        the caches of routine polls, so this is meant for occasional use such
+        as diagnostics. The body size limit applies as for discovery.
+        """
+        response = await self._api_request(
+            "GET", f"{self._api_url}systems/{system_id}/uidescription"
+        )
+        parameters: dict[str, BrinkParameter] = {}
+        parser = UiDescriptionStreamParser()
+
+        def extract(events: list[tuple[tuple[int, ...], dict[str, Any]]]) -> None:
+            self._extract_group_parameters(
+                [{"parameters": [param for _, param in events]}],
+                parameters,
+                labels=self._labels,
+            )
+
+        try:
+            content_length = response.content_length
+            if content_length is not None and content_length > self._max_body_size:
+                raise BrinkPayloadTooLargeError(
+                    f"uidescription body of {content_length} bytes exceeds "
+                    f"the {self._max_body_size} byte limit"
+                )
+            received = 0
+            async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                received += len(chunk)
+                if received > self._max_body_size:
+                    raise BrinkPayloadTooLargeError(
+                        "uidescription body exceeds the "
+                        f"{self._max_body_size} byte limit"
+                    )
+                extract(parser.feed(chunk))
+            extract(parser.close())
+        finally:
+            await response.release()
         return parameters
 
     async def write_parameters(
         self, system_id: int, params: list[tuple[int, str]]
     ) -> None:
-        """Write parameter values to a system."""
+        """Write parameter values to a system.
+
+        Writes to the same system arriving within the coalescing window are
+        sent as one request in which the last value for a value id wins.
+        Every caller waits for the request carrying its values.
+        """
+        if self._write_coalesce_window <= 0:
+            await self._send_parameters(system_id, params)
+            return
+
+        batch = self._write_batches.get(system_id)
+        if batch is None:
+            batch = _WriteBatch()
+            task = asyncio.create_task(self._flush_parameters(system_id, batch))
+            self._write_tasks.add(task)
+            task.add_done_callback(self._write_tasks.discard)
+            self._write_batches[system_id] = batch
+        for value_id, value in params:
+            batch.values.pop(value_id, None)
+            batch.values[value_id] = value
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        batch.futures.append(future)
+        await future
+
+    async def _flush_parameters(self, system_id: int, batch: _WriteBatch) -> None:
+        """Send a write batch once its coalescing window has passed."""
+        lock = self._write_locks.setdefault(system_id, asyncio.Lock())
+        try:
+            await asyncio.sleep(self._write_coalesce_window)
+            if self._write_batches.get(system_id) is batch:
+                del self._write_batches[system_id]
+            # Batches of one system are sent in order, never concurrently.
+            async with lock:
+                await self._send_parameters(system_id, list(batch.values.items()))
+        except asyncio.CancelledError:
+            for future in batch.futures:
+                future.cancel()
+            raise
+        except Exception as ex:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(ex)
+        else:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _send_parameters(
+        self, system_id: int, params: list[tuple[int, str]]
+    ) -> None:
+        """Send one parameter-values write request."""
         payload = {
             "writeValues": [
                 {
@@ -134,15 +882,16 @@ class BrinkHomeCloud:
                 for value_id, value in params
             ]
         }
-        response = await self._api_request(
-            "PUT",
-            f"{API_V1_URL}systems/{system_id}/parameter-values",
-            json_data=payload,
-        )
-        try:
-            await response.read()
-        finally:
-            await response.release()
+        async with self.metrics.measure(ENDPOINT_WRITE) as metrics:
+            response = await self._api_request(
+                "PUT",
+                f"{self._api_url}systems/{system_id}/parameter-values",
+                json_data=payload,
+            )
+            try:
+                metrics.bytes_received += len(await response.read())
+            finally:
+                await response.release()
 
     async def _api_request(
         self,
@@ -150,37 +899,146 @@ class BrinkHomeCloud:
         url: str,
         *,
         json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> aiohttp.ClientResponse:
+        """Perform an authenticated v1.1 API request unless the circuit is open."""
+        async with self._circuit_guard():
+            return await self._request_with_retry(
+                method, url, json_data=json_data, headers=headers
+            )
+
+    @asynccontextmanager
+    async def _circuit_guard(self) -> AsyncIterator[None]:
+        """Fail fast while the circuit is open and record request outcomes.
+
+        Connection errors, timeouts and server errors count as failures; any
+        other response proves the cloud is reachable.
+        """
+        await self._check_circuit()
+        try:
+            yield
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            self.circuit_breaker.record_failure()
+            raise
+        except aiohttp.ClientResponseError as ex:
+            if ex.status >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            raise
+        else:
+            self.circuit_breaker.record_success()
+
+    async def _check_circuit(self) -> None:
+        """Raise while the circuit is open and probe it once it is half-open."""
+        if self.circuit_breaker.state is CircuitState.CLOSED:
+            return
+
+        async with self._probe_lock:
+            state = self.circuit_breaker.state
+            if state is CircuitState.OPEN:
+                raise BrinkCircuitOpenError(
+                    "Brink Home cloud unavailable, retrying in "
+                    f"{self.circuit_breaker.retry_in:.0f}s"
+                )
+            if state is CircuitState.HALF_OPEN:
+                try:
+                    async with async_timeout.timeout(_PROBE_TIMEOUT):
+                        response = await self._session.get(self._oidc_discovery_url)
+                        status = response.status
+                        await response.release()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                    self.circuit_breaker.record_failure()
+                    raise BrinkCircuitOpenError(
+                        "Brink Home cloud probe failed"
+                    ) from ex
+                if status >= 500:
+                    self.circuit_breaker.record_failure()
+                    raise BrinkCircuitOpenError(
+                        f"Brink Home cloud probe returned HTTP {status}"
+                    )
+                self.circuit_breaker.record_success()
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> aiohttp.ClientResponse:
-        """Perform an authenticated v1.1 API request."""
-        for attempt in range(2):
-            await self._ensure_token()
-            async with async_timeout.timeout(self._timeout):
-                response = await self._session.request(
-                    method,
-                    url,
-                    json=json_data,
-                    headers={
-                        "Authorization": f"Bearer {self._access_token}",
-                        "Accept": "application/json",
-                    },
+        """Perform an authenticated v1.1 API request.
+
+        A 401 triggers one new login. Transient failures are retried according
+        to the retry policy; requests that are not idempotent are only
+        retried when the server cannot have processed them.
+        """
+        idempotent = method in _IDEMPOTENT_METHODS
+        retry_statuses = (
+            self._retry_policy.retry_statuses
+            if idempotent
+            else self._retry_policy.unsafe_retry_statuses
+        )
+        reauthenticated = False
+        attempt = 0
+        while True:
+            with trace_phase(PHASE_TOKEN):
+                await self._ensure_token()
+            try:
+                with trace_phase(PHASE_NETWORK):
+                    async with async_timeout.timeout(self._timeout):
+                        response = await self._session.request(
+                            method,
+                            url,
+                            json=json_data,
+                            headers={
+                                **(headers or {}),
+                                "Authorization": f"Bearer {self._access_token}",
+                                "Accept": "application/json",
+                            },
+                        )
+            except aiohttp.ClientConnectionError as ex:
+                retryable = idempotent or isinstance(ex, aiohttp.ClientConnectorError)
+                delay = self._retry_policy.delay(attempt) if retryable else None
+                if delay is None:
+                    raise
+                _LOGGER.debug(
+                    "%s %s failed (%s), retrying in %.2fs", method, url, ex, delay
                 )
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
 
-            if response.status == 401 and attempt == 0:
+            if response.status == 401:
                 await response.release()
+                if reauthenticated:
+                    raise BrinkAuthError("Authentication failed after retry")
+                reauthenticated = True
                 async with self._token_lock:
                     self._token_expiry = 0.0
                     self._access_token = None
                 continue
 
-            if response.status == 401:
-                await response.release()
-                raise BrinkAuthError("Authentication failed after retry")
+            if response.status in retry_statuses:
+                delay = self._retry_policy.delay(
+                    attempt, response.headers.get("Retry-After")
+                )
+                if delay is not None:
+                    await response.release()
+                    _LOGGER.debug(
+                        "%s %s returned HTTP %s, retrying in %.2fs",
+                        method,
+                        url,
+                        response.status,
+                        delay,
+                    )
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
 
             response.raise_for_status()
             return response
 
-        raise BrinkAuthError("Authentication failed before request")
-
     async def _ensure_token(self) -> None:
         """Ensure a usable bearer token is available."""
         if self._access_token and time.monotonic() < self._token_expiry:
@@ -191,7 +1049,8 @@ class BrinkHomeCloud:
                 return
             if self._refresh_token:
                 try:
-                    await self._refresh_access_token()
+                    async with self.metrics.measure(ENDPOINT_TOKEN_REFRESH):
+                        await self._refresh_access_token()
                     return
                 except BrinkAuthError:
                     _LOGGER.info(
@@ -206,16 +1065,54 @@ class BrinkHomeCloud:
         state = secrets.token_urlsafe(32)
         nonce = secrets.token_urlsafe(32)
 
-        jar = aiohttp.CookieJar(unsafe=False)
-        async with aiohttp.ClientSession(cookie_jar=jar) as oidc_session:
-            login_url, csrf_token, return_url = await self._fetch_login_page(
-                oidc_session, code_challenge, state, nonce
-            )
-            authorization_code = await self._submit_login_credentials(
-                oidc_session, login_url, csrf_token, return_url, state
-            )
+        async with self._login_lock:
+            session = self._get_login_session()
+            session.cookie_jar.clear()
+            timings: dict[str, float] = {}
+            started = phase_started = time.monotonic()
+            try:
+                async with self.metrics.measure(ENDPOINT_LOGIN_PAGE):
+                    login_url, csrf_token, return_url = await self._fetch_login_page(
+                        session, code_challenge, state, nonce
+                    )
+                now = time.monotonic()
+                timings["login_page"] = now - phase_started
+                phase_started = now
+                async with self.metrics.measure(ENDPOINT_CREDENTIALS):
+                    authorization_code = await self._submit_login_credentials(
+                        session, login_url, csrf_token, return_url, state
+                    )
+                now = time.monotonic()
+                timings["credentials"] = now - phase_started
+                phase_started = now
+            finally:
+                session.cookie_jar.clear()
+
+            async with self.metrics.measure(ENDPOINT_TOKEN_EXCHANGE):
+                await self._exchange_code_for_tokens(
+                    authorization_code, code_verifier
+                )
+            now = time.monotonic()
+            timings["token_exchange"] = now - phase_started
+            timings["total"] = now - started
+            self.login_timings = timings
+            _LOGGER.debug("OIDC login timings: %s", timings)
+
+    def _get_login_session(self) -> aiohttp.ClientSession:
+        """Return the session dedicated to the OIDC login flow.
 
-        await self._exchange_code_for_tokens(authorization_code, code_verifier)
+        It has its own cookie jar, cleared around every flow, and keeps its
+        connections to the identity server alive between the hops of a flow
+        and across consecutive logins.
+        """
+        if self._login_session is None or self._login_session.closed:
+            self._login_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    keepalive_timeout=_LOGIN_KEEPALIVE_TIMEOUT
+                ),
+                cookie_jar=aiohttp.CookieJar(unsafe=False),
+            )
+        return self._login_session
 
     async def _fetch_login_page(
         self,
@@ -226,7 +1123,7 @@ class BrinkHomeCloud:
     ) -> tuple[str, str, str | None]:
         auth_params = {
             "client_id": OIDC_CLIENT_ID,
-            "redirect_uri": OIDC_REDIRECT_URI,
+            "redirect_uri": self._oidc_redirect_uri,
             "response_type": "code",
             "scope": OIDC_SCOPE,
             "state": state,
@@ -237,10 +1134,11 @@ class BrinkHomeCloud:
 
         async with async_timeout.timeout(30):
             response = await session.get(
-                OIDC_AUTH_URL,
+                self._oidc_auth_url,
                 params=auth_params,
                 allow_redirects=True,
             )
+            _raise_for_server_error(response)
             if response.status != 200:
                 raise BrinkAuthError(
                     f"OIDC authorize failed with status {response.status}"
@@ -284,6 +1182,7 @@ class BrinkHomeCloud:
                 data=form_data,
                 allow_redirects=False,
             )
+            _raise_for_server_error(response)
             status = response.status
             location = response.headers.get("Location", "")
             body = await response.text()
@@ -315,17 +1214,18 @@ class BrinkHomeCloud:
         token_data = {
             "grant_type": "authorization_code",
             "code": authorization_code,
-            "redirect_uri": OIDC_REDIRECT_URI,
+            "redirect_uri": self._oidc_redirect_uri,
             "client_id": OIDC_CLIENT_ID,
             "code_verifier": code_verifier,
         }
 
         async with async_timeout.timeout(20):
             response = await self._session.post(
-                OIDC_TOKEN_URL,
+                self._oidc_token_url,
                 data=token_data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
             )
+            _raise_for_server_error(response)
             if response.status != 200:
                 await response.release()
                 raise BrinkAuthError(
@@ -338,10 +1238,11 @@ class BrinkHomeCloud:
         if not access_token:
             raise BrinkAuthError("OIDC token response did not contain an access token")
 
-        self._access_token = access_token
-        expires_in = int(payload.get("expires_in", 3599))
-        self._token_expiry = time.monotonic() + expires_in - 60
-        self._refresh_token = payload.get("refresh_token")
+        self._set_tokens(
+            access_token,
+            int(payload.get("expires_in", 3599)),
+            payload.get("refresh_token"),
+        )
 
     async def _refresh_access_token(self) -> None:
         """Refresh the bearer token if Brink issues refresh tokens."""
@@ -357,10 +1258,11 @@ class BrinkHomeCloud:
         try:
             async with async_timeout.timeout(20):
                 response = await self._session.post(
-                    OIDC_TOKEN_URL,
+                    self._oidc_token_url,
                     data=token_data,
                     headers={"Content-Type": "application/x-www-form-urlencoded"},
                 )
+                _raise_for_server_error(response)
                 if response.status != 200:
                     await response.release()
                     self._refresh_token = None
@@ -369,6 +1271,9 @@ class BrinkHomeCloud:
                     )
                 payload = await response.json()
                 await response.release()
+        except aiohttp.ClientResponseError:
+            # The identity server is down; the refresh token may still be good.
+            raise
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             self._refresh_token = None
             raise BrinkAuthError("Refresh token request failed") from ex
@@ -378,10 +1283,56 @@ class BrinkHomeCloud:
             self._refresh_token = None
             raise BrinkAuthError("Refresh response missing access_token")
 
+        self._set_tokens(
+            access_token,
+            int(payload.get("expires_in", 3599)),
+            payload.get("refresh_token", self._refresh_token),
+        )
+
+    def _set_tokens(
+        self, access_token: str, expires_in: int, refresh_token: str | None
+    ) -> None:
+        """Store newly issued tokens and notify the token listener."""
         self._access_token = access_token
-        expires_in = int(payload.get("expires_in", 3599))
         self._token_expiry = time.monotonic() + expires_in - 60
-        self._refresh_token = payload.get("refresh_token", self._refresh_token)
+        self._refresh_token = refresh_token
+        self._schedule_token_refresh(expires_in)
+        if self._token_listener is not None:
+            self._token_listener()
+
+    def _schedule_token_refresh(self, lifetime: float) -> None:
+        """Refresh the tokens in the background before they expire.
+
+        Requests then never wait for a refresh; if the background refresh
+        fails, _ensure_token still refreshes in-line once the token expired.
+        """
+        task = self._token_refresh_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        if self._token_refresh_fraction <= 0:
+            self._token_refresh_task = None
+            return
+        jitter = random.uniform(-TOKEN_REFRESH_JITTER, TOKEN_REFRESH_JITTER)
+        delay = lifetime * min(1.0, self._token_refresh_fraction * (1 + jitter))
+        self._token_refresh_task = asyncio.get_running_loop().create_task(
+            self._background_token_refresh(delay)
+        )
+
+    async def _background_token_refresh(self, delay: float) -> None:
+        """Wait for delay seconds, then renew the tokens."""
+        await asyncio.sleep(delay)
+        try:
+            async with self._circuit_guard(), self._token_lock:
+                if self._refresh_token:
+                    try:
+                        async with self.metrics.measure(ENDPOINT_TOKEN_REFRESH):
+                            await self._refresh_access_token()
+                        return
+                    except BrinkAuthError:
+                        _LOGGER.debug("Background token refresh rejected")
+                await self._oidc_login()
+        except (BrinkAuthError, aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            _LOGGER.debug("Background token refresh failed: %s", ex)
 
     async def _follow_redirects_for_code(
         self,
@@ -423,51 +1374,320 @@ class BrinkHomeCloud:
 
         return None
 
+    def _extract_parameters_incremental(
+        self,
+        system_id: int,
+        nav_items: list[dict[str, Any]],
+    ) -> dict[str, BrinkParameter]:
+        """Flatten parameters, reusing the previous objects of unchanged items.
+
+        The parameters of every navigation item are fingerprinted and only
+        items whose fingerprint differs from the previous poll are
+        re-materialized.
+        """
+        previous = self._group_cache.get(system_id, {})
+        current: _NavigationItemCache = {}
+        catalog = self._catalogs.setdefault(system_id, {})
+        parameters: dict[str, BrinkParameter] = {}
+        index = ParameterIndex()
+
+        for path, nav_item in self._iter_navigation_items(nav_items):
+            self._merge_navigation_item(
+                path,
+                nav_item.get("parameterGroups") or [],
+                previous,
+                current,
+                catalog,
+                parameters,
+                index,
+            )
+
+        self._group_cache[system_id] = current
+        self._indexes[system_id] = index
+        return parameters
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """Read a uidescription body, enforcing the size limit while reading.
+
+        The Content-Length check does not cover chunked responses.
+        """
+        chunks: list[bytes] = []
+        received = 0
+        async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+            received += len(chunk)
+            if received > self._max_body_size:
+                raise BrinkPayloadTooLargeError(
+                    f"uidescription body exceeds the {self._max_body_size} byte limit"
+                )
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def _stream_parameters(
+        self, system_id: int, response: aiohttp.ClientResponse
+    ) -> dict[str, BrinkParameter]:
+        """Flatten parameters while the uidescription body is being received.
+
+        Parameters arrive grouped by navigation item, so only the raw
+        parameters of one navigation item are held at a time.
+        """
+        previous = self._group_cache.get(system_id, {})
+        current: _NavigationItemCache = {}
+        catalog = self._catalogs.setdefault(system_id, {})
+        parameters: dict[str, BrinkParameter] = {}
+        index = ParameterIndex()
+        parser = UiDescriptionStreamParser()
+        pending_path: tuple[int, ...] | None = None
+        pending: list[dict[str, Any]] = []
+        received = 0
+
+        def merge(events: list[tuple[tuple[int, ...], dict[str, Any]]]) -> None:
+            nonlocal pending_path, pending
+            for path, param in events:
+                if path != pending_path:
+                    if pending_path is not None:
+                        self._merge_navigation_item(
+                            pending_path,
+                            [{"parameters": pending}],
+                            previous,
+                            current,
+                            catalog,
+                            parameters,
+                            index,
+                        )
+                    pending_path = path
+                    pending = []
+                pending.append(param)
+
+        waited = time.monotonic()
+        async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+            record_phase(PHASE_NETWORK, time.monotonic() - waited)
+            received += len(chunk)
+            if received > self._max_body_size:
+                raise BrinkPayloadTooLargeError(
+                    f"uidescription body exceeds the {self._max_body_size} byte limit"
+                )
+            with trace_phase(PHASE_DECODE):
+                events = parser.feed(chunk)
+            with trace_phase(PHASE_EXTRACT):
+                merge(events)
+            waited = time.monotonic()
+        with trace_phase(PHASE_DECODE):
+            events = parser.close()
+        with trace_phase(PHASE_EXTRACT):
+            merge(events)
+            if pending_path is not None:
+                self._merge_navigation_item(
+                    pending_path,
+                    [{"parameters": pending}],
+                    previous,
+                    current,
+                    catalog,
+                    parameters,
+                    index,
+                )
+
+        self._group_cache[system_id] = current
+        self._indexes[system_id] = index
+        return parameters
+
+    def _merge_navigation_item(
+        self,
+        path: tuple[int, ...],
+        groups: list[dict[str, Any]],
+        previous: _NavigationItemCache,
+        current: _NavigationItemCache,
+        catalog: _MetadataCatalog,
+        parameters: dict[str, BrinkParameter],
+        index: ParameterIndex,
+    ) -> None:
+        """Add one navigation item's parameters, reusing them when unchanged."""
+        fingerprint = self._fingerprint_groups(groups)
+        cached = previous.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            _, item_parameters, item_index = cached
+        else:
+            item_parameters = {}
+            self._extract_group_parameters(
+                groups,
+                item_parameters,
+                catalog,
+                self._labels,
+                self._extraction_filter,
+            )
+            item_index = ParameterIndex()
+            for key, param in item_parameters.items():
+                item_index.add(key, param)
+        current[path] = (fingerprint, item_parameters, item_index)
+        parameters.update(item_parameters)
+        index.update(item_index)
+
+    @staticmethod
+    def _fingerprint_groups(groups: list[dict[str, Any]]) -> tuple[Any, ...]:
+        """Return a fingerprint of the parameters in a navigation item.
+
+        It holds the fields themselves rather than their hash, since values
+        such as -1 and -2 hash alike, and covers the static fields too so
+        changed options or limits are picked up.
+        """
+        return tuple(
+            (
+                param.get("id"),
+                param.get("name"),
+                param.get("value"),
+                param.get("valueState"),
+                BrinkHomeCloud._fingerprint_metadata(param),
+            )
+            for group in groups
+            for param in group.get("parameters", ())
+        )
+
     @staticmethod
-    def _extract_parameters(
+    def _iter_navigation_items(
         nav_items: list[dict[str, Any]],
-        parameters: dict[str, dict[str, Any]],
+        path: tuple[int, ...] = (),
+    ) -> Iterator[tuple[tuple[int, ...], dict[str, Any]]]:
+        """Yield every navigation item with its position path, depth first."""
+        for index, nav_item in enumerate(nav_items):
+            item_path = (*path, index)
+            yield item_path, nav_item
+            yield from BrinkHomeCloud._iter_navigation_items(
+                nav_item.get("navigationItems", []), item_path
+            )
+
+    @staticmethod
+    def _extract_group_parameters(
+        groups: list[dict[str, Any]],
+        parameters: dict[str, BrinkParameter],
+        catalog: _MetadataCatalog | None = None,
+        labels: Mapping[str, str] = _NO_LABELS,
+        wanted: Callable[[str], bool] | None = None,
     ) -> None:
-        """Flatten parameters from all navigation items into one map."""
-        for nav_item in nav_items:
-            for group in nav_item.get("parameterGroups", []):
-                for param in group.get("parameters", []):
-                    raw_name = param.get("name", "")
-                    key = PARAM_NAME_MAP.get(raw_name)
-                    if key is None:
-                        numeric_id = param.get("id")
-                        if numeric_id is None:
-                            continue
-                        key = f"unknown_{numeric_id}"
-
-                    parameters[key] = {
-                        "name": TRANSLATIONS.get(raw_name, raw_name),
-                        "raw_name": raw_name,
-                        "value": param.get("value"),
-                        "value_id": param.get("valueId"),
-                        "value_state": param.get("valueState"),
-                        "read_write": param.get("readWrite"),
-                        "control_type": param.get("controlType"),
-                        "list_items": param.get("listItems"),
-                        "min_value": param.get("minValue"),
-                        "max_value": param.get("maxValue"),
-                        "unit_of_measure": (
-                            param.get("unit") or param.get("unitOfMeasure")
-                        ),
-                        "component_id": param.get("componentId"),
-                        "numeric_id": param.get("id"),
-                        "options": BrinkHomeCloud._extract_options(
-                            param.get("listItems", [])
-                        ),
-                    }
-            BrinkHomeCloud._extract_parameters(
-                nav_item.get("navigationItems", []), parameters
+        """Flatten the parameters of one navigation item's groups.
+
+        With a catalog, the static description of a parameter is reused as
+        long as its metadata fingerprint is unchanged. Names and option
+        labels are translated through labels. With wanted, parameters whose
+        key it rejects are skipped.
+        """
+        for group in groups:
+            for param in group.get("parameters", []):
+                raw_name = param.get("name", "")
+                key = PARAM_NAME_MAP.get(raw_name)
+                if key is None:
+                    numeric_id = param.get("id")
+                    if numeric_id is None:
+                        continue
+                    key = f"unknown_{numeric_id}"
+                if wanted is not None and not wanted(key):
+                    continue
+
+                if catalog is None:
+                    meta = BrinkHomeCloud._build_parameter_meta(
+                        key, raw_name, param, labels
+                    )
+                else:
+                    catalog_key = (param.get("id"), raw_name)
+                    fingerprint = BrinkHomeCloud._fingerprint_metadata(param)
+                    cached = catalog.get(catalog_key)
+                    if cached is not None and cached[0] == fingerprint:
+                        meta = cached[1]
+                    else:
+                        meta = BrinkHomeCloud._build_parameter_meta(
+                            key, raw_name, param, labels
+                        )
+                        catalog[catalog_key] = (fingerprint, meta)
+
+                parameters[key] = BrinkParameter(
+                    meta, param.get("value"), param.get("valueState")
+                )
+
+    @staticmethod
+    def _build_parameter_meta(
+        key: str,
+        raw_name: str,
+        param: dict[str, Any],
+        labels: Mapping[str, str] = _NO_LABELS,
+    ) -> BrinkParameterMeta:
+        """Build the static description of a raw API parameter."""
+        return BrinkParameterMeta(
+            key=key,
+            name=labels.get(raw_name, raw_name),
+            raw_name=raw_name,
+            value_id=_as_int(param.get("valueId")),
+            read_write=param.get("readWrite"),
+            control_type=param.get("controlType"),
+            min_value=param.get("minValue"),
+            max_value=param.get("maxValue"),
+            unit_of_measure=param.get("unit") or param.get("unitOfMeasure"),
+            component_id=param.get("componentId"),
+            numeric_id=_as_int(param.get("id")),
+            options=BrinkHomeCloud._extract_options(
+                param.get("listItems", []), labels
+            ),
+            tier=PARAMETER_TIERS.get(key, TIER_LIVE),
+        )
+
+    @staticmethod
+    def _fingerprint_metadata(param: dict[str, Any]) -> tuple[Any, ...]:
+        """Return the static fields of a raw API parameter for comparison.
+
+        The fields are kept as they are, not hashed, so that distinct values
+        with equal hashes such as -1 and -2 never match.
+        """
+        return (
+            param.get("valueId"),
+            param.get("readWrite"),
+            param.get("controlType"),
+            param.get("minValue"),
+            param.get("maxValue"),
+            param.get("unit"),
+            param.get("unitOfMeasure"),
+            param.get("componentId"),
+            tuple(
+                (
+                    item.get("value"),
+                    item.get("translationId"),
+                    item.get("displayText"),
+                    item.get("text"),
+                    item.get("isSelectable"),
+                )
+                for item in param.get("listItems") or ()
+            ),
+        )
+
+    @staticmethod
+    async def _decode_parameter_values(
+        response: aiohttp.ClientResponse,
+    ) -> dict[int, dict[str, Any]] | None:
+        """Decode a parameter-values response and index it by value id."""
+        with trace_phase(PHASE_DECODE):
+            payload = await response.json()
+        if isinstance(payload, dict):
+            payload = (
+                payload.get("values")
+                or payload.get("parameterValues")
+                or payload.get("items")
             )
+        if not isinstance(payload, list):
+            return None
+
+        values: dict[int, dict[str, Any]] = {}
+        for item in payload:
+            if not isinstance(item, dict) or item.get("valueId") is None:
+                continue
+            try:
+                values[int(item["valueId"])] = item
+            except (TypeError, ValueError):
+                continue
+        return values
 
     @staticmethod
-    def _extract_options(list_items: list[dict[str, Any]]) -> list[dict[str, str]]:
+    def _extract_options(
+        list_items: list[dict[str, Any]],
+        labels: Mapping[str, str] = _NO_LABELS,
+    ) -> tuple[BrinkOption, ...]:
         """Normalize API list items for select/fan entities."""
-        options: list[dict[str, str]] = []
+        options: list[BrinkOption] = []
         for item in list_items or []:
             if item.get("isSelectable") is False:
                 continue
@@ -481,12 +1701,9 @@ class BrinkHomeCloud:
                 or str(value)
             )
             options.append(
-                {
-                    "value": str(value),
-                    "label": TRANSLATIONS.get(label_source, label_source),
-                }
+                BrinkOption(str(value), labels.get(label_source, label_source))
             )
-        return options
+        return tuple(options)
 
     @staticmethod
     def _extract_form_fields(html: str) -> dict[str, str]:
@@ -518,14 +1735,5 @@ class BrinkHomeCloud:
         digest = hashlib.sha256(verifier.encode("ascii")).digest()
         return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
 
-    @staticmethod
-    def _is_trusted_url(url: str) -> bool:
-        try:
-            parsed = urlparse(url)
-        except ValueError:
-            return False
-        return (
-            parsed.scheme == "https"
-            and parsed.hostname == _TRUSTED_HOST
-            and parsed.port in (None, 443)
-        )
+    def _is_trusted_url(self, url: str) -> bool:
+        return _origin(url) == self._trusted_origin
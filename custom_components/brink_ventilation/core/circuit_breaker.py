@@ -0,0 +1,59 @@
+"""Circuit breaker guarding requests to the Brink Home cloud."""
+
+from __future__ import annotations
+
+import time
+from enum import StrEnum
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop sending requests after repeated failures.
+
+    The circuit opens after failure_threshold consecutive failures. Once
+    reset_timeout seconds have passed it becomes half-open, letting a probe
+    decide whether to close it again or to keep it open for another period.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.opened_at: float | None = None
+        self.last_failure_at: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        if self.opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds left until the circuit becomes half-open."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.failure_count = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit when needed."""
+        now = time.monotonic()
+        self.failure_count += 1
+        self.last_failure_at = now
+        if self.opened_at is not None or self.failure_count >= self.failure_threshold:
+            self.opened_at = now
@@ -0,0 +1,213 @@
+"""Request metrics of the Brink Home cloud client."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+ENDPOINT_SYSTEMS = "get_systems"
+ENDPOINT_DEVICE_DATA = "get_device_data"
+ENDPOINT_WRITE = "write_parameters"
+ENDPOINT_LOGIN_PAGE = "oidc_login_page"
+ENDPOINT_CREDENTIALS = "oidc_credentials"
+ENDPOINT_TOKEN_EXCHANGE = "oidc_token_exchange"
+ENDPOINT_TOKEN_REFRESH = "oidc_token_refresh"
+
+ENDPOINTS = (
+    ENDPOINT_SYSTEMS,
+    ENDPOINT_DEVICE_DATA,
+    ENDPOINT_WRITE,
+    ENDPOINT_LOGIN_PAGE,
+    ENDPOINT_CREDENTIALS,
+    ENDPOINT_TOKEN_EXCHANGE,
+    ENDPOINT_TOKEN_REFRESH,
+)
+
+PHASE_TOKEN = "token"
+PHASE_NETWORK = "network"
+PHASE_DECODE = "decode"
+PHASE_EXTRACT = "extract"
+PHASE_ENTITY_WRITES = "entity_writes"
+
+
+class EndpointMetrics:
+    """Counters and recent latencies of one endpoint.
+
+    Percentiles are computed over the last sample_size latencies, so they
+    follow the current behaviour of the cloud rather than its whole history.
+    """
+
+    __slots__ = (
+        "bytes_received",
+        "count",
+        "errors",
+        "in_flight",
+        "max_latency",
+        "_latencies",
+    )
+
+    def __init__(self, sample_size: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.bytes_received = 0
+        self.max_latency = 0.0
+        self._latencies: deque[float] = deque(maxlen=sample_size)
+
+    @property
+    def error_rate(self) -> float:
+        """Return the share of failed calls."""
+        return self.errors / self.count if self.count else 0.0
+
+    def record(self, latency: float, *, error: bool = False) -> None:
+        """Record one finished call."""
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.max_latency = max(self.max_latency, latency)
+        self._latencies.append(latency)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a latency percentile of the recent calls, nearest rank."""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a snapshot with latencies in seconds."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "in_flight": self.in_flight,
+            "bytes_received": self.bytes_received,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.max_latency if self.count else None,
+        }
+
+
+class ClientMetrics:
+    """Per-endpoint metrics of a client."""
+
+    def __init__(self, sample_size: int = 256) -> None:
+        self._sample_size = sample_size
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def endpoint(self, name: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, creating them when needed."""
+        metrics = self.endpoints.get(name)
+        if metrics is None:
+            metrics = self.endpoints[name] = EndpointMetrics(self._sample_size)
+        return metrics
+
+    @asynccontextmanager
+    async def measure(self, name: str) -> AsyncIterator[EndpointMetrics]:
+        """Count the wrapped call as in flight and record its outcome.
+
+        A cancelled call is not recorded.
+        """
+        metrics = self.endpoint(name)
+        metrics.in_flight += 1
+        started = time.monotonic()
+        try:
+            yield metrics
+        except Exception:
+            metrics.record(time.monotonic() - started, error=True)
+            raise
+        else:
+            metrics.record(time.monotonic() - started)
+        finally:
+            metrics.in_flight -= 1
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return a snapshot of every endpoint."""
+        return {name: metrics.as_dict() for name, metrics in self.endpoints.items()}
+
+
+@dataclass(slots=True)
+class RefreshTrace:
+    """Where the time of one refresh cycle went.
+
+    Phases of systems refreshed concurrently are summed, so together they
+    can exceed the duration of the cycle.
+    """
+
+    started_at: float = field(default_factory=time.time)
+    duration: float | None = None
+    error: str | None = None
+    phases: dict[str, float] = field(default_factory=dict)
+    systems: dict[int, dict[str, int]] = field(default_factory=dict)
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def system(self, system_id: int) -> dict[str, int]:
+        """Return the counters of a system."""
+        counters = self.systems.get(system_id)
+        if counters is None:
+            counters = self.systems[system_id] = {"parameters": 0, "bytes": 0}
+        return counters
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace with durations in seconds."""
+        return {
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "error": self.error,
+            "phases": dict(self.phases),
+            "systems": {
+                system_id: dict(counters)
+                for system_id, counters in self.systems.items()
+            },
+        }
+
+
+# The trace of the refresh cycle and the system the current task works on.
+current_trace: ContextVar[RefreshTrace | None] = ContextVar(
+    "brink_refresh_trace", default=None
+)
+current_system: ContextVar[int | None] = ContextVar(
+    "brink_refresh_system", default=None
+)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """Add time spent in a phase to the current trace, if any."""
+    trace = current_trace.get()
+    if trace is not None:
+        trace.add(phase, seconds)
+
+
+@contextmanager
+def trace_phase(phase: str) -> Iterator[None]:
+    """Add the time spent in the wrapped block to the current trace."""
+    if current_trace.get() is None:
+        yield
+        return
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.monotonic() - started)
+
+
+def record_system(*, parameters: int | None = None, received: int = 0) -> None:
+    """Record the parameters and bytes of the current system in the trace."""
+    trace = current_trace.get()
+    system_id = current_system.get()
+    if trace is None or system_id is None:
+        return
+    counters = trace.system(system_id)
+    counters["bytes"] += received
+    if parameters is not None:
+        counters["parameters"] = parameters
@@ -0,0 +1,151 @@
+"""Typed models for Brink Home parameters."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+from ..const import TIER_LIVE
+
+
+class BrinkOption(NamedTuple):
+    """A selectable value of a list parameter."""
+
+    value: str
+    label: str
+
+
+@dataclass(frozen=True, slots=True)
+class BrinkParameterMeta:
+    """Static description of a parameter that only changes with firmware."""
+
+    key: str
+    name: str
+    raw_name: str
+    value_id: int | None
+    read_write: Any
+    control_type: Any
+    min_value: Any
+    max_value: Any
+    unit_of_measure: str | None
+    component_id: Any
+    numeric_id: int | None
+    options: tuple[BrinkOption, ...]
+    tier: str = TIER_LIVE
+    option_labels: dict[str, str] = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index the option labels by value."""
+        labels = {option.value: option.label for option in self.options}
+        object.__setattr__(self, "option_labels", labels)
+
+
+@dataclass(frozen=True, slots=True)
+class BrinkParameter:
+    """One flattened uidescription parameter.
+
+    The static description is shared between polls; only the value and its
+    state are per poll. The numeric value and the label of the current
+    option are resolved once when the parameter is built, not on every
+    entity state read.
+    """
+
+    meta: BrinkParameterMeta
+    value: Any
+    value_state: int | None
+    native_value: int | float | str | None = field(init=False, compare=False)
+    option_label: str | None = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pre-convert the raw value."""
+        object.__setattr__(self, "native_value", _parse_number(self.value))
+        label = None
+        if self.value is not None and self.meta.option_labels:
+            label = self.meta.option_labels.get(str(self.value))
+        object.__setattr__(self, "option_label", label)
+
+    @property
+    def key(self) -> str:
+        """Return the parameter key."""
+        return self.meta.key
+
+    @property
+    def name(self) -> str:
+        """Return the translated parameter name."""
+        return self.meta.name
+
+    @property
+    def raw_name(self) -> str:
+        """Return the parameter name as reported by the API."""
+        return self.meta.raw_name
+
+    @property
+    def value_id(self) -> int | None:
+        """Return the id used to write the parameter."""
+        return self.meta.value_id
+
+    @property
+    def read_write(self) -> Any:
+        """Return the API read/write flag."""
+        return self.meta.read_write
+
+    @property
+    def control_type(self) -> Any:
+        """Return the API control type."""
+        return self.meta.control_type
+
+    @property
+    def min_value(self) -> Any:
+        """Return the lower limit of the parameter."""
+        return self.meta.min_value
+
+    @property
+    def max_value(self) -> Any:
+        """Return the upper limit of the parameter."""
+        return self.meta.max_value
+
+    @property
+    def unit_of_measure(self) -> str | None:
+        """Return the unit reported by the API."""
+        return self.meta.unit_of_measure
+
+    @property
+    def component_id(self) -> Any:
+        """Return the id of the component owning the parameter."""
+        return self.meta.component_id
+
+    @property
+    def numeric_id(self) -> int | None:
+        """Return the numeric API id of the parameter."""
+        return self.meta.numeric_id
+
+    @property
+    def options(self) -> tuple[BrinkOption, ...]:
+        """Return the selectable options, shared between polls."""
+        return self.meta.options
+
+    @property
+    def tier(self) -> str:
+        """Return how often the value of the parameter is refreshed."""
+        return self.meta.tier
+
+    def with_value(
+        self, value: Any, value_state: int | None = None
+    ) -> BrinkParameter:
+        """Return a copy carrying a new value and optionally a new state."""
+        if value_state is None:
+            value_state = self.value_state
+        return BrinkParameter(self.meta, value, value_state)
+
+
+def _parse_number(value: Any) -> int | float | str | None:
+    """Return value as an int or float when it is numeric."""
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return value
+    if number.is_integer():
+        return int(number)
+    return number
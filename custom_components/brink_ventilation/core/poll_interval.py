@@ -0,0 +1,68 @@
+"""Adaptive polling interval for the Brink Home cloud."""
+
+from __future__ import annotations
+
+import time
+from enum import StrEnum
+
+
+class PollReason(StrEnum):
+    """Why the polling interval has its current value."""
+
+    STARTUP = "startup"
+    ACTIVITY = "activity"
+    CHANGING = "changing"
+    STABLE = "stable"
+
+
+class AdaptivePollInterval:
+    """Poll fast after activity and back off while values are stable.
+
+    For activity_duration seconds after a write or a mode change the
+    interval is the floor. A poll that sees changed values returns to the
+    base interval, and each poll that sees none multiplies the interval by
+    backoff_factor, up to the ceiling.
+    """
+
+    def __init__(
+        self,
+        base: float,
+        floor: float,
+        ceiling: float,
+        *,
+        activity_duration: float = 120.0,
+        backoff_factor: float = 1.5,
+    ) -> None:
+        self.floor = floor
+        self.ceiling = max(floor, ceiling)
+        self.base = min(max(base, self.floor), self.ceiling)
+        self.activity_duration = activity_duration
+        self.backoff_factor = backoff_factor
+        self.interval = self.base
+        self.reason = PollReason.STARTUP
+        self._activity_until = 0.0
+
+    @property
+    def activity_remaining(self) -> float:
+        """Return the seconds left of fast polling after activity."""
+        return max(0.0, self._activity_until - time.monotonic())
+
+    def record_activity(self) -> float:
+        """Poll at the floor for a while and return the new interval."""
+        self._activity_until = time.monotonic() + self.activity_duration
+        self.interval = self.floor
+        self.reason = PollReason.ACTIVITY
+        return self.interval
+
+    def record_poll(self, changed: bool) -> float:
+        """Adjust the interval to the outcome of a poll and return it."""
+        if self.activity_remaining:
+            self.interval = self.floor
+            self.reason = PollReason.ACTIVITY
+        elif changed:
+            self.interval = self.base
+            self.reason = PollReason.CHANGING
+        else:
+            self.interval = min(self.interval * self.backoff_factor, self.ceiling)
+            self.reason = PollReason.STABLE
+        return self.interval
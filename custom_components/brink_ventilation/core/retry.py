@@ -0,0 +1,61 @@
+"""Retry policy for Brink Home API requests."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Describe when and how long to wait before retrying a request.
+
+    Idempotent requests are retried on any of retry_statuses and on
+    connection errors. Other requests are only retried on unsafe_retry_statuses,
+    which mean the server did not process the request, and when the
+    connection could not be established at all.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    max_retry_after: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    unsafe_retry_statuses: frozenset[int] = frozenset({429, 503})
+
+    def backoff(self, attempt: int) -> float:
+        """Return an exponential backoff delay with full jitter."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """Return the delay before the next attempt, or None to give up.
+
+        A Retry-After header takes precedence over the backoff, unless it asks
+        for a longer wait than max_retry_after.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if retry_after is None:
+            return self.backoff(attempt)
+        seconds = parse_retry_after(retry_after)
+        if seconds is None:
+            return self.backoff(attempt)
+        if seconds > self.max_retry_after:
+            return None
+        return seconds
+
+
+def parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,151 @@
+"""Incremental parser for the Brink uidescription document."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+_STRUCTURAL = re.compile(r'["{}\[\]:,]')
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+@dataclass(slots=True)
+class _Container:
+    """One open JSON object or array."""
+
+    is_object: bool
+    key: str | None
+    index: int = 0
+    current_key: str | None = None
+    expect_key: bool = True
+    expect_element: bool = True
+    holds_parameters: bool = False
+
+
+class UiDescriptionStreamParser:
+    """Emit uidescription parameters while the body is still being received.
+
+    Only the structure around the parameters is tracked; each parameter
+    object is decoded on its own, so the full document tree never exists in
+    memory. Parameters are emitted together with the index path of the
+    navigation item that contains them.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._stack: list[_Container] = []
+
+    def feed(self, data: bytes) -> list[tuple[tuple[int, ...], dict[str, Any]]]:
+        """Consume a chunk of the body and return the completed parameters."""
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(data)
+        self._pos = 0
+        return self._scan(final=False)
+
+    def close(self) -> list[tuple[tuple[int, ...], dict[str, Any]]]:
+        """Flush the remaining body and validate that the document ended."""
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(
+            b"", final=True
+        )
+        self._pos = 0
+        events = self._scan(final=True)
+        if self._stack or self._buffer[self._pos :].strip():
+            raise ValueError("Truncated uidescription document")
+        return events
+
+    def _scan(self, final: bool) -> list[tuple[tuple[int, ...], dict[str, Any]]]:
+        buffer = self._buffer
+        stack = self._stack
+        pos = self._pos
+        events: list[tuple[tuple[int, ...], dict[str, Any]]] = []
+
+        while True:
+            top = stack[-1] if stack else None
+            if top is not None and top.expect_element and top.holds_parameters:
+                pos = _WHITESPACE.match(buffer, pos).end()
+                if pos >= len(buffer):
+                    break
+                if buffer[pos] == "{":
+                    try:
+                        param, end = self._json.raw_decode(buffer, pos)
+                    except json.JSONDecodeError:
+                        if final:
+                            raise
+                        break
+                    events.append((self._navigation_path(), param))
+                    pos = end
+                top.expect_element = False
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+
+            char = match.group()
+            start = match.start()
+            if char == '"':
+                string = _STRING.match(buffer, start)
+                if string is None:
+                    pos = start
+                    break
+                if top is not None and top.is_object and top.expect_key:
+                    raw = string.group()
+                    top.current_key = json.loads(raw) if "\\" in raw else raw[1:-1]
+                    top.expect_key = False
+                pos = string.end()
+                continue
+
+            if char in "{[":
+                key = top.current_key if top is not None and top.is_object else None
+                stack.append(
+                    _Container(
+                        is_object=char == "{",
+                        key=key,
+                        holds_parameters=char == "[" and self._in_parameter_group(key),
+                    )
+                )
+            elif char in "}]":
+                if not stack:
+                    raise ValueError("Unbalanced uidescription document")
+                stack.pop()
+            elif char == "," and top is not None:
+                if top.is_object:
+                    top.expect_key = True
+                else:
+                    top.index += 1
+                    top.expect_element = True
+            pos = start + 1
+
+        self._pos = pos
+        return events
+
+    def _in_parameter_group(self, key: str | None) -> bool:
+        """Return whether an array under key holds the parameters of a group.
+
+        Only navigationItems[*].parameterGroups[*].parameters qualifies, so
+        parameters arrays elsewhere in the document are skipped.
+        """
+        stack = self._stack
+        return (
+            key == "parameters"
+            and len(stack) >= 4
+            and stack[-2].key == "parameterGroups"
+            and not stack[-2].is_object
+            and stack[-4].key == "navigationItems"
+            and not stack[-4].is_object
+        )
+
+    def _navigation_path(self) -> tuple[int, ...]:
+        """Return the index path of the navigation item being parsed."""
+        return tuple(
+            container.index
+            for container in self._stack
+            if not container.is_object and container.key == "navigationItems"
+        )
@@ -0,0 +1,67 @@
+"""Diagnostics support for Brink Home."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import aiohttp
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_CLIENT, DATA_COORDINATOR, DOMAIN
+from .core.brink_home_cloud import BrinkAuthError
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, "serial_number", "title", "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime = hass.data[DOMAIN][entry.entry_id]
+    client = runtime[DATA_CLIENT]
+    coordinator = runtime[DATA_COORDINATOR]
+    breaker = client.circuit_breaker
+
+    devices = {}
+    for system_id, device in (coordinator.data or {}).items():
+        # Polls only extract the parameters entities read; list all of them.
+        try:
+            parameters = await client.get_all_parameters(system_id)
+        except (BrinkAuthError, aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            # ValueError covers a truncated or malformed uidescription.
+            parameters = device["parameters"]
+        devices[system_id] = {
+            **{key: value for key, value in device.items() if key != "parameters"},
+            "parameter_count": len(parameters),
+            "parameters": {
+                key: {"value": param.value, "value_state": param.value_state}
+                for key, param in parameters.items()
+            },
+        }
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "update_interval_reason": (
+                coordinator.poll_interval.reason.value
+                if coordinator.poll_interval is not None
+                else None
+            ),
+            "devices": async_redact_data(devices, TO_REDACT),
+        },
+        "cycles": [trace.as_dict() for trace in coordinator.cycles],
+        "endpoints": client.metrics.as_dict(),
+        "login_timings": client.login_timings,
+        "circuit_breaker": {
+            "state": breaker.state.value,
+            "failure_count": breaker.failure_count,
+            "retry_in": breaker.retry_in,
+        },
+    }
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from typing import Any
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DEFAULT_MODEL, DEFAULT_NAME, DOMAIN
+from .core.models import BrinkParameter
 
 
 class BrinkHomeSystemEntity(CoordinatorEntity):
@@ -51,6 +54,36 @@ class BrinkHomeSystemEntity(CoordinatorEntity):
         return self.coordinator.last_update_success and self._device is not None
 
 
+class BrinkHomeAccountEntity(CoordinatorEntity):
+    """Common entity helpers for the Brink Home cloud account of an entry."""
+
+    def __init__(self, client, coordinator, entry: ConfigEntry) -> None:
+        """Initialize the Brink account entity."""
+        super().__init__(coordinator)
+        self.client = client
+        self.entry = entry
+
+    @property
+    def device_name(self) -> str:
+        """Return the account display name."""
+        return f"{DEFAULT_NAME} Home {self.entry.title}"
+
+    @property
+    def device_info(self):
+        """Return device info for the Brink Home cloud service."""
+        return {
+            "identifiers": {(DOMAIN, f"account_{self.entry.entry_id}")},
+            "name": self.device_name,
+            "manufacturer": DEFAULT_NAME,
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return entity availability, which does not depend on the cloud."""
+        return True
+
+
 class BrinkHomeDeviceEntity(BrinkHomeSystemEntity):
     """Common entity helpers for a Brink system parameter."""
 
@@ -60,7 +93,7 @@ class BrinkHomeDeviceEntity(BrinkHomeSystemEntity):
         self.parameter_key = parameter_key
 
     @property
-    def data(self) -> dict[str, Any] | None:
+    def data(self) -> BrinkParameter | None:
         """Return the current parameter payload."""
         device = self._device
         if device is None:
@@ -73,7 +106,7 @@ class BrinkHomeDeviceEntity(BrinkHomeSystemEntity):
         param = self.data
         if param is None:
             return self.parameter_key.replace("_", " ")
-        return param.get("name", self.parameter_key.replace("_", " "))
+        return param.name
 
     @property
     def available(self) -> bool:
@@ -53,19 +53,23 @@ class BrinkHomeVentilationFanEntity(BrinkHomeDeviceEntity, FanEntity):
 
     async def _async_write_level(self, level_value: str) -> None:
         ventilation = self.data
-        if ventilation is None or ventilation.get("value_id") is None:
+        if ventilation is None or ventilation.value_id is None:
             raise HomeAssistantError("Ventilation parameter is unavailable")
 
         params = []
         mode = self._device.get("parameters", {}).get(PARAM_OPERATING_MODE) if self._device else None
-        if mode and mode.get("value_id") is not None:
-            params.append((int(mode["value_id"]), MODE_MANUAL_VALUE))
-        params.append((int(ventilation["value_id"]), level_value))
+        if mode and mode.value_id is not None:
+            params.append((mode.value_id, MODE_MANUAL_VALUE))
+        params.append((ventilation.value_id, level_value))
 
         await self.client.write_parameters(self.system_id, params)
-        ventilation["value"] = level_value
+        # Parameter objects are shared with the client's extraction cache, so
+        # optimistic values replace the map entries instead of mutating them.
+        parameters = self._device["parameters"]
+        parameters[self.parameter_key] = ventilation.with_value(level_value)
         if mode is not None:
-            mode["value"] = MODE_MANUAL_VALUE
+            parameters[PARAM_OPERATING_MODE] = mode.with_value(MODE_MANUAL_VALUE)
+        self.coordinator.async_record_activity()
         self.coordinator.async_set_updated_data(dict(self.coordinator.data))
         await self.coordinator.async_request_refresh()
 
@@ -73,9 +77,9 @@ class BrinkHomeVentilationFanEntity(BrinkHomeDeviceEntity, FanEntity):
     def percentage(self):
         """Return the current speed percentage."""
         param = self.data
-        if param is None or param.get("value") is None:
+        if param is None or param.native_value is None:
             return None
-        current_value = int(param["value"])
+        current_value = int(param.native_value)
         if current_value <= 0:
             return 0
         return ranged_value_to_percentage(SPEED_RANGE, current_value)
@@ -100,9 +104,9 @@ class BrinkHomeVentilationFanEntity(BrinkHomeDeviceEntity, FanEntity):
     @property
     def is_on(self):
         param = self.data
-        if param is None or param.get("value") is None:
+        if param is None or param.native_value is None:
             return None
-        return int(param["value"]) != 0
+        return int(param.native_value) != 0
 
     async def async_turn_on(
         self,
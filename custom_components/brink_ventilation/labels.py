@@ -0,0 +1,67 @@
+"""Labels of the parameters and options reported by the Brink Home API.
+
+The API reports German names. The label files in labels/ map them to other
+languages, one compact JSON file per language.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+import re
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_LABELS
+
+_LOGGER = logging.getLogger(__name__)
+
+LABELS_DIR = Path(__file__).parent / "labels"
+DEFAULT_LANGUAGE = "en"
+
+_LANGUAGE_RE = re.compile(r"[A-Za-z]{2,3}(-[A-Za-z0-9]+)*")
+
+
+def _candidates(language: str) -> list[str]:
+    """Return the label files to try for a language, best match first."""
+    candidates = []
+    if _LANGUAGE_RE.fullmatch(language):
+        candidates.append(language)
+        candidates.append(language.partition("-")[0])
+    candidates.append(DEFAULT_LANGUAGE)
+    return list(dict.fromkeys(candidates))
+
+
+def load_labels(language: str) -> dict[str, str]:
+    """Load the labels of a language, falling back to English.
+
+    This reads from disk, so it must not run in the event loop.
+    """
+    for candidate in _candidates(language):
+        path = LABELS_DIR / f"{candidate}.json"
+        try:
+            with path.open(encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Cannot load labels from %s: %s", path, err)
+    return {}
+
+
+async def async_get_labels(hass: HomeAssistant) -> dict[str, str]:
+    """Return the labels of the configured language.
+
+    The file is read once in the executor and shared by all config entries.
+    """
+    language = hass.config.language
+    loading: dict[str, asyncio.Future[dict[str, str]]] = hass.data.setdefault(
+        DATA_LABELS, {}
+    )
+    if (future := loading.get(language)) is None:
+        future = loading[language] = hass.async_add_executor_job(
+            load_labels, language
+        )
+    return await asyncio.shield(future)
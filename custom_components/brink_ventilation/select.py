@@ -47,14 +47,15 @@ class BrinkHomeSelectEntity(BrinkHomeDeviceEntity, SelectEntity):
 
     async def _async_write_value(self, value: str) -> None:
         param = self.data
-        if param is None or param.get("value_id") is None:
+        if param is None or param.value_id is None:
             raise HomeAssistantError(f"{self.parameter_name} parameter is unavailable")
 
         await self.client.write_parameters(
             self.system_id,
-            [(int(param["value_id"]), value)],
+            [(param.value_id, value)],
         )
-        param["value"] = value
+        self._device["parameters"][self.parameter_key] = param.with_value(value)
+        self.coordinator.async_record_activity()
         self.coordinator.async_set_updated_data(dict(self.coordinator.data))
         await self.coordinator.async_request_refresh()
 
@@ -80,30 +81,27 @@ class BrinkHomeModeSelectEntity(BrinkHomeSelectEntity):
             raise HomeAssistantError("Operating mode parameter is unavailable")
 
         selected = next(
-            (item for item in param.get("options", []) if item["label"] == option),
+            (item for item in param.options if item.label == option),
             None,
         )
         if selected is None:
             raise HomeAssistantError(f"Unknown operating mode option: {option}")
 
-        await self._async_write_value(selected["value"])
+        await self._async_write_value(selected.value)
 
     @property
     def current_option(self) -> str | None:
         param = self.data
         if param is None:
             return None
-        for option in param.get("options", []):
-            if option["value"] == str(param.get("value")):
-                return option["label"]
-        return None
+        return param.option_label
 
     @property
     def options(self) -> list[str]:
         param = self.data
         if param is None:
             return []
-        return [item["label"] for item in param.get("options", [])]
+        return [item.label for item in param.options]
 
 
 class BrinkHomeBypassOperationSelectEntity(BrinkHomeSelectEntity):
@@ -132,7 +130,7 @@ class BrinkHomeBypassOperationSelectEntity(BrinkHomeSelectEntity):
         param = self.data
         if param is None:
             return None
-        return BYPASS_OPERATION_LABELS.get(str(param.get("value")))
+        return BYPASS_OPERATION_LABELS.get(str(param.value))
 
     @property
     def options(self) -> list[str]:
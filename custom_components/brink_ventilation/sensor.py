@@ -40,7 +40,9 @@ from .const import (
     PARAM_SUPPLY_TEMP,
     PARAM_SUPPLY_AIR_FLOW,
 )
-from .entity import BrinkHomeDeviceEntity
+from .core.circuit_breaker import CircuitState
+from .core.metrics import ENDPOINTS
+from .entity import BrinkHomeAccountEntity, BrinkHomeDeviceEntity
 
 
 @dataclass(frozen=True)
@@ -194,7 +196,7 @@ def _should_create_sensor(device: dict, description: BrinkSensorDescription) ->
     if required_value_state is None:
         return True
 
-    return param.get("value_state") == required_value_state
+    return param.value_state == required_value_state
 
 
 async def async_setup_entry(
@@ -210,6 +212,13 @@ async def async_setup_entry(
         for description in SENSOR_DESCRIPTIONS
         if _should_create_sensor(device, description)
     ]
+    entities.append(BrinkCloudCircuitSensor(client, coordinator, entry))
+    if coordinator.poll_interval is not None:
+        entities.append(BrinkPollIntervalSensor(client, coordinator, entry))
+    entities.extend(
+        BrinkCloudEndpointSensor(client, coordinator, entry, endpoint)
+        for endpoint in ENDPOINTS
+    )
     async_add_entities(entities)
 
 
@@ -244,7 +253,7 @@ class BrinkHomeSensorEntity(BrinkHomeDeviceEntity, SensorEntity):
         param = self.data
         if param is None:
             return None
-        return [item["label"] for item in param.get("options", [])]
+        return [item.label for item in param.options]
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -256,7 +265,7 @@ class BrinkHomeSensorEntity(BrinkHomeDeviceEntity, SensorEntity):
         if param is None:
             return False
 
-        return param.get("value_state") == enabled_value_state
+        return param.value_state == enabled_value_state
 
     @property
     def native_value(self):
@@ -264,7 +273,7 @@ class BrinkHomeSensorEntity(BrinkHomeDeviceEntity, SensorEntity):
         if param is None:
             return None
 
-        value = param.get("value")
+        value = param.value
         if value is None:
             return None
 
@@ -272,18 +281,163 @@ class BrinkHomeSensorEntity(BrinkHomeDeviceEntity, SensorEntity):
             value_map = self.entity_description.value_map
             if value_map is not None:
                 return value_map.get(str(value), str(value))
+            return param.option_label or str(value)
 
-            selected = next(
-                (item["label"] for item in param.get("options", []) if item["value"] == str(value)),
-                None,
-            )
-            return selected or str(value)
+        return param.native_value
 
-        try:
-            number = float(value)
-        except (TypeError, ValueError):
-            return value
 
-        if number.is_integer():
-            return int(number)
-        return number
+class BrinkCloudCircuitSensor(BrinkHomeAccountEntity, SensorEntity):
+    """Diagnostic sensor exposing the Brink cloud circuit breaker state."""
+
+    @property
+    def unique_id(self):
+        return f"{DOMAIN}_{self.entry.entry_id}_circuit_breaker"
+
+    @property
+    def name(self):
+        return f"{self.device_name} Circuit Breaker"
+
+    @property
+    def icon(self):
+        return "mdi:cloud-alert"
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.ENUM
+
+    @property
+    def entity_category(self):
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def options(self) -> list[str]:
+        return [state.value for state in CircuitState]
+
+    @property
+    def native_value(self):
+        return self.client.circuit_breaker.state.value
+
+    @property
+    def extra_state_attributes(self):
+        breaker = self.client.circuit_breaker
+        return {
+            "failure_count": breaker.failure_count,
+            "retry_in": round(breaker.retry_in),
+        }
+
+
+class BrinkPollIntervalSensor(BrinkHomeAccountEntity, SensorEntity):
+    """Diagnostic sensor exposing the adaptive polling interval and its reason."""
+
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset(
+        {"reason", "activity_remaining", "min_interval", "max_interval"}
+    )
+
+    @property
+    def unique_id(self):
+        return f"{DOMAIN}_{self.entry.entry_id}_poll_interval"
+
+    @property
+    def name(self):
+        return f"{self.device_name} Polling Interval"
+
+    @property
+    def icon(self):
+        return "mdi:update"
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.DURATION
+
+    @property
+    def native_unit_of_measurement(self):
+        return UnitOfTime.SECONDS
+
+    @property
+    def entity_category(self):
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def native_value(self):
+        return round(self.coordinator.poll_interval.interval, 1)
+
+    @property
+    def extra_state_attributes(self):
+        poll_interval = self.coordinator.poll_interval
+        return {
+            "reason": poll_interval.reason.value,
+            "activity_remaining": round(poll_interval.activity_remaining),
+            "min_interval": poll_interval.floor,
+            "max_interval": poll_interval.ceiling,
+        }
+
+
+class BrinkCloudEndpointSensor(BrinkHomeAccountEntity, SensorEntity):
+    """Diagnostic sensor exposing the latency and errors of one cloud endpoint."""
+
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset(
+        {
+            "count",
+            "errors",
+            "error_rate",
+            "in_flight",
+            "bytes_received",
+            "p50_ms",
+            "max_ms",
+        }
+    )
+
+    def __init__(self, client, coordinator, entry: ConfigEntry, endpoint: str):
+        """Initialize the endpoint sensor."""
+        super().__init__(client, coordinator, entry)
+        self.endpoint = endpoint
+
+    @property
+    def unique_id(self):
+        return f"{DOMAIN}_{self.entry.entry_id}_{self.endpoint}_latency"
+
+    @property
+    def name(self):
+        label = self.endpoint.replace("_", " ").capitalize().replace("Oidc", "OIDC")
+        return f"{self.device_name} {label} Latency"
+
+    @property
+    def icon(self):
+        return "mdi:timer-outline"
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.DURATION
+
+    @property
+    def state_class(self):
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def native_unit_of_measurement(self):
+        return UnitOfTime.MILLISECONDS
+
+    @property
+    def entity_category(self):
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def native_value(self):
+        p95 = self.client.metrics.endpoint(self.endpoint).percentile(95)
+        return None if p95 is None else round(p95 * 1000, 1)
+
+    @property
+    def extra_state_attributes(self):
+        metrics = self.client.metrics.endpoint(self.endpoint)
+        p50 = metrics.percentile(50)
+        return {
+            "count": metrics.count,
+            "errors": metrics.errors,
+            "error_rate": round(metrics.error_rate, 3),
+            "in_flight": metrics.in_flight,
+            "bytes_received": metrics.bytes_received,
+            "p50_ms": None if p50 is None else round(p50 * 1000, 1),
+            "max_ms": round(metrics.max_latency * 1000, 1),
+        }
@@ -0,0 +1,109 @@
+"""Persistence and handoff of Brink Home OIDC tokens."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import time
+from typing import Any
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_LOGIN_HANDOFF, DOMAIN, SYSTEMS_CACHE_TTL
+from .core.brink_home_cloud import BrinkHomeCloud
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.{{}}.tokens"
+SAVE_DELAY = 10
+KEY_ITERATIONS = 100_000
+
+
+def _derive_key(password: str, entry_id: str) -> bytes:
+    """Derive the Fernet key of an entry from its password."""
+    digest = hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), entry_id.encode(), KEY_ITERATIONS
+    )
+    return base64.urlsafe_b64encode(digest)
+
+
+class BrinkTokenStore:
+    """Persist the tokens of a config entry, encrypted with its password.
+
+    A changed password makes the stored tokens unreadable, which simply
+    leads to a fresh login.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the token store."""
+        self._hass = hass
+        self._entry = entry
+        self._store: Store[dict[str, str]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY.format(entry.entry_id), private=True
+        )
+        self._fernet: Fernet | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the stored tokens, or None when there are none usable."""
+        self._fernet = Fernet(
+            await self._hass.async_add_executor_job(
+                _derive_key, self._entry.data[CONF_PASSWORD], self._entry.entry_id
+            )
+        )
+        data = await self._store.async_load()
+        if not data or "tokens" not in data:
+            return None
+        try:
+            return json.loads(self._fernet.decrypt(data["tokens"].encode()))
+        except (InvalidToken, ValueError):
+            _LOGGER.debug("Stored Brink tokens could not be decrypted, ignoring them")
+            return None
+
+    @callback
+    def async_delay_save(self, tokens: dict[str, Any] | None) -> None:
+        """Schedule saving the tokens; async_load must have been called."""
+        if tokens is None or self._fernet is None:
+            return
+        encrypted = self._fernet.encrypt(json.dumps(tokens).encode()).decode()
+        self._store.async_delay_save(lambda: {"tokens": encrypted}, SAVE_DELAY)
+
+
+async def async_remove_tokens(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored tokens of a config entry."""
+    await Store(
+        hass, STORAGE_VERSION, STORAGE_KEY.format(entry.entry_id), private=True
+    ).async_remove()
+
+
+@callback
+def async_store_login_handoff(
+    hass: HomeAssistant,
+    unique_id: str,
+    client: BrinkHomeCloud,
+    systems: list[dict[str, Any]],
+) -> None:
+    """Keep the tokens and systems of a validated login for setup to reuse."""
+    hass.data.setdefault(DATA_LOGIN_HANDOFF, {})[unique_id] = {
+        "tokens": client.export_tokens(),
+        "systems": systems,
+        "fetched_at": time.monotonic(),
+    }
+
+
+@callback
+def async_pop_login_handoff(
+    hass: HomeAssistant, unique_id: str | None
+) -> dict[str, Any] | None:
+    """Return and forget the login handed off by the config flow, if recent."""
+    handoff = hass.data.get(DATA_LOGIN_HANDOFF, {}).pop(unique_id, None)
+    if handoff is None or time.monotonic() - handoff["fetched_at"] > SYSTEMS_CACHE_TTL:
+        return None
+    return handoff
@@ -1,2279 +0,0 @@
-TRANSLATIONS = {
-   "Id":"en",
-   "Drucksensor Zuluftventilator defekt":"Pressure sensor supply fan defective",
-   "Drucksensor Abluftventilator defekt":"Pressure sensor extract fan defective",
-   "Bypass defekt":"Bypass defective",
-   "Abluftventilator defekt":"Air exhaust fan defective",
-   "Zuluftventilator defekt":"Air supply fan defective",
-   "Au\u00DFentemperaturf\u00FChler defekt":"Temperature sensor outdoor defective",
-   "Ablufttemperaturf\u00FChler defekt":"Sensor air exhaust temperature defective",
-   "Temperaturf\u00FChler externe Temperatur defekt":"Temperature sensor external temperature defective",
-   "CO2-Sensor":"CO2 sensor",
-   "RH-Sensor defekt":"RH sensor defective",
-   "Vorheizregister":"Preheater",
-   "Stufenschalter":"Multiple switch",
-   "Kein Nullpunkt gefunden (Bereichsventilmotor dreht unaufh\u00F6rlich)":"None zero found (zone valve actuator is running continuously)",
-   "Blockierung des Ventilmotors":"Blockage of the valve motor",
-   "Eeprom defekt":"Eeprom defective",
-   "Selbsttest nicht in Ordnung":"Self test not okay",
-   "Flash-Speicher defekt":"Flash memory defective",
-   "EEPROM-Speicher defekt":"EEPROM memory defective",
-   "Gew\u00FCnschter Zuluftdurchsatz wird nicht erreicht":"Supply flow is not reached",
-   "Gew\u00FCnschter Abluftdurchsatz wird nicht erreicht":"Exhaust flow is not reached",
-   "Frichlufttemperatur zu hoch":"Outside temperature is to high",
-   "Sensor NTC1 defekt":"Sensor NTC1 defective",
-   "RHT-Sensor 1 defekt":"RHT-Sensor 1 defective",
-   "Stufenschalter defekt":"Controler defective",
-   "Vorheizregister defekt":"Pre heater defective",
-   "Externes Nachheizregister defekt":"External post heater defective",
-   "Relaisausgang 1 defekt":"Relais output 1 defective",
-   "Fehler touchscreen":"Error touchscreen",
-   "Fehler eBus":"Error eBus",
-   "Fehler BrinkBus":"Error BrinkBus",
-   "Fehler interner ModBus":"Error internal ModBus",
-   "Fehler externer ModBus":"Error external ModBus",
-   "Fehler USB-Anschluss":"Error USB connection",
-   "L\u00FCftungsstufe":"Ventilation mode",
-   "Stufe 0":"Level 0",
-   "Stufe 1":"Level 1",
-   "Stufe 2":"Level 2",
-   "Stufe 3":"Level 3",
-   "Betriebsart":"Operating mode",
-   "Automatikbetrieb":"Automatic mode",
-   "Handbetrieb":"Manual",
-   "Urlaubbetrieb":"Holiday mode",
-   "Partybetrieb":"Party mode",
-   "Nachtl\u00FCftungsbetrieb":"Night ventilation mode",
-   "Restlaufzeit Betriebsartfunktion":"Remaining duration user mode function",
-   "Min.":"Min.",
-   "Position Stufenschalter":"Position multiple switch",
-   "Position Perilex-Schalter":"Position Perilex switch",
-   "Soll-Wert Luftdurchsatz Zuluft":"Setpoint value air flowrate air supply",
-   "m\u00B3/h":"m\u00B3/h",
-   "Ist-Wert Luftdurchsatz Zuluft":"Actual value air flowrate air supply",
-   "Drehzahl Zuluftventilator":"RPM supply fan",
-   "U/min":"RPM",
-   "Zuluftdruck":"Supply air pressure",
-   "Pa":"Pa",
-   "PWM Zuluftventilator":"PWM supply fan",
-   "%":"%",
-   "Soll-Wert Luftdurchsatz Abluft":"Setpoint value air flowrate air exhaust",
-   "Ist-Wert Luftdurchsatz Abluft":"Actual value air flowrate air exhaust",
-   "Drehzahl Abluftventilator":"RPM extract fan",
-   "Abluftdruck":"Air exhaust pressure",
-   "PWM Abluftventilator":"PWM extract fan",
-   "Ablufttemperatur":"Air extract temperature",
-   "\u00B0C":"\u00B0C",
-   "Frischlufttemperatur":"Temperature fresh air",
-   "Status Feuchtesensor":"Status humidity sensor",
-   "Error":"Fault",
-   "Not initialized":"Not initialized",
-   "Sensor not active":"Sensor not active",
-   "Powerup delay":"Powerup delay",
-   "Standby":"Standby",
-   "Boost rising":"Boost rising",
-   "Boost stable":"Boost stable",
-   "Boost descending":"Boost descending",
-   "Boost low level stable":"Boost low level stable",
-   "Relative Feuchte":"Relative humidity",
-   "Status Frostschutzregelung":"Status frost safety control",
-   "Initializing":"Initialising",
-   "No_frost":"No frost",
-   "Waiting":"Waiting",
-   "Heater":"Heater",
-   "Fan_control":"Fan control",
-   "Sky_150_heater":"Sky 150 heater",
-   "Fan-control_fan_off":"Fan-control-fan off",
-   "Fan-control_fan_restart":"Fan-control-fan restart",
-   "Fan-control_curve_1":"Fan-control curve 1",
-   "fan-control_curve_2":"fan-control curve 2",
-   "Fan-control_curve_3":"Fan-control curve 3",
-   "Fan-control_curve_4":"Fan-control curve 4",
-   "Status Vorheizregister":"Status preheater",
-   "Inactive":"Inactive",
-   "Active":"Active",
-   "Test_mode":"Test mode",
-   "Leistung Vorheizregister":"Preheater power",
-   "Status Nachtheizregister":"Status postheater",
-   "Leistung Nachheizregister":"Postheater power",
-   "Status Erdw\u00E4rmetauscher":"Status geothermal heat exchanger",
-   "Open_low":"Open low",
-   "Closed":"Closed",
-   "Open_high":"Open high",
-   "Zus\u00E4tzlicheTemperatursensor":"Extra temperature sensor",
-   "Position Schalteingang CN1":"Selection input 1",
-   "closed":"closed",
-   "Open":"Open",
-   "Position Schalteingang CN2":"Selection input 2",
-   "Status Bypassklappe":"Status bypass valve",
-   "Initialisierung":"Initialisation",
-   "\u00D6ffnet":"Opens",
-   "Schlie\u00DFt":"closed",
-   "Ge\u00F6ffnet":"Open",
-   "Geschlossen":"Closed",
-   "Status Ventilator":"Status fan",
-   "Constant_flow":"Constant flow",
-   "Constant_rpm":"Constant rpm",
-   "Off":"Off",
-   "Status Filtermeldung":"Status filter message",
-   "Not dirty":"No active filter message",
-   "Dirty":"Filter needs attention",
-   "Status eBus CO2-sensor 1":"Status eBus CO2 sensor 1",
-   "Idle":"Idle",
-   "Warming up":"Warming up",
-   "Running":"Running",
-   "Calibrating":"Calibrating",
-   "Self test":"Self test",
-   "PPM eBus CO2-sensor 1":"PPM eBus CO2 sensor 1",
-   "PPM":"PPM",
-   "Status eBus CO2-sensor 2":"Status eBus CO2 sensor 2",
-   "PPM eBus CO2-sensor 2":"PPM eBus CO2 sensor 2",
-   "Status eBus CO2-sensor 3":"Status eBus CO2 sensor 3",
-   "PPM eBus CO2-sensor 3":"PPM eBus CO2 sensor 3",
-   "Status eBus CO2-sensor 4":"Status eBus CO2 sensor 4",
-   "PPM eBus CO2-sensor 4":"PPM eBus CO2 sensor 4",
-   "Wert Dipswitch-Schalter":"DIP switch value",
-   "Gesamtzahl der Betriebsstunden":"Total operating hours",
-   "h":"h",
-   "Gesamtzahl des Luftvolumenstroms":"Total flowrate",
-   "m\u00B3":"m\u00B3",
-   "Anzahl der Tage bis zur Filtermelding":"Number of days since filter reset",
-   "Luftvolumenstroms bis zur Filtermeldung":"Airflow until filter message",
-   "Anzahl der Tage seit Filterreset":"Number of days since filter reset",
-   "Anzahl der Tage seit Filterreset_":"Number of days since filter reset",
-   "Luftdurchsatz seit Filterreset":"Air volume since filter reset",
-   "Max. Volumenstrom Filtermeldung":"Max. flow rate until filter message",
-   "Offset Zuluftventilator intern":"Offset air supply fan internal",
-   "Offset Abluftventilator intern":"Offset air exhaust fan internal",
-   "Luftdurchsatz Stufe 0":"Ventilation mode - 0",
-   "Luftdurchsatz Stufe 1":"Ventilation mode - 1",
-   "Luftdurchsatz Stufe 2":"Ventilation mode - 2",
-   "Luftdurchsatz Stufe 3":"Ventilation mode - 3",
-   "Bypass-Temperatur":"Bypass temperature",
-   "Bypass-Hysterese":"Hysteresis bypass",
-   "Funktion der Bypass Klappe":"Operation bypass valve",
-   "Automatische_Funktion":"Auto mode",
-   "Bypass-Klappe_geschlossen":"Bypass closed",
-   "Bypass-Klappe_ge\u00F6ffnet":"Bypass open",
-   "ZH \u002B WRG":"Central heating \u002B heat recovery",
-   "Aus":"Off",
-   "Ein":"On",
-   "Druckungleichgewicht zul\u00E4ssig":"Imbalance permitted",
-   "Luftdurchsatz_Zu-/Abluft_gleich":"Balanced flow",
-   "Druckungleichgewicht_zul\u00E4ssig":"Allow pressure difference",
-   "Festes Druckungleichgewicht":"Fixed imbalance",
-   "Vorheizregister angeschlossen":"Preheater connected",
-   "Typ Heizregister":"Type heater",
-   "Kein_Heizregister":"No heater",
-   "Nachheizregister":"Postheater",
-   "Temperatur Nachheizregister":"Temperature postheater",
-   "V1 Auswahl Eingang":"V1 selection input",
-   "Schlie\u00DFerkontakt":"Normaly open contact",
-   "0_-_10_V_Eingang":"0 - 10 V Input",
-   "\u00D6ffnerkontakt":"NC contact (normally closed)",
-   "Schaltausgang_1_(Bypass_ge\u00F6ffnet_12_V,_Bypass_geschlossen_0_V)":"Switch output 1 (Bypass open 12 V, Bypass closed 0 V)",
-   "Schaltausgang_1_(Bypass_ge\u00F6ffnet_0_V,_Bypass_geschlossen_12_V)":"Switch output  1 (Bypass open 0 V, Bypass closed 12 V)",
-   "Zone_overrule_switch_input":"Zone overrule switch input",
-   "V1 Mindestspannung Eingang":"V1 min. voltage input",
-   "V":"V",
-   "V1 H\u00F6chstspannung Eingang":"V1 max. voltage input",
-   "CN1 Bedingungen Schalteingang":"CN1 conditions switch input",
-   "Ein,_sofern_Bedingungen_Bypass_ge\u00F6ffnet_erf\u00FCllt":"On, if Bypass conditions are met ",
-   "Bypass-Ansteuerung":"Bypass control",
-   "Schlafzimmerklappe":"Bedroom valve",
-   "CN1 Modus Zuluftventilator Schalteingang":"CN1 mode supply fan switch input",
-   "Zuluftventilator_aus":"Supply fan off",
-   "Absoluter_Mind.durchsatz_50_m\u00B3/h":"Min. ventilation 50 m\u00B3/h",
-   "Luftdurchsatz_Stufe_1":"Air flow Level 1",
-   "Luftdurchsatz_Stufe_2":"Air flow Level 2",
-   "Luftdurchsatz_Stufe_3":"Air flow Level 3",
-   "Max._Luftdurchsatz":"Max. air flow",
-   "Keine_Ansteuerung_Zuluftventilator":"No control supply fan",
-   "CN1 Modus Abluftventilator Schalteingang":"CN1 mode extract fan switch input",
-   "Abluftventilator_aus":"Extract fan off",
-   "Keine_Ansteuerung_Abluftventilator":"No control extract fan",
-   "V2 Auswahl Eingang":"V2 selection input",
-   "V2 Mindestspannung Eingang":"V2 min. voltage input",
-   "V2 H\u00F6chstspannung Eingang":"V2 max. voltage input",
-   "CN2 Bedingungen Schalteingang":"CN2 conditions switch input",
-   "CN2 Modus Zuluftventilator Schalteingang":"CN2 mode supply fan switch input",
-   "CN2 Modus Abluftventilator Schalteingang":"CN2 mode extract fan switch input",
-   "Erdw\u00E4rmetauscher":"Geothermal heat exchanger",
-   "Ventilsteuerung_Erdw\u00E4rmetauscher_Aus":"Valve control geothermal heat exchanger off",
-   "Ventilsteuerung_Erdw\u00E4rmetauscher_Ein":"Valve control geothermal heat exchanger on",
-   "Erdw\u00E4rmetauscher Mindesttemperatur":"Geothermal heat exchanger minimum temperature",
-   "Erdw\u00E4rmetauscher H\u00F6chsttemperatur":"Geothermal heat exchanger maximum temperature",
-   "RH Sensor":"RH sensor",
-   "RH Sensor Empfindlichkeit":"RH sensor sensitivity",
-   "Status eBus CO2-Sensor":"Status eBus CO2 sensor",
-   "eBus CO2-Sensor 1 - min. ppm":"eBus CO2 sensor 1 - min. ppm",
-   "eBus CO2-Sensor 1 - max. ppm":"eBus CO2 sensor 1 - max. ppm",
-   "eBus CO2-Sensor 2 - min. ppm":"eBus CO2 sensor 2 - min. ppm",
-   "eBus CO2-Sensor 2 - max. ppm":"eBus CO2 sensor 2 - max. ppm",
-   "eBus CO2-Sensor 3 - min. ppm":"eBus CO2 sensor 3 - min. ppm",
-   "eBus CO2-Sensor 3 - max. ppm":"eBus CO2 sensor 3 - max. ppm",
-   "eBus CO2-Sensor 4 - min. ppm":"eBus CO2 sensor 4 - min. ppm",
-   "eBus CO2-Sensor 4 - max. ppm":"eBus CO2 sensor 4 - max. ppm",
-   "Offset Luftvolumenstrom":"Offset air volume flow",
-   "Position Stufenschalter - Stufe 1":"Position speed controler - Speed 1",
-   "Druckdifferenz sensor Zuluftventilator":"Pressure drop sensor supply fan",
-   "Druckdifferenz sensor Abluftventilator":"Pressure drop sensor extract fan",
-   "Not Initialized":"Not Initialized",
-   "Power_up_delay":"Power up delay",
-   "No_frost_delay":"No frost delay",
-   "Frost_control_start_delay":"Frost control start delay",
-   "Wait_for_icing":"Wait for icing",
-   "Ice_detected_delay":"Ice detected delay",
-   "Heating":"Heating",
-   "Wait_for_free_heater":"Wait for free heater",
-   "Fan-control_start_delay":"Fan-control start delay",
-   "Fan-control_wait":"Fan-control wait",
-   "Fan-control":"Fan-control",
-   "fan-off_delay":"fan-off delay",
-   "Fan-off":"Fan-off",
-   "Fan-restarting":"Fan-restarting",
-   "Periodic_coil_test":"Periodic coil test",
-   "Auto":"Auto",
-   "Lock_current":"Lock current",
-   "Lock_maximum":"Lock maximum",
-   "MassBalance":"Mass balance",
-   "Aktive Regelung":"Control status active",
-   "Bootloader":"Bootloader",
-   "Nicht_blockierender_Fehler":"Non-locking fault",
-   "Blockierungsfehler":"Blocking error",
-   "Manuell":"Manual",
-   "Urlaub":"Holiday",
-   "Nachtl\u00FCftung":"Night ventilation mode",
-   "Party":"Party",
-   "Bypass_Boost":"Bypass Boost",
-   "Normaler_Boost":"Normal Boost",
-   "Auto_CO2":"Auto CO2",
-   "Auto_eBus":"Auto eBus",
-   "Auto_Modbus":"Auto Modbus",
-   "Auto_LAN/WLAN_Portal":"Auto LAN/WLAN Portal",
-   "Auto_LAN/WLAN_Local":"Auto LAN/WLAN Local",
-   "Luftdurchsatz bis zur Filtermeldung":"Flow since last filter message",
-   "Gesamtzahl des Luftdurchsatz":"Total amount of flow",
-   "Zulufttemperatur":"Supply temperature",
-   "Zuluftfeuchtigkeit":"Supply humidity",
-   "Fortlufttemperatur":"Exhaust temperature",
-   "Fortluftfeuchtigkeit":"Exhaust humidity",
-   "Signalausgabe":"Signal representation",
-   "0V":"0V",
-   "24V":"24V",
-   "Relaisausgang 1":"Relais output 1",
-   "Relaisausgang 2":"Relais output 2",
-   "Analoge Eingabe 1":"Analog input 1",
-   "Analoge Eingabe 2":"Analog input 2",
-   "Analoge Ausgabe 1":"Analog output 1",
-   "Analoge Ausgabe 2":"analog output 2",
-   "Ventilator Frostreduzierung":"Frost: disbalance mode fan",
-   "Ger\u00E4tetyp":"Device type",
-   "Temperatur Feuchtesensor":"Temerature humidity sensor",
-   "Bypass Temperatur":"Bypass temperature \u0022from dwelling\u0022",
-   "Bypass Hysterese":"Bypass hysterese",
-   "Temperatur Heizregister":"Temperature heater",
-   "Ungleichgewicht der Zuluft":"Disbalance supply flow",
-   "Ungleichgewicht der Abluft":"Disbalance exhaust flow",
-   "Modus Bypass boost":"Bypass boost mode",
-   "Voreingestellte Luftvolumenstrom Bypass Boost":"Pre-set flow bypass boost",
-   "Frosttemperatur":"Frost temperature",
-   "Anzahl Tage bis zur Filtermeldung":"Amount of days up to filter message",
-   "Typ Luftvolumenstrom":"Type of flow",
-   "Konstante_PWM":"Constant PWM",
-   "Konstante_Luftvolumenstrom":"Constant flow",
-   "PWM Zuluft modus 0":"PWM supply speed 0",
-   "PWM Abluft modus 0":"PWM exhaust speed 0",
-   "PWM Zuluft modus 1":"PWM supply speed 1",
-   "PWM Abluft modus 1":"PWM exhaust speed 1",
-   "PWM Zuluft modus 2":"PWM supply speed 2",
-   "PWM Abluft modus 2":"PWM exhaust speed 2",
-   "PWM Zuluft modus 3":"PWM supply speed 3",
-   "PWM Abluft modus 3":"PWM exhaust speed 3",
-   "Modus Signalausgabe":"Signal representation mode",
-   "Soll-Wert Luftdurchsatz":"Setpoint value air flowrate",
-   "Ist-Wert Luftdurchsatz":"Actual value air flowrate",
-   "Drehzahl Ventilator":"RPM fan",
-   "PWM Ventilator":"PWM fan",
-   "Fan_off":"Fan off",
-   "Status CO2-sensor":"Status CO2 sensor",
-   "PPM CO2-sensor":"PPM CO2 sensor",
-   "Luftdurchsatz Stufe 4":"Ventilation mode - 4",
-   "Luftdurchsatz Stufe 5":"Ventilation mode - 5",
-   "CO2-Sensor - min. ppm":"CO2 sensor - min. ppm",
-   "CO2-Sensor - max. ppm":"CO2 sensor - max. ppm",
-   "Status Zeitprogramm":"Status time programme",
-   "Deactivated":"Deactivated",
-   "Manual":"Manual",
-   "Clock program":"Clock program",
-   "Demand Control Clock":"Demand Control Clock",
-   "Demand Control CO2":"Demand Control CO2",
-   "Eingestellten Zeitprogramm":"Present clock program",
-   "P1:_Woche":"P1: Week",
-   "P2:_Woche_/_Wochenende":"P2: Week / Weekend",
-   "P3:_Tag":"P3: Day",
-   "Aktiven Periode":"Active period",
-   "Startzeit Periode in Stunden":"Start time period in hours",
-   "Startzeit Periode in Minuten":"Start time period in minutes",
-   "m":"m",
-   "Startzeit n\u00E4chste Periode in Stunden":"Start time next period in hours",
-   "Startzeit n\u00E4chste Periode in Minuten":"Start time next period in minutes",
-   "Zeitende vor\u00FCbergehenden Betrieb in Stunden":"End temporary use in hours",
-   "Zeitende vor\u00FCbergehenden Betrieb in Minuten":"End temporary use in minutes",
-   "Eingestellte L\u00FCftungsstufe dieser Periode":"Present ventilation mode this period",
-   "Eingestellte L\u00FCftungsbereich dieser Periode":"Present zone this period",
-   "Wohn-/Schlafbereich":"Living /bedroom section",
-   "Wohnbereich":"Living section",
-   "Schlafbereich":"Sleep zone",
-   "Aktuelle L\u00FCftungsstufe":"Current ventilation mode",
-   "Aktuelle L\u00FCftungsbereich":"Current ventilation zone",
-   "Art der L\u00FCftung":"Ventilation type",
-   "Standard":"Standard",
-   "Bedarfl\u00FCftung Zeit":"Demand ventilation time",
-   "Bedarfl\u00FCftung CO2":"Demand ventilation CO2",
-   "eBus Gruppennummer":"eBus group number",
-   "Sprache":"Language",
-   "Englisch":"English",
-   "Niederl\u00E4ndisch":"Dutch",
-   "Deutsch":"German",
-   "Franz\u00F6sisch":"French",
-   "Italienisch":"Italian",
-   "Polnisch":"Polish",
-   "Spanisch":"Spanish",
-   "Hintergrundbeleuchtung":"Backlighting",
-   "Tastensperre":"Keys lock",
-   "ID CO2-Sensor":"ID CO2 sensor",
-   "Status CO2-Sensor":"Status CO2 sensor",
-   "Error_CO2-Sensor":"Error CO2-Sensor",
-   "Selftest":"Selftest",
-   "PPM Wert CO2-Sensor":"PPM value CO2 sensor",
-   "eBus Slave-Nummer":"eBus slave number",
-   "Heartbeat timeout":"Heartbeat timeout",
-   "PPM Schaltpunkt 1":"PPM switch point  1",
-   "PPM Schaltpunkt 2":"PPM switch point  2",
-   "Ort der CO2-Sensor":"Location of the CO2 sensor",
-   "Nicht definiert":"Not defined",
-   "ID Klappe":"ID valve",
-   "Position der Klappe":"Valve position",
-   "Unknown":"Unknown",
-   "Traveling":"Positioning",
-   "Position_0":"Position 0",
-   "Position_1":"Position 1",
-   "Position_2":"Position 2",
-   "Position_3":"Position 3",
-   "Status Klappe":"Status valve",
-   "Not_calibrated":"Not calibrated",
-   "In_position":"In position",
-   "End Position der Klappe":"Valve end position",
-   "Position der Klappe in Schritten":"Valve position in steps",
-   "Drehrichtung der Klappe":"Valve rotation direction",
-   "Clockwise":"Clockwise",
-   "Counter_clockwise":"Counter clockwise",
-   "Konfiguration g\u00FCltig?":"Configuration valid?",
-   "Nein":"No",
-   "Ja":"Yes",
-   "Minuten":"Minutes",
-   "Position L\u00FCftungsbereich 1":"Position zone 1",
-   "Position L\u00FCftungsbereich 2":"Position zone 2",
-   "Position Save":"Position Save",
-   "Erwartete Endstand der Klappe":"Expected valve end position",
-   "Kalibrierungstoleranz":"Calibration tolerance",
-   "Positionierungstoleranz":"Positioning tolerance",
-   "Maximale Luftvolumenstrom der Bedarfl\u00FCftung CO2":"Maximun airflow demand control CO2",
-   "Endstand der klappe":"Valve end position",
-   "\u00B0":"\u00B0",
-   "Zahl der m\u00F6gliche Klappepositionen":"Number of possible valve positions",
-   "Winkel  der Klappeposition 0":"Angular valve position  0",
-   "Winkel  der Klappeposition 1":"Angular valve position  1",
-   "Winkel  der Klappeposition 2":"Angular valve position  2",
-   "Winkel  der Klappeposition 3":"Angular valve position  3",
-   "Winkel  der Klappeposition 4":"Angular valve position  4",
-   "Winkel  der Klappeposition 5":"Angular valve position  5",
-   "Winkel  der Klappeposition 6":"Angular valve position  6",
-   "Winkel  der Klappeposition 7":"Angular valve position  7",
-   "Winkel  der Klappeposition 8":"Angular valve position  8",
-   "Winkel  der Klappeposition 9":"Angular valve position  9",
-   "WLAN Signal":"WLAN signal",
-   "mW":"mW",
-   "Anlagenname":"System name",
-   "Seriennummer":"Serial number",
-   "Softwareversion":"Software version",
-   "Hardwareversion":"Hardware version",
-   "LAN MAC Adresse":"LAN MAC address",
-   "WLAN MAC Adresse":"WLAN MAC address",
-   "role.expert":"Expert",
-   "role.oem":"Brink",
-   "role.cloud-admin":"Admin",
-   "timeSeriesReceiverPeriods.None":"None",
-   "timeSeriesReceiverPeriods.1Month":"1 Month",
-   "timeSeriesReceiverPeriods.2Month":"2 Months",
-   "timeSeriesReceiverPeriods.3Month":"3 Months",
-   "role.enduser":"User",
-   "manual":"Instruction manual",
-   "forgotPasswordMailIntro":"Please click the following link to change your password.",
-   "forgotPasswordMailButtonText":"Change password",
-   "mailLinkFallback":"If the button does not function, please copy the following URL into the address list of your browser:",
-   "forgotPasswordMailValidTime":"The link is valid for {{0}} days. Thereafter the link is no longer valid",
-   "mailFooter":"This is an automatically sent email. Please do not respond; the address only set up for sending. ",
-   "forgotUsernameMailIntro":"You have requested your user name. Your user name is:{{0}}",
-   "confirmMailHeader":"Please confirm your email address",
-   "confirmMailWelcome":"Thank you for registering in the Brink Web Portal. Activate the link specified below to confirm your registration.",
-   "confirmMailButtonText":"Confirm registration",
-   "confirmMailValidTime":"The confirmation link is valid for {{0}} days. Thereafter the registration expires.",
-   "admin.updateUserReceivingSystemShareQuota.mailbody":"The systems for which you were granted remote access was adjusted. If you have any questions, please contact the Sopra sales staff in your area.",
-   "sendTimeSeriesesAsCsv.mailbody":"Enclosed you will find the historical data",
-   "admin.updateUserSystemQuota.mailbody":"Your set of systems has been adjusted. If you have any questions, please contact the Sopra sales staff in your area.",
-   "systemDeletedInfo.bodyMessageToOwnerDeletedByAdmin":"Your installation \u0027{{0}}\u0027 has been removed by the administrator.",
-   "systemDeletedInfo.bodyMessageToOwnerDeletedHisOwn":"Your installation \u0027{{0}}\u0027 has been successfully removed.",
-   "systemDeletedInfo.bodyMessageToSharedUserDeletedByAdminSystemDelete":"The installation \u0027{{0}}\u0027 has been removed by Brink",
-   "systemDeletedInfo.bodyMessageToSharedUserDeletedByAdmin":"Your remote access rights for installation \u0027{{0}}\u0027 have been removed by its owner. You can\u0027t access this installation any more.",
-   "systemDeletedInfo.bodyMessageToSharedUserDeletedByOwner":"The installation \u0027{{0}}\u0027 has been removed by the owner",
-   "systemDeletedInfo.bodyMessageToSharedUserDeletedHisOwn":"The remote access for the installation \u0027{{0}}\u0027 has been removed",
-   "admin.updateUserRole.mailbody":"Your user rights have been changed by the administrator.",
-   "softwareVersion":"Software version",
-   "softwareLabel":"Software label",
-   "deviceTypeTitle":"Device type",
-   "controllerCode":"Controller code",
-   "busaddress":"Busadress",
-   "controllerType":"Controller type",
-   "L\u00FCftungsstufe_oldAddress":"Ventilation level",
-   "Stufe_5":"Level 5",
-   "metaGroupId":"Properties",
-   "paramGroupRead":"Readings",
-   "paramGroupWrite":"Readings and Settings",
-   "alertList.levelHeader":"Level",
-   "alertList.componentHeader":"Device",
-   "alertList.codeHeader":"Code",
-   "alertList.codeTextHeader":"Text",
-   "alertList.incomingHeader":"Incoming",
-   "alertList.outgoingHeader":"Outgoing",
-   "alertList.confirmedAtHeader":"Confirmed",
-   "alertList.isArchived":"Archived",
-   "alertList.codeDescriptionHeader":"Description",
-   "paramGroupId":"parameters",
-   "Excellent 180":"Excellent 180",
-   "Renovent Elan":"Renovent Elan",
-   "Excellent 300":"Excellent 300",
-   "Excellent 400":"Excellent 400",
-   "Excellent 450":"Excellent 450",
-   "Flair 325":"Flair 325",
-   "Flair 400":"Flair 400",
-   "Sky 150":"Sky 150",
-   "Sky 200":"Sky 200",
-   "Sky 300":"Sky 300",
-   "Air_70":"Air 70",
-   "Air Control":"Air Control",
-   "Bedarfl\u00FCftung":"Demand controlled ventilation",
-   "Home Modul":"Home Modul",
-   "networkGroupId":"Network",
-   "alexaRangePresetLow":"Low",
-   "alexaRangePresetMedium":"Medium",
-   "alexaRangePresetHigh":"High",
-   "alexaRangePresetAbsence":"Absence",
-   "alexaRangePresetBoost":"Boost",
-   "serialNumber":"Serial Number",
-   "alexaPartyMode":"Party",
-   "alexaNightMode":"Night ventilation",
-   "alexaHolidayMode":"Holiday",
-   "%ComponentName":"%ComponentName",
-   "alexaVentilation":"Ventilation",
-   "alexaVentilationLevel":"Level",
-   "alexaVentilationMode":"Mode",
-   "alexaAutomaticMode":"Automatic",
-   "alexaAutoMode":"Auto",
-   "alexaBrinkClimateSystems":"Brink Climate Systems BV",
-   "Device data":"Device data",
-   "Flowrate":"Flowrate",
-   "Bypass":"Bypass",
-   "Frost protection":"Frost protection",
-   "Filter message":"Filter message",
-   "Humidity sensor":"Humidity sensor",
-   "CO2 sensor":"CO2 sensor",
-   "Fan settings":"Fan settings",
-   "Plus feature":"Plus feature",
-   "Central heating \u002B heat recovery":"Central heating \u002B heat recovery",
-   "Signal output":"Signal output",
-   "Default fan setting":"Default fan setting",
-   "Status Bypassklappe_":"Status bypass valve",
-   "Status Vorheizregister_":"Status preheater",
-   "Status Filtermeldung_":"Status filter message",
-   "Anzahl der Tage bis zur Filtermelding_":"Number of days until filter message",
-   "Relative Feuchte_":"Relative humidity",
-   "PPM eBus CO2-sensor 1_":"PPM eBus CO2 sensor 1",
-   "PPM eBus CO2-sensor 2_":"PPM eBus CO2 sensor 2",
-   "PPM eBus CO2-sensor 3_":"PPM eBus CO2 sensor 3",
-   "PPM eBus CO2-sensor 4_":"PPM eBus CO2 sensor 4",
-   "alertLevelInfoActive":"Info",
-   "alertLevelInfoResolved":"Info",
-   "alertLevelWarningActive":"Warning",
-   "alertLevelWarningResolved":"Warning",
-   "alertLevelErrorActive":"Error",
-   "alertLevelErrorResolved":"Error",
-   "filterItem.noFilter":"---",
-   "alertLevelNoError":"No error",
-   "alertLevelSolved":"Solved",
-   "alertLevelActive":"Active",
-   "alertLevelBlocking":"Blocking",
-   "eBus error":"eBus error",
-   "Brinkbus error":"Brinkbus error",
-   "internal modbus error":"Internal modbus error",
-   "external modbus error":"External modbus error",
-   "USB error":"USB error",
-   "LAN error":"LAN error",
-   "WiFi error":"WiFi error",
-   "Signal output error":"Signal output error",
-   "eBus accessoire power overloaded":"eBus accessoire power overloaded",
-   "BrinkBus accessoire power overloaded":"BrinkBus accessoire power overloaded",
-   "USB output overloaded":"USB output overloaded",
-   "Switch output error (external)":"Switch output error (external)",
-   "Analog output error (external)":"Analog output error (external)",
-   "Switch input error (external)":"Switch input error (external)",
-   "Analog input error (external)":"Analog input error (external)",
-   "Temperature/Input error (external)":"Temperature/Input error (external)",
-   "Flash memory failed":"Flash memory failed",
-   "UI Error":"UI Error",
-   "external CO2 sensor error":"External CO2 sensor error",
-   "external Preheater error":"External Preheater error",
-   "extarnal postheater error":"Extarnal postheater error",
-   "Selftest failed":"Selftest failed",
-   "External post heater":"External postheater",
-   "Externes Vorheizregister":"External preheater",
-   "Temperatur Externes Nachheizregister":"Temperature External postheater",
-   "Status Feuchtereglung":"Status Humidity-control",
-   "Status RH Sensor":"Status RH Sensor",
-   "Externes Nachheizregister":"External postheater",
-   "DHCP Aktiv":"DHCP Active",
-   "An":"On",
-   "IP Adresse":"IP address",
-   "Subnetzmaske":"Subnet mask",
-   "Default Gateway":"Default Gateway",
-   "DNS Namensserver":"DNS",
-   "WLAN Aktiv":"WLAN active",
-   "Freigabe Internetverbindung":"Internet Connection Release",
-   "userDeleted.mailbody":"Your account has been deleted",
-   "userDeleted.mailtitle":"Your account has been deleted",
-   "Flair 300":"Flair 300",
-   "errorList.mailtitle":"Error list",
-   "gatewayConnectionMailSubject":"System status",
-   "newShareInfo.mailHeader":"Release received",
-   "errorList.systemname":"System name",
-   "errorList.status":"State",
-   "errorList.device":"Device",
-   "errorList.code":"Code",
-   "errorList.text":"Text",
-   "errorList.location":"Location",
-   "errorList.incoming.error":"Incoming error message",
-   "errorList.outcoming.error":"Outgoing error message",
-   "Fan off":"Fan off",
-   "Fan runs at absolute minimum":"Fan runs at absolute minimum",
-   "Fan at setting 1":"Fan at setting 1",
-   "Fan at setting 2":"Fan at setting 2",
-   "Fan at setting 3":"Fan at setting 3",
-   "Fan at step 0":"Fan at step 0",
-   "Fan according to multiple switch":"Fan according to multiple switch",
-   "Fan runs at absolute maximum":"Fan runs at absolute maximum",
-   "No supply fan control":"No supply fan control",
-   "No exhaust fan control":"No exhaust fan control",
-   "Cascade settings":"Appliance setting",
-   "Not found":"Not found",
-   "Lesitung externes Vorheizregister":"External preheater power",
-   "Leistung externes Nachheitzregister":"External preheater power",
-   "Imbalance":"Imbalance",
-   "Bypass temperatur from outside":"Bypass temperature \u201Cfrom outside\u201D",
-   "Minimum intake temperature":"Minimum intake temperature",
-   "Status externes Vorheitzregister":"State External preheater",
-   "Type of Bus connection":"Type of Bus connection",
-   "Slave address":"Slave address",
-   "Baudrate":"Baudrate",
-   "Parity":"Parity",
-   "Mode input 1":"Mode input 1",
-   "Mode input 2":"Mode input 2",
-   "Make or break contact 1":"Make or break contact 1",
-   "Make or break contact 2":"Make or break contact 2",
-   "Contact 1 supply fan action":"Contact 1 supply fan action",
-   "Contact 1 Exhaust fan action":"Contact 1 Exhaust fan action",
-   "Contact 2 supply fan action":"Contact 2 supply fan action",
-   "Contact 2 Exhaust fan action":"Contact 2 Exhaust fan action",
-   "Switching on and off":"Switching on and off",
-   "Switch temp 1":"Switch temp 1",
-   "Switch temp 2":"Switch temp 2",
-   "Mode valve 24v control":"Mode valve 24v control",
-   "Valve control":"Valve control",
-   "Even":"Even",
-   "Odd":"Odd",
-   "Nur Filter":"Only filtercondition",
-   "St\u00F6rbedingung":"Only faultcondition",
-   "Filter-und St\u00F6rbedingung":"Filter and fault condition",
-   "Switch off appliance":"Switch off appliance",
-   "abort":"Close",
-   "access_forbidden":"Access forbidden",
-   "accessLevelContractorRead":"Contractor read",
-   "accessLevelContractorReadWrite":"Contractor write",
-   "accessLevelExpertRead":"Read specialist",
-   "accessLevelExpertReadWrite":"Write specialist",
-   "accessLevelManufacturerRead":"Manufacturer read",
-   "accessLevelManufacturerReadWrite":"Manufacturer write",
-   "accessLevelUserPlusRead":"User plus read",
-   "accessLevelUserPlusReadWrite":"User plus write",
-   "accessLevelUserRead":"Read user",
-   "accessLevelUserReadWrite":"Write user",
-   "actions":"Actions",
-   "add":"Add",
-   "admin.gatewayAccesscodes.dialogAdd.codeAlreadyExists":"The code already exists",
-   "admin.gatewayAccesscodes.dialogDelete.codeDoesntExists":"The code doesn\u0027t exists",
-   "admin.updateUserReceivingSystemShareQuota.mailsubject":"Sopra set of releases",
-   "admin.updateUserReceivingSystemShareQuota.quotaBelowCountError":"The contingent is lower than the current number of releases. Please delete some releases first.",
-   "admin.updateUserRole.mailsubject":"Brink Home user role",
-   "admin.updateUserSystemQuota.mailsubject":"Sopra set of systems",
-   "admin.updateUserSystemQuota.quotaBelowCountError":"The set is lower than the current number of systems. Please delete some systems first.",
-   "admin.userlist.button.refresh":"Refresh",
-   "admin.userlist.deleteButton":"Delete user",
-   "admin.userlist.detailsButton.receivingSystemShareQuota":"Details of available releases",
-   "admin.userlist.detailsButton.systemQuota":"Details of available systems",
-   "admin.userlist.editButton.receivingSystemShareQuota":"Change available clearance",
-   "admin.userlist.editButton.roles":"Edit role",
-   "admin.userlist.editButton.systemQuota":"Change available clearance",
-   "admin.userlist.header.companyName":"Company name",
-   "admin.userlist.header.customerNumber":"Customer number",
-   "admin.userlist.header.dateCreated":"Date created",
-   "admin.userlist.header.email":"E-mail",
-   "admin.userlist.header.id":"ID",
-   "admin.userlist.header.name":"Name",
-   "admin.userlist.header.receivedSystemShareQuota":"Ktg. Frg.",
-   "admin.userlist.header.roles":"Roles",
-   "admin.userlist.header.systemQuota":"Ktg.",
-   "admin.userNotApproved":"There user has to finish the registration before the changes can be made",
-   "admin_code_list_accessLevel":"Right",
-   "admin_code_list_actions":"Actions",
-   "admin_code_list_btn_add_code":"Add",
-   "admin_code_list_btn_delete":"Delete",
-   "admin_code_list_btn_import_codes":"Import",
-   "admin_code_list_btn_refresh":"Refresh",
-   "admin_code_list_code":"Code",
-   "admin_code_list_createdOn":"Created on",
-   "admin_code_list_dialog_add_accesslevel":"Access level",
-   "admin_code_list_dialog_add_accesslevel_required":"Choose an access level",
-   "admin_code_list_dialog_add_btn_add":"Import",
-   "admin_code_list_dialog_add_btn_close":"Abort",
-   "admin_code_list_dialog_add_code":"Code",
-   "admin_code_list_dialog_add_code_required":"Code required",
-   "admin_code_list_dialog_add_title":"Add code",
-   "admin_code_list_dialog_import_btn_add":"Import",
-   "admin_code_list_dialog_import_btn_close":"Abort",
-   "admin_code_list_dialog_import_duplicateaccesscodes_text":"These codes already exist. All other codes where accepted",
-   "admin_code_list_dialog_import_text":"Please select the file with the codes",
-   "admin_code_list_dialog_import_title":"Upload codes",
-   "admin_code_list_no_data":"There are no release codes in the system. Please add new release codes.",
-   "admin_code_list_serialnumber":"admin code list serial number",
-   "admin_dashboard_description":"Description",
-   "admin_dashboard_value":"Value",
-   "admin_dialog_delete_btn_no":"Abort",
-   "admin_dialog_delete_btn_yes":"Delete",
-   "admin_gateway_fw_updates":"Gateway update",
-   "admin_gateway_logs":"Server log",
-   "admin_gateway_shares":"Manage access rights",
-   "admin_shared_list_access_level":"Access level",
-   "admin_shared_list_username":"Username",
-   "admin_system_delete_dialog_title":"Are you sure, you want to delete this installation?",
-   "admin_system_dialog_accessCode":"Release code",
-   "admin_system_dialog_connectCountert":"Users",
-   "admin_system_dialog_createOn":"Created on",
-   "admin_system_dialog_disconnectsLast24Hour":"Disconnects last 24 hours",
-   "admin_system_dialog_gatewayType":"Gateway type",
-   "admin_system_dialog_hardwareVersion":"Hardware version",
-   "admin_system_dialog_remoteEndpoint":"IP address",
-   "admin_system_dialog_standort":"Location",
-   "admin_system_dialog_swversion":"Software version",
-   "admin_system_list_filter_gateway_id":"ID",
-   "admin_system_list_filter_name":"System name",
-   "admin_system_list_filter_reset_button":"Reset filter",
-   "admin_system_list_filter_save_button":"Save filter",
-   "admin_system_list_filter_serial":"Serial number",
-   "admin_system_list_filter_system_online":"System status",
-   "admin_system_list_filter_systems_email":"Owner",
-   "admin_system_list_header_actions":"Actions",
-   "admin_system_list_header_disconnects":"Disconnects last 24 hours",
-   "admin_system_list_header_gateway_id":"ID",
-   "admin_system_list_header_name":"System name",
-   "admin_system_list_header_serial":"Serial number",
-   "admin_system_list_header_systems_connect":"Last connected",
-   "admin_system_list_header_systems_email":"Owner",
-   "admin_user_list_filter_mail":"E-mail",
-   "admin_user_list_filter_state":"User state",
-   "admin_user_list_filter_user_id":"ID",
-   "Aktionen":"Actions",
-   "alertConfirmTimedOut":"Error while acknowledging the fault message",
-   "alertCreateReceiverDestinationAlreadyExist":"A notification is already set-up for this address!",
-   "app_datasecurity":"Privacy statement",
-   "app_imprint":"Legal notice",
-   "app_termsofuse":"Terms of use",
-   "applicationtype_bootloader":"Bootloader",
-   "changePasswordOldNewMustBeDifferent":"The old and new password must be different.",
-   "changePasswordOldPasswordIsWrong":"The current password is incorrect",
-   "chart_loading":"Loading data from the server\u2026",
-   "chart_no_data_for_zoom_available":"No data is available for the selected zoom level.",
-   "chart_range_selector_zoom":"Zoom",
-   "checkPasswordPattern":"The password must contain at least one number, one upper-case letter and lower-case letters, as well as a special character",
-   "confirmUserAlreadyConfirmed":"Registration has already been completed. The confirmation link is no longer valid!",
-   "confirmUserInvalidLink":"The confirmation link is invalid!",
-   "connectNewSystemGatewayMustBeReconnected":"Please connect the system to the cloud again to add it!",
-   "connectNewSystemHasAlreadyShare":"The system is already shared with your account",
-   "connectNewSystemInvaldSerialnumber":"A device with this serial number can\u0027t be found. Please check the internet connection of your device.",
-   "connectNewSystemInvalidAccessCode":"The release code you used is invalid. Please try again.",
-   "connectNewSystemInvalidCredentials":"The serial number or the device password is not valid. Please check your input and try again. Also make sure that your device is connected to the internet.",
-   "connectNewSystemInvalidPassword":"The installation password is incorrect Please try again.",
-   "connectNewSystemOneSelfAlreadyConnected":"You are already connected to the installation.",
-   "connectNewSystemOtherAlreadyConnected":"Another user is already connected to the system. If you want to access this installation, the owner must set up an account for you.",
-   "connectNewSystemQuotaLimitReached":"You have reached the maximum set.",
-   "countryNameAT":"Austria",
-   "countryNameBE":"Belgium",
-   "countryNameCH":"Switzerland",
-   "countryNameCN":"China",
-   "countryNameCZ":"Czech Republic",
-   "countryNameDE":"Germany",
-   "countryNameDK":"Denmark",
-   "countryNameEE":"Estonia",
-   "countryNameES":"Spain",
-   "countryNameFR":"France",
-   "countryNameGB":"United Kingdom",
-   "countryNameGR":"Greece",
-   "countryNameHR":"Croatia",
-   "countryNameHU":"Hungary",
-   "countryNameIE":"Ireland",
-   "countryNameIT":"Italy",
-   "countryNameLI":"Liechtenstein",
-   "countryNameLT":"Lithuania",
-   "countryNameLU":"Luxembourg",
-   "countryNameLV":"Latvia",
-   "countryNameNL":"Netherlands",
-   "countryNamePL":"Poland",
-   "countryNameRO":"Romania",
-   "countryNameRU":"Russia",
-   "countryNameSK":"Slovakia",
-   "countryNameTR":"Turkey",
-   "createSystemShareCantShareOneSelf":"Remote access cannot be created for your own installation.",
-   "createSystemShareReceivedUserQuotaLimitReached":"Maximum use of recipient\u0027s access releases.",
-   "createSystemShareUserAcountNotConfirmed":"The user\u0027s account has not yet been activated.",
-   "createSystemShareUserAlreadyExist":"A remote access already exists for this user.",
-   "createSystemShareUserDoesntExist":"The user does not exist.",
-   "createUserInvalidMail":"The email address is invalid. Please check the entry.",
-   "createUserInvalidUsername":"The user name is invalid. Please enter a different name.",
-   "createUserMailAlreadyInUse":"A user with this email address already exists. Please enter a different email address.",
-   "createUserNameAlreadyInUse":"The user name already exists. Please enter a different name.",
-   "csvDownloadNotAllowedForRole":"This function can be used in the more extended packages.",
-   "cultureInfoName_cs-CZ":"\u010Cesky",
-   "cultureInfoName_da-DK":"Danish",
-   "cultureInfoName_de-AT":"German (Austria)",
-   "cultureInfoName_de-CH":"German (Switzerland)",
-   "cultureInfoName_de-DE":"Deutsch (Deutschland)",
-   "cultureInfoName_de-LI":"Germany (Liechtenstein)",
-   "cultureInfoName_de-LU":"Germany (Luxembourg)",
-   "cultureInfoName_el_GR":"Greek",
-   "cultureInfoName_en-GB":"English (United Kingdom)",
-   "cultureInfoName_es-ES":"Espa\u00F1ol (Espa\u00F1a)",
-   "cultureInfoName_et-EE":"Estonian",
-   "cultureInfoName_fr-BE":"French (Belgium)",
-   "cultureInfoName_fr-CH":"French (Switzerland)",
-   "cultureInfoName_fr-FR":"Fran\u00E7ais (France)",
-   "cultureInfoName_fr-LU":"French (Luxembourg)",
-   "cultureInfoName_hr-HR":"Croatian",
-   "cultureInfoName_hu-HU":"Magyar",
-   "cultureInfoName_it-CH":"Italian (Switzerland)",
-   "cultureInfoName_it-IT":"Italian (Italian)",
-   "cultureInfoName_lt-LT":"Lithuanian",
-   "cultureInfoName_lv-LV":"Latvian",
-   "cultureInfoName_nl-BE":"Dutch (Belgium)",
-   "cultureInfoName_nl-NL":"Nederlands",
-   "cultureInfoName_pl-PL":"Polish",
-   "cultureInfoName_ro-RO":"Romanian",
-   "cultureInfoName_ru-RU":"Russian",
-   "cultureInfoName_sk-SK":"Slovakian",
-   "cultureInfoName_tr-TR":"Turkish",
-   "cultureInfoName_zh-CN":"Chinese",
-   "deleteAllSystemsError":"An error occurred when deleting the account. Please contact the service organisation.",
-   "deleteSystemError":"An error occurred when deleting the installation. Please contact the service organisation.",
-   "error_request_not_found":"The request failed. Please try again later.",
-   "error_without_translation_id":"Error",
-   "errorHasOccured":"An error has occurred. Tracking ID:{{0}}",
-   "errorNoLogFile":"The log file does not exist!",
-   "errorNoLogPath":"A path for the log files has not been created!",
-   "fileTooBig":"The file is too large. A maximum of {{0}} are allowed.",
-   "firmware_file_ack_state":"Last ACK status",
-   "firmware_file_addjob_text":"New transfer",
-   "firmware_file_applicationType":"Application type",
-   "firmware_file_apptype_required":"Please select an application type",
-   "firmware_file_btn_job_add":"Add job",
-   "firmware_file_btn_refresh":"Refresh",
-   "firmware_file_btn_save":"Save",
-   "firmware_file_btn_upload_add":"Upload file",
-   "firmware_file_btn_upload_close":"Cancel",
-   "firmware_file_chuckcount":"Total blocks",
-   "firmware_file_comment":"Comments",
-   "firmware_file_createOn":"Created on",
-   "firmware_file_edit_row_title":"Actions",
-   "firmware_file_edit_text":"Edit comment",
-   "firmware_file_endTime":"Finished on",
-   "firmware_file_gateway_id":"Gateway ID",
-   "firmware_file_gateway_progress_text":"List of devices",
-   "firmware_file_gateway_title":"Status overview",
-   "firmware_file_hash":"Hash",
-   "firmware_file_job_abort_text":"Cancel transfer",
-   "firmware_file_job_add_title":"Start transfer",
-   "firmware_file_name":"File name",
-   "firmware_file_progress":"Progress",
-   "firmware_file_select":"Select",
-   "firmware_file_select_gateway_title":"Gateway selection list",
-   "firmware_file_selected_gateway_title":"Selection list",
-   "firmware_file_size":"Size in",
-   "firmware_file_state":"Status",
-   "firmware_file_state_abort_text":"Cancel transfer",
-   "firmware_file_system_name":"System name",
-   "firmware_file_system_online":"Connection status",
-   "firmware_file_system_serial":"Serial number",
-   "firmware_file_text_filter":"Filter",
-   "firmware_file_upload_dialog_title":"Upload Firmware",
-   "firmware_file_username_email":"Created by",
-   "firmware_file_version":"Version",
-   "gateway_add_title":"Add device",
-   "gateway_changelog_component_title":"Component",
-   "gateway_changelog_new_value_title":"New value",
-   "gateway_changelog_old_value_title":"Old value",
-   "gateway_changelog_text_title":"Measuring point",
-   "gateway_changelog_timestamp_title":"Changed on",
-   "gateway_changelog_unit_title":"Unit",
-   "gateway_changelog_user_title":"User",
-   "gateway_delete_no":"Cancel",
-   "gateway_delete_share_text":"Are you sure, you want to delete the remote access?",
-   "gateway_delete_text":"Are you sure, you want to delete this system?",
-   "gateway_delete_tooltip":"delete",
-   "gateway_delete_yes":"Delete",
-   "gateway_details_tooltip":"System visualization",
-   "gateway_device_add_receiver_text":"Add receiver",
-   "gateway_device_edit_receiver_text":"Edit receiver",
-   "gateway_device_overview_default":"Default",
-   "gateway_device_overview_max":"Max",
-   "gateway_device_overview_min":"Min",
-   "gateway_device_overview_step":"Step",
-   "gateway_device_receiver_connection_notification_0":"None",
-   "gateway_device_receiver_connection_notification_1":"Only online",
-   "gateway_device_receiver_connection_notification_2":"Only offline",
-   "gateway_device_receiver_connection_notification_3":"Online and Offline",
-   "gateway_device_receiver_connection_notification_required":"Please choose a connection notification style",
-   "gateway_device_receiver_connection_notification_title":"Connection notification",
-   "gateway_device_receiver_edit_title":"Actions",
-   "gateway_device_receiver_email_invalidFormat":"Please enter a valid e-mail address",
-   "gateway_device_receiver_email_required":"Please enter a e-mail address",
-   "gateway_device_receiver_email_title":"E-mail address",
-   "gateway_device_receiver_medium_email":"E-mail",
-   "gateway_device_receiver_medium_required":"Please select a medium",
-   "gateway_device_receiver_medium_title":"Medium",
-   "gateway_device_receiver_notification_type_in":"Only incoming error",
-   "gateway_device_receiver_notification_type_in_out":"In and out coming error",
-   "gateway_device_receiver_notification_type_required":"Please select a notification style",
-   "gateway_device_receiver_notification_type_title":"Notification style",
-   "gateway_device_receiver_subject_required":"Please specify a subject",
-   "gateway_device_receiver_subject_title":"Subject title",
-   "gateway_download_btn_file":"Download",
-   "systemList.systemName":"System name",
-   "gateway_no_owner":"System has no owner",
-   "systemList.ownerGroupName":"Owner",
-   "systemList.street":"Street",
-   "gateway_trend_settings_protocol_delete":"Delete log",
-   "gateway_trend_settings_protocol_download":"Download",
-   "gateway_unlock_tooltip":"Unlock",
-   "systemList.zipCode":"Zip code",
-   "gatewayOfflineConnectionMailSubject":"Brink home notification from {{0}}. The installation is offline",
-   "gatewayOfflineConnectionMailBody":"Brink home notification from {{0}}. The installation is offline",
-   "gatewayOnlineConnectionMailBody":"Brink home notification from {{0}}. The installation is online",
-   "gatewayOnlineConnectionMailSubject":"Brink Home notification from {{0}}. The installation is now online",
-   "getDatalogAsCsvNoValuesAvailable":"The recording does not yet contain any values",
-   "importGatewayAccessCodes.textOnlyAllowed":"Only text files are allowed",
-   "kWh":"kWh",
-   "login_forgotpassword":"Forgot password?",
-   "login_mail":"Email",
-   "login_password":"Password",
-   "login_registernow":"Register now",
-   "loginUserMaxUsersOnline":"Maximum number of users online! Please try again later!",
-   "loginUserMaxUsersOnlineSubject":"Maximum number of users online!",
-   "nav_admin_codes":"Release codes",
-   "nav_firmware_jobs":"Firmware updates",
-   "nav_firmware_storage":"Firmware folder",
-   "noDatalogAggregationConfigFound":"No data found for the chosen aggregation level.",
-   "not_found_body":"The requested site can not be found. Please turn back to",
-   "not_found_header":"Site not found",
-   "notSupportedFunction":"This function is not supported.",
-   "parameterWriteError":"Error when writing the value",
-   "profile_newPassword_mustmatch":"The passwords must be the same.",
-   "registerUserMaximumReached":"Maximum number of registered users reached! Users will continue to be created. Increase limit!",
-   "registerUserMaximumReachedMailSubject":"Maximum number of registered users reached!",
-   "save":"save",
-   "sendTimeSeriesesAsCsvNotAllowed":"This function is available only in the more extensive packages.",
-   "server_bad_connection":"Bad connection to server",
-   "server_unreachable":"server unreachable",
-   "setPasswordInvalidLink":"Unfortunately the link is no longer valid.",
-   "sw_new_data_available":"New data is available",
-   "sw_new_data_available_reload_btn":"Reload",
-   "system.component.notAllowedToDelete":"The device cannot be deleted",
-   "system_details_shares_access_level":" Access level",
-   "system_details_shares_actions":"Actions",
-   "system_details_shares_add_btn":"Add",
-   "system_details_shares_add_dialog_access_level":" Access level",
-   "system_details_shares_add_dialog_access_level_required":"Select access level",
-   "system_details_shares_add_dialog_add":"Add",
-   "system_details_shares_add_dialog_close":"Close",
-   "system_details_shares_add_dialog_title":"Add remote access",
-   "system_details_shares_add_dialog_user":"User",
-   "system_details_shares_add_dialog_user_required":"Add user",
-   "system_details_shares_add_service_btn":"Service",
-   "system_details_shares_add_tooltip":"Add remote access",
-   "system_details_shares_delete_dialog_title":"Are you sure you want to delete the remote access?",
-   "system_details_shares_delete_tooltip":"Delete remote access",
-   "system_details_shares_edit_dialog_close":"Close",
-   "system_details_shares_edit_dialog_save":"Save",
-   "system_details_shares_edit_dialog_title":"Change remote access",
-   "system_details_shares_edit_tooltip":"Change remote access",
-   "system_details_shares_name":"Name",
-   "system_details_shares_service_tooltip":"Add remote access for Brink service",
-   "system_details_shipping_actions":"Actions",
-   "system_details_shipping_add_btn":"Add",
-   "system_details_shipping_add_dialog_add":"Add",
-   "system_details_shipping_add_dialog_address":"E-mail",
-   "system_details_shipping_add_dialog_address_email_format":"Please add a valid e-mail address",
-   "system_details_shipping_add_dialog_address_required":"Add e-mail address",
-   "system_details_shipping_add_dialog_close":"Close",
-   "system_details_shipping_add_dialog_period":"Interval",
-   "system_details_shipping_add_dialog_period_required":"Select interval",
-   "system_details_shipping_add_dialog_title":"Add recipient",
-   "system_details_shipping_add_tooltip":"Add recipient",
-   "system_details_shipping_delete_dialog_title":"Are you sure you want to delete the recipient?",
-   "system_details_shipping_delete_tooltip":"Delete recipient",
-   "system_details_shipping_dropshipping_tooltip":"Send now",
-   "system_details_shipping_edit_dialog_address":"E-mail",
-   "system_details_shipping_edit_dialog_address_required":"Add a e-mail address",
-   "system_details_shipping_edit_dialog_close":"Close",
-   "system_details_shipping_edit_dialog_period":"Interval",
-   "system_details_shipping_edit_dialog_period_required":"Select interval",
-   "system_details_shipping_edit_dialog_save":"Save",
-   "system_details_shipping_edit_tooltip":"Edit recipient",
-   "system_details_shipping_period":"Interval",
-   "system_details_shipping_receiver":"Recipient",
-   "systemSettingsGatewayOffline":"The settings couldn\u0027t be saved the system is offline",
-   "systemSettingsWriteTimedOut":"The connection to the system failed. Please make sure the system is connected to the internet.",
-   "systemstatistics_axis_power":"Power",
-   "systemstatistics_axis_solarpower":"Power",
-   "systemstatistics_axis_speed":"Rotational speed",
-   "systemstatistics_axis_states":"State",
-   "systemstatistics_axis_temperature":"Temperature",
-   "systemstatistics_axis_unknown":"Unknown",
-   "systemstatistics_download":"Download",
-   "theme_select":"Select a theme",
-   "unknownMailAddress":"We don\u0027t recognise the specified email address.",
-   "unlockSystemPassword":"The password is invalid. Correct the entry and repeat the procedure.",
-   "user_admin_edit_roles_dialog_btn_close":"Close",
-   "user_admin_edit_roles_dialog_btn_save":"Save",
-   "user_admin_edit_roles_dialog_select_one":"Select a role",
-   "user_admin_edit_roles_dialog_title":"Change the role",
-   "user_admin_edit_system_dialog_btn_close":"Close",
-   "user_admin_edit_system_dialog_btn_save":"Save",
-   "user_admin_edit_system_dialog_quota_accessLevel":"Access right",
-   "user_admin_edit_system_dialog_quota_actions":"Actions",
-   "user_admin_edit_system_dialog_quota_btn_delete":"Delete system",
-   "user_admin_edit_system_dialog_quota_details_title":"Plant contingent Details",
-   "user_admin_edit_system_dialog_quota_edit_title":"Change system quota",
-   "user_admin_edit_system_dialog_quota_gatewayname":"System name",
-   "user_admin_edit_system_dialog_quota_greater_null":"Please enter a number greater than 0.",
-   "user_admin_edit_system_dialog_quota_hint":"Leave the input field empty to switch off the quota check.",
-   "user_admin_edit_system_dialog_quota_serialnumber":"Serial number",
-   "user_admin_edit_system_dialog_quote":"Contingent",
-   "user_admin_edit_system_dialog_share_btn_close":"Cancel",
-   "user_admin_edit_system_dialog_share_btn_save":"Sace",
-   "user_admin_edit_system_dialog_share_quota_accessLevel":"Right",
-   "user_admin_edit_system_dialog_share_quota_btn_delete":"Delete release",
-   "user_admin_edit_system_dialog_share_quota_details_title":"Release quota Details",
-   "user_admin_edit_system_dialog_share_quota_edit_title":"Change release quota",
-   "user_admin_edit_system_dialog_share_quota_gatewayname":"System name",
-   "user_admin_edit_system_dialog_share_quota_greater_null":"Please enter a number greater than 0.",
-   "user_admin_edit_system_dialog_share_quota_hint":"Leave the input field empty to switch off the quota check.",
-   "user_admin_edit_system_dialog_share_quota_serialnumber":"Serial number",
-   "user_admin_edit_system_dialog_share_quote":"Contingent",
-   "user_adming_action_label":"Actions",
-   "W":"W",
-   "nav_profile":"Account settings",
-   "nav_logout":"Logout",
-   "nav_admin_gateways":"List of systems",
-   "admin-system-list-btn-details":"Details",
-   "admin-system-list-btn-delete":"Delete",
-   "nav_admin_user_overview":"List of users",
-   "profile_general_options_label":"General",
-   "profile_change_password_label":"Change password",
-   "profile_delete_label":"Delete account",
-   "profile_currentPassword":"Current password",
-   "profile_originalpassword_required":"Please enter the current password",
-   "profile_password":"Password",
-   "profile_password_required":"Please enter new password.",
-   "profile_passwordRepeat":"Repeat password",
-   "profile_passwordRepeat_required":"Please enter new password again.",
-   "profile_changePassword":"Change password",
-   "profile_delete_text_dialog":"Are you sure you would like to delete your account?",
-   "profile_delete_dialog_cancel":"Cancel",
-   "profile_delete_dialog_yes":"Delete",
-   "profile_delete_text":"If you delete your account you will lose all your data.",
-   "profile_delete_button":"Delete account",
-   "profile_mail":"Email",
-   "profile_role":"Role",
-   "profile_culture":"Language",
-   "profile_country":"Country",
-   "profile_customerid":"Client number",
-   "profile_company":"Company",
-   "profile_lastname":"Surname",
-   "profile_lastname_errormsg":"Please enter your surname",
-   "profile_firstname":"Name",
-   "profile_firstname_errormsg":"Please enter your name",
-   "profile_street":"Street",
-   "profile_street_errormsg":"Please enter your street",
-   "profile_streetnr":"House number",
-   "profile_streetno_errormsg":"Please enter your house number",
-   "profile_zip":"Zip code",
-   "profile_zipcode_errormsg":"Please enter your zip code",
-   "profile_city":"City",
-   "profile_city_errormsg":"Please enter your city",
-   "profile_save":"Save",
-   "gateway_edit_serialnumber_title":"Serial number",
-   "gateway_edit_name_title":"system name",
-   "gateway_edit_timezone_title":"Time zone",
-   "gateway_edit_description_title":"Description",
-   "gateway_edit_comment_title":"Comments",
-   "gateway_edit_zipcode_title":"Zip code",
-   "gateway_edit_city_title":"City",
-   "gateway_edit_street_title":"Street",
-   "gateway_edit_streetno_title":"House number",
-   "dashboard_alert_title":"Current errors",
-   "dashboard_fav_gateways_title":"Favorited systems",
-   "dashboard_fast_links_title":"Quick link",
-   "systemlist_title":"Installation overview",
-   "nav_map":"Locations",
-   "eventlog_edit_table_title":"Edit",
-   "eventlog_details_tooltip":"Detail",
-   "eventlog_delete_tooltip":"Delete",
-   "gateway_edit_table_title":"Actions",
-   "nav_gateways":"My systems",
-   "system_details_edit_general_edit_system_name_required":"Enter system name",
-   "register_country":"Country",
-   "register_country_required":"Please select country.",
-   "system_details_edit_general_edit_timezone_required":"Enter time zone",
-   "gateway_edit_save":"Save",
-   "delete_component":"Delete",
-   "systemList.isFavorite":"Favorited",
-   "systemList.gatewayState":"Status",
-   "systemList.accessLevel":"Access level",
-   "systemList.location":"Location",
-   "nav_tools_header":"User",
-   "nav_dashboard":"Dashboard",
-   "nav_admin_header":"Admin",
-   "nav_admin_dashboard":"Dashboard",
-   "nav_device_management":"Device management",
-   "nav_user_management":"User management",
-   "gateway_add_dialog_title":"Add  system",
-   "gateway_add_dialog_serialnumber":"Serial number",
-   "gateway_add_dialog_serialnumber_required":"Enter a serial number",
-   "gateway_add_dialog_password":"Password",
-   "gateway_add_dialog_password_required":"Add a password",
-   "gateway_add_dialog_code":"Release code",
-   "gateway_add_dialog_code_required":"Enter release code",
-   "gateway_add_dialog_close_btn":"Close",
-   "gateway_add_dialog_add_btn":"Add",
-   "gateway_unlock_title":"Unlock system",
-   "gateway_unlock_gateway_password":"System password",
-   "gateway_unlock_gateway_password_required":"Enter the system password",
-   "gateway_unlock_close_button":"Close",
-   "gateway_unlock_confirm_button":"Unlock",
-   "gateway_device_error_dialog_title":"Details",
-   "gateway_device_error_origin":"Source of error",
-   "gateway_device_error_code":"Error code",
-   "gateway_device_error_description":"Error description",
-   "gateway_device_error_dialog_close":"Close",
-   "paginator_item_per_page_label":"Items per page",
-   "admin.feature-not-enabled":"Feature is not enabled",
-   "admin.userlist.invalidPageSize":"Invalid page size",
-   "admin.userlist.invalidPageIndex":"Invalid page index",
-   "admin.gatewaylist.invalidPageSize":"Invalid page size",
-   "admin.gatewaylist.invalidPageIndex":"Invalid page index",
-   "admin_dashboard_systemsOnlineCount":"Systems online",
-   "admin_dashboard_appConnectionCount":"User connected",
-   "admin_dashboard_cpuUsage":"CPU",
-   "admin_dashboard_memUsage":"RAM",
-   "admin_dashboard_registeredUsersCount":"Registered users",
-   "admin_dashboard_usersOnlineCount":"Online users",
-   "admin_dashboard_usersLockedOutCount":"Locked users",
-   "admin_dashboard_usersNotApprovedCount":"Not yet confirmed users",
-   "admin_dashboard_registeredSystemsCount":"Registered system ",
-   "admin_dashboard_systemsWithoutOwnerCount":"Systems without owner",
-   "admin_dashboard_systemLockedOutCount":"Blocked systems",
-   "system-quota-changed":"Plant quota changed",
-   "receiving-systemshare-quota-changed":"Release quota changed",
-   "setting a private role is not allowed":"setting a private role is not allowed",
-   "user-role-changed":"Role changed",
-   "admin_user_dialog_delete_title":"Are you sure you want to delete this user?",
-   "admin_dashboard_diagram_title":"User statistics",
-   "admin_dashboard_diagram_series_login_counts":"Logins",
-   "admin_dashboard_diagram_series_user_counts":"User",
-   "component_visualization_refresh_button":"Refresh",
-   "admin_user_list_filter_state_offline":"Offline",
-   "admin_user_list_filter_state_online":"Online",
-   "admin_user_list_filter_state_locked":"Locked",
-   "admin_user_list_filter_state_not_approved":"Not confirmed",
-   "gateway_nav_error_messages":"Error messages",
-   "gateway_nav_jobs":"Updates",
-   "gateway_changelog_title":"Changelog",
-   "gateway_statistics_title":"Historical trend",
-   "gateway_live_trend_title":"Live trend",
-   "gateway_event_log":"Event log",
-   "systemsettings_title":"Settings",
-   "systemsettings_alertrules":"Fault message recipients",
-   "systemsettings_shipping":"Shipping",
-   "login_remember_login":"Remember login",
-   "login_title":"Login",
-   "forgotpassword_description":"Enter the email address associated with your account. Then click \u0027Next\u0027. We will send you an email with a link to enter a new password.\n",
-   "forgotpassword_mail":"Email",
-   "forgotpassword_mail_required":"Enter your e-mail address",
-   "forgotpassword_wrong_format":"Enter a valid e-mail address",
-   "forgotpassword_cancel":"Go to Login",
-   "forgotpassword_mailsent_description":"Email sent! We have sent you an email at the entered address. If you can\u0027t see the mail please also check your spam folder.",
-   "registerconfirm_loginLink":"Go to Login",
-   "forgotpassword_password_description":"Please enter your password and then click \u0027Change password\u0027 ",
-   "forgotpassword_newPassword":"New password",
-   "forgotpassword_newPasswordRepeat":"Repeat password",
-   "forgotPasswordMailHeader":"Password reset",
-   "forgotpassword_changedPassword_description":"Your password has been changed. Please log in again.",
-   "register_header":"New registration for the Brink Web Portal",
-   "register_choose":"Please choose",
-   "register_culture":"Language",
-   "register_mail":"Email",
-   "register_mail_required":"Please enter email.",
-   "register_mail_invalid":"Please enter valid email again.",
-   "register_mailRepeat":"Repeat email",
-   "register_mailRepeat_required":"Please re-enter",
-   "register_password":"Password",
-   "register_password_required":"Please enter password.",
-   "register_passwordRepeat":"Repeat password",
-   "register_passwordRepeat_required":"Please enter password again.",
-   "register_passwords_mustmatch":"The passwords must be the same.",
-   "register_company":"Company name",
-   "register_customerid":"Client number",
-   "register_lastname":"Surname",
-   "register_firstname":"Name",
-   "register_street":"Street",
-   "register_streetnr":"House number",
-   "register_zip":"Zip code",
-   "register_city":"City",
-   "register_accept_terms":"I accept the {{0}}",
-   "register_accept_terms_link_name":"terms and conditions",
-   "register_termsofuse_required":"You must accept the Privacy Statement and the Terms of Use.",
-   "register_accept_datasecurity":"I accept the {{0}}",
-   "register_accept_datasecurity_link_name":"Privacy statement",
-   "register_data_security_required":"You have to accept the privacy statement in order to continue",
-   "register_newsletter":"Subscribe to newsletter?",
-   "register_submit":"Send registration",
-   "register_received":"Registration received",
-   "register_receivedDescription":"Almost done! Thank you for your registration. You will receive a confirmation email with a link for confirmation in a few minutes. Now you can get started!",
-   "registerconfirm_header":"Complete registration",
-   "registerconfirm_description":"To complete the registration you will need to enter the code below, which we have sent to you by email to {{0}}",
-   "logout":"Logout",
-   "admin_system_list_filter_state_locked":"Locked",
-   "admin_system_list_filter_state_offline":"Offline",
-   "admin_system_list_filter_state_online":"Online",
-   "register_mailRepeat_invalid":"Please enter valid email again.",
-   "register_emails_mustmatch":"The e-mail addresses have to match",
-   "confirmMailSubject":"Brink Portal Registration",
-   "passwordRecoveryMailSubject":"Brink Portal Password Help",
-   "createSystemShareNotificationMailBody":"You have received a remote access for the installation \u0027{{0}}\u0027 from \u0027{{1}}\u0027.",
-   "createSystemShareNotificationMailSubject":"New remote access",
-   "updateSystemShareMailNotificationSubject":"Change remote access",
-   "updateSystemShareMailNotificationTitle":"Access rights changed",
-   "updateSystemShareMailNotificationBody":"Your access rights for the installation \u0027{{0}}\u0027 have been changed by the owner.",
-   "systemDeletedInfo.mailSubjectSystemOwner":"System deleted",
-   "systemDeletedInfo.mailSubjectSystemShare":"Remote access deleted",
-   "passwordforget_confirm_error":"An error occurred while setting a new password",
-   "no_gateways":"You have not yet set up any devices",
-   "admin_code_list_dialog_import_success":"The import was successful",
-   "firmware_file_update_comment_text":"Comment was edited",
-   "firmware_file_upload_file_text":"A file was uploaded successfully",
-   "check_input":"An error occurred. Please check your input",
-   "gateway_add_dialog_form_invalid":"Please check your input",
-   "gateway_delete_success":"The system has been successfully deleted",
-   "gateway_delete_share_success":"The remote access has been successfully deleted",
-   "system_overview_devices_error":"An error occurred",
-   "system_overview_devices_edit_parameter_success":"Parameter has been changed",
-   "gateway_device_receiver_delete_success":"Receiver has been deleted",
-   "gateway_device_receiver_connection_notification_kind_none":"None",
-   "gateway_device_receiver_connection_notification_kind_online":"Only online",
-   "gateway_device_receiver_connection_notification_kind_offline":"Only offline",
-   "gateway_device_receiver_connection_notification_kind_both":"Online and offline",
-   "gateway_device_receiver_connection_notification_type_in_and_out":"Incoming and outgoing",
-   "gateway_device_receiver_connection_notification_type_in":"Only incoming",
-   "gateway_device_receiver_connection_medium_email":"E-mail",
-   "gateway_add_receiver_error":"Could not add error notifications",
-   "gateway_edit_receiver_error":"Could not edit error notifications",
-   "system_details_edit_general_edit_form_invalid":"The input is invalid",
-   "system_sharelist_service_share_restore_success":"Remote access for Brink service has been added",
-   "system_sharelist_service_share_restore_unchanged":"Brink service has already remote access for this system",
-   "system_details_shares_add_success":"Remote access has been added",
-   "system_details_shares_add_dialog_form_invalid":"The input is invalid",
-   "system_details_shares_delete_success":"Remote access has been deleted",
-   "system_details_shares_edit_success":"Remote access has been changed",
-   "system_details_shares_edit_dialog_form_invalid":"The input is invalid",
-   "system_details_shipping_dropshipping_success":"The log files have been send",
-   "system_details_shipping_add_success":"The recipient has been added",
-   "system_details_shipping_add_dialog_form_invalid":"The input is invalid",
-   "system_details_shipping_delete_success":"Recipient has been deleted",
-   "system_details_shipping_edit_success":"Recipient has been changed",
-   "system_details_shipping_edit_dialog_form_invalid":"The input is invalid",
-   "profile_passwordchanged":"Your password has been changed. Use the new password the next time you login.",
-   "profile_delete_success":"The account has been deleted",
-   "profile_changed":"The account has been changed",
-   "gateway_add_dialog_success":"The system has been added",
-   "gateway_unlock_success":"The selected system was unlocked successfully",
-   "gateway_edit_interface_success":"The interface was edited successfully",
-   "system_details_edit_general_edit_success":"The system settings have been changed",
-   "delete_access_code":"The release code was deleted successfully",
-   "post_access_code":"The release code was added successfully",
-   "admin_system_list_delete_error":"The system could not be deleted",
-   "admin_system_list_delete_success":"The system has been deleted",
-   "firmware_file_abort_state_text":"Job transfer cancelled successfully",
-   "firmware_file_abort_state_text_success":"Transfer cancelled successfully",
-   "gateway_device_receiver_add_success":"The recipient has been added",
-   "gateway_device_receiver_edit_success":"The recipient has been changed",
-   "unknown_error":"An unknown error occurred",
-   "eventLogList.ExternalId":"Event ID",
-   "eventLogList.Timestamp":"Date and time",
-   "eventLogList.EventType":"Level",
-   "firmware_file_created_job_text":"Firmware-job was created successfully",
-   "snackbar_close":"Close",
-   "filter":"Filter",
-   "NoFilter":"---",
-   "eventLogList.Device":"Device",
-   "eventLogList.EventType.Info":"Information",
-   "eventLogList.EventType.Warning":"Warning",
-   "eventLogList.EventType.Error":"Error",
-   "eventLogList.Category.Hardware":"Hardware",
-   "eventLogList.Category.Kernel":"Kernel",
-   "eventLogList.Category.SpiBus":"SPI Bus",
-   "eventLogList.Category.Uart1":"UART 1",
-   "eventLogList.Category.Uart2":"UART 2",
-   "eventLogList.Category":"Source",
-   "eventLogList.Code":"Event ID",
-   "eventLogList.CodeTextId":"Text ID",
-   "imprint":"Imprint",
-   "terms":"Terms and conditions",
-   "data-security":"Privacy statement",
-   "dashboard":"Dashboard",
-   "map":"Map",
-   "breadcrumb_admin":"Admin",
-   "breadcrumb_admin_dashboard":"Admin dashboard",
-   "breadcrumb_admin_gateway_list":"System list",
-   "breadcrumb_admin_gateway_details":"Details",
-   "breadcrumb_admin_firmware_updates":"Firmware-Updates",
-   "breadcrumb_admin_job_details":"Job-Details",
-   "breadcrumb_admin_firmware_storage":"Firmware storage",
-   "breadcrumb_admin_firmware_share":"Distribute firmware",
-   "breadcrumb_admin_user_list":"User list",
-   "breadcrumb_admin_code_list":"Release codes",
-   "breadcrumb_trend":"Trend ",
-   "breadcrumb_component_overview":"Component overview",
-   "breadcrumb_alerts":"Alerts",
-   "systemstatistics_axis_ppm":"PPM",
-   "systemstatistics_axis_kByte":"kByte",
-   "systemstatistics_axis_mm":"mm",
-   "systemstatistics_axis_cm":"cm",
-   "systemstatistics_axis_degree":"degree",
-   "systemstatistics_axis_mm_sec_squared":"mm/s\u00B2",
-   "systemstatistics_axis_percent":"%",
-   "systemstatistics_axis_min":"min",
-   "applicationtype_wlan":"WLAN",
-   "jobstate_finish":"Finished",
-   "jobstate_abort":"Abort",
-   "jobstate_run":"Running",
-   "statelastack_deactivated":"Deactivated",
-   "statelastack_error":"Error",
-   "statelastack_invalidHash":"Invalid value",
-   "statelastack_ok":"Ok",
-   "statelastack_outOfMemory":"Out of memory",
-   "statestate_error":"Error",
-   "statestate_finish":"Finished",
-   "statestate_abort":"Aborted",
-   "statestate_isProcessing":"Running",
-   "no_gateways_add":"Add a system",
-   "gateway_offline":"System offline",
-   "confirm_alert_button_tooltip":"Confirm",
-   "confirm_alert_success":"Alert has been confirmed",
-   "systemstatistics_mg_per_liter":"systemstatistics mg per liter",
-   "systemstatistics_mV":"systemstatistics mV",
-   "systemstatistics_pH":"systemstatistics pH",
-   "systemstatistics_mS_per_cm":"systemstatistics mS per cm",
-   "filter_set":"Set filter",
-   "filter_not_set":"No active filter",
-   "filter_save_button":"Save filter",
-   "filter_reset_button":"Reset filter",
-   "no_events":"There are no events",
-   "no_fw_jobs":"There are no jobs",
-   "no_receivers":"There are no recipients",
-   "no_shares":"There is no remote accesses",
-   "no_shipping":"There are no recipients",
-   "choose_date":"Choose date",
-   "parameterChangeLog.TimestampColumn":"Date and time",
-   "parameterChangeLog.ComponentColumn":"Device",
-   "parameterChangeLog.ParameterColumn":"Parameter",
-   "parameterChangeLog.UserColumn":"User",
-   "parameterChangeLog.OldValueColumn":"Old value",
-   "parameterChangeLog.NewValueColumn":"New value",
-   "live_trend_search":"Search",
-   "live_trend_line_color":"Color",
-   "no_read_write_access":"None",
-   "read":"Read",
-   "read_write":"Read/Write",
-   "write":"Write",
-   "system_details_shares_add_dialog_read_write_access":"Add write access",
-   "loginAccountUserNotApproved":"The registration is not yet complete. Please activate using the confirmation link.",
-   "loginAccountLocked":"You have entered your password incorrectly too many times. Your account has been locked. If you have forgotten your password, click \u0027I have forgotten my password\u0027",
-   "loginWrongCredentials":"The email or the password is invalid! Correct the entry and repeat the procedure.",
-   "loginNotAllowedLocation":"Unfortunately login from your location is not possible!",
-   "componentList.NameColumn":"Name",
-   "componentList.SerialNumber":"Serial number",
-   "componentList.TypeName":"Device type",
-   "componentList.AlertCount":"Alert",
-   "maxDatalogSystemViewCountReached":"The maximum number of parameters has been reached",
-   "datalogViewMaxSeriesCountReached":"The maximum amount of parameters has been reached",
-   "settings":"Settings",
-   "new_profile_placeholder":"My new view",
-   "trend_add_profile_success":"A new view has been added",
-   "trend_delete_profile_success":"The view has been deleted",
-   "trend_edit_y_axis_success":"The changes have been saved",
-   "select_profile":"Views",
-   "trend_profile_name":"Name of view",
-   "trend_edit_name_tooltip":"Change name of view",
-   "trend_confirm_name_tooltip":"Save name of view",
-   "trend_add_profile_tooltip":"Add new view",
-   "trend_delete_profile_tooltip":"Delete view",
-   "trend_parameters":"Select parameters",
-   "trend_is_selected":"Selected",
-   "trend_text_id":"Parameter",
-   "trend_component_name":"Device",
-   "trend_unit_text_id":"Unit",
-   "trend_y_axes":"Y axes",
-   "trend_min":"Min",
-   "trend_max":"Max",
-   "trend_scale_mode":"Scale",
-   "trend_scale_mode_auto":"Auto",
-   "trend_scale_mode_soft_min_max":"Min/Max (soft)",
-   "trend_scale_mode_hard_min_max":"Min/Max",
-   "trend_line_color":"Colour",
-   "trend_actions":"Actions",
-   "trend_settings_edit_tooltip":"Change",
-   "trend_settings_undo_tooltip":"Reset",
-   "trend_settings_save_tooltip":"Save",
-   "trend_settings_cancel_tooltip":"Cancel",
-   "eMailSendError":"E-mail couldn\u2019t be send",
-   "register_required_fields_info":"All fields marked with an * are required",
-   "register_password_requirement_info":"Password requirements: min. 8 characters, Upper- and lowercase, min. 1 number",
-   "alertCreateReceiverMaxDestinations":"The maximum amount of recipients has been reached",
-   "maxDatalogParametersReached":"The maximum amount of parameters has been reached",
-   "gateway_delete":"Delete system",
-   "add_to_home":"Add to Home",
-   "breadcrumb_gateways":"System list",
-   "gateway_delete_dialog_share_title":"Delete remote access",
-   "gateway_delete_dialog_title":"Delete system",
-   "gateway_delete_dialog_share_text":"Are you sure you want to delete your remote access rights irrevocably?",
-   "gateway_delete_dialog_text":"Are you sure you want to delete your system irrevocably?",
-   "gateway_delete_dialog_no":"Cancel",
-   "gateway_delete_dialog_yes":"Delete",
-   "gateway_trend_tooltip":"Trend ",
-   "gateway_alert_tooltip":"Alert",
-   "gateway_system_overview_tooltip":"System settings",
-   "gateway_delete_button":"Delete",
-   "countryNameUS":"USA",
-   "countryNameCA":"Canada",
-   "countryNameMX":"Mexico",
-   "cultureInfoName_en-US":"Englisch (USA)",
-   "cultureInfoName_en-CA":"anglais (Canada)",
-   "cultureInfoName_es-MX":"Spanish (Mexico)",
-   "cultureInfoName_fr-CA":"French (Canada)",
-   "role_none":"None",
-   "role_end_user":"User",
-   "role_end_user_plus":"User Plus",
-   "role_expert":"Installer",
-   "role_manufacturer":"Brink",
-   "role_cloud_server_admin":"Admin",
-   "role_contract_agent":"Admin",
-   "role_contractor":"Service provider",
-   "breadcrumb_gateway_options":"Advanced settings",
-   "terms_of_use_text":"Terms and conditions",
-   "data_security_text":"Privacy statement",
-   "imprint_text":"Imprint",
-   "user_admin_edit_system_dialog_quota_delete_title":"Delete system?",
-   "user_admin_edit_system_dialog_share_quota_delete_title":"Delete remote access?",
-   "role.enduser-plus":"User plus",
-   "role.contractor":"Service provider",
-   "accessLevelExpertRead.abbr":"F (L)",
-   "accessLevelUserRead.abbr":"E (L)",
-   "accessLevelUserReadWrite.abbr":"E (LS)",
-   "accessLevelUserPlusRead.abbr":"EP (L)",
-   "accessLevelUserPlusReadWrite.abbr":"EP (LS)",
-   "accessLevelExpertReadWrite.abbr":"F (LS)",
-   "accessLevelContractorRead.abbr":"C (L)",
-   "accessLevelContractorReadWrite.abbr":"C (LS)",
-   "accessLevelManufacturerRead.abbr":"B (L)",
-   "accessLevelManufacturerReadWrite.abbr":"B (LS)",
-   "role.enduser.abbr":"E",
-   "role.enduser-plus.abbr":"EP",
-   "role.expert.abbr":"F",
-   "role.oem.abbr":"B",
-   "role.cloud-admin.abbr":"A",
-   "role.contractor.abbr":"C",
-   "logout_title":"Logout",
-   "logout_sub_title":"You\u0027re now logout",
-   "logout_redirect_text":"You will be automatically redirected to the login page",
-   "alertNotificationSubject":"Brink Home: error notification",
-   "system_details_shipping_edit_dialog_title":"Edit recipient",
-   "userDeleted.mailsubject":"Account deleted",
-   "sendTimeSeriesesAsCsv.mailsubject":"Trend data",
-   "gateway_trend_datalog_not_available":"Trend is not available at the moment",
-   "air_control_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/Brink-Air-Control-Installation-regulations-614884-EN",
-   "co2_sensor_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/co2-sensor-614853",
-   "demand_controlled_ventilation_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/demand-controlled-ventilation-2-0-611586",
-   "home_module_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/Brink-Home-eModule-iModule-614491",
-   "excellent_180_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/renovent-excellent-180-614293-en",
-   "excellent_300_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/renovent-excellent-300-400-612054-en",
-   "excellent_400_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/renovent-excellent-300-400-612054-en",
-   "excellent_450_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/renovent-excellent-450-614784-en",
-   "flair_325_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/flair-325-615674",
-   "flair_400_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/Flair-400-Installation-regulations-614895",
-   "sky_150_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/Renovent-Sky-150-612382",
-   "sky_200_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/Renovent-Sky-200-(plus)-614485",
-   "sky_300_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/renovent-sky-300-612082",
-   "air_70_manual_link":"https://www.brinkclimatesystems.nl/nl-nl/docsearch/air-70-614397",
-   "gateway_fault_dialog_delete_title":"Are you sure, you want to delete the receiver?",
-   "profile_vat_number":"Tax number",
-   "profile_telephone_number":"Telephone number",
-   "user_requesting_expert_role_title":"Expert Request",
-   "user_requesting_expert_role_body":"Request from:",
-   "user_requesting_expert_role_email_text":"E-Mail",
-   "user_requesting_expert_role_company_text":"Company",
-   "user_requesting_expert_role_phone_number_text":"Telephone number",
-   "user_requesting_expert_role_vat_number_text":"Tax number",
-   "user_requesting_expert_role_required_error_text":"Please fill the form completely",
-   "user_requesting_expert_role_success":"You have successfully sent the request. Please wait until an administrator has processed your request",
-   "user_requesting_expert_role_request_button":"Send request",
-   "mail.requestingExpertRole.subject":"Brink Home Expert rights request",
-   "gateway_refresh_button":"Refresh",
-   "profile_section_general":"General",
-   "profile_section_expert":"installer",
-   "timeSeriesReceiverPeriods.Weekly":"Weekly",
-   "timeSeriesReceiverPeriods.Monthly":"Monthly",
-   "yAxisNullUnit":"Status",
-   "external_login_or":"Or",
-   "forgotpassword_title":"Password help",
-   "forgotpassword_check_identity_title":"Verifying your identity",
-   "forgotpassword_check_identity_description":"For security reasons, we need to verify your identity. We have sent you an email to {{0}} with a code that you can use to reset your password. Please enter the code below. If there is no email in your inbox, please check your spam folder. If you have not received an e-mail from us, you may have mistyped the address or your account uses an different email address.",
-   "forgotpassword_code":"Code",
-   "forgotpassword_resend_code":"Resend code",
-   "forgotpassword_next":"Next",
-   "forgotpassword_code_required":"Enter the code",
-   "forgotpassword_wrong_code":"Invalid code. Check the code and try again.",
-   "forgotpassword_new_code_sent":"A new code has been sent. Please check your e-mail inbox.",
-   "forgotpassword_confirm_title":"Create a new password",
-   "forgotpassword_confirm_description":"We will ask you for this password when you log in.",
-   "forgotpassword_email_subject":"Password help",
-   "forgotpassword_confirm_save_button":"Save changes and login",
-   "registerconfirm_code":"Code",
-   "registerconfirm_resend_code":"Resend code",
-   "registerconfirm_verify":"Verify and log in",
-   "registerconfirm_code_required":"Enter the code",
-   "registerconfirm_code_invalid":"Invalid code. Check the code and try again.",
-   "registerconfirm_mail_subject":"Verify your new account",
-   "registerconfirm_new_code_sent":"A new code has been sent. Please check your e-mail inbox.",
-   "user_verify_code_mail_subject":"Verify your new account",
-   "mail_sent_error":"The e-mail could not be delivered. Try again later.",
-   "user_verify_code_mail_greeting":"Welcome",
-   "user_verify_code_mail_description":"Use the following code to confirm your identity:",
-   "user_verify_code_mail_signature_p1":"Best regards",
-   "user_verify_code_mail_signature_p2":"Your Brink Home team",
-   "forgotusername_check_identity_title":"Verifying your identity",
-   "forgotusername_check_identity_description":"For security reasons, we need to verify your identity. We have sent you an email to {{0}} with a code that you can use to reset your password. Please enter the code below. If there is no email in your inbox, please check your spam folder. If you have not received an e-mail from us, you may have mistyped the address or your account uses an different email address.",
-   "forgotusername_code":"Code",
-   "forgotusername_resend_code":"Resend code",
-   "forgotusername_show_username":"Show username",
-   "forgotusername_title":"Help with your username",
-   "forgotusername_description":"Enter the email address associated with your account. Then click \u0027Next\u0027. We will email you a code to confirm your identity.\n",
-   "forgotusername_email":"Email",
-   "forgotusername_loginlink":"Goto login",
-   "forgotusername_next":"Next",
-   "forgotusername_your_username":"Your username is: {{0}}",
-   "forgotusername_code_required":"Enter the code",
-   "forgotusername_wrong_code":"Invalid code. Check the code and try again.",
-   "forgotusername_new_code_sent":"A new code has been sent. Please check your e-mail inbox.",
-   "forgotusername_email_required":"Enter your e-mail address",
-   "forgotusername_email_wrong_format":"Enter a valid e-mail address",
-   "forgotusername_email_subject":"Account help",
-   "errorview_description":"An error occurred during your request. Please copy the tracking ID and contact the Brink Service.",
-   "errorview_tracking_id":"Tracking Id:",
-   "errorview_title":"Error",
-   "account_linking_email":"E-Mail",
-   "account_linking_username":"Username",
-   "account_linking_lastname":"Lastname",
-   "account_linking_firstname":"Firstname",
-   "account_linking_zipcode":"Zipcode",
-   "account_linking_city":"City",
-   "account_linking_street":"Street",
-   "account_linking_streetNo":"Street number",
-   "account_linking_culture":"Language",
-   "account_linking_country":"Country",
-   "account_linking_other_user":"Username Brink Home",
-   "account_linking_new_user":"Password Brink Home",
-   "account_linking_accept_terms":"I accept the \u003Ca href=\u0022Imprint\u0022 target=\u0022_blank\u0022\u003Eterms and conditions\u003C/a\u003E",
-   "account_linking_accept_datasecurity":"You must accept the Privacy Statement and the Terms of Use.",
-   "account_linking_new_user_header_message":"Hello {{0}}, welcome to Brink Home. Please check that the following data is correct.\n",
-   "account_linking_new_user_button_text":"Create a Brink Home account and login",
-   "account_linking_new_user_other_account_button_text":"I already have an account",
-   "account_linking_user_found_header_message":"Hello {{0}}, we have found a Brink Home account for your email address. In order for us to verify your identity, you will need your password from your Brink Home account. Please check that the following information is correct.",
-   "account_linking_user_found_button_text":"Connect and login to your Brink Home account",
-   "account_linking_user_found_other_account_button_text":"Use other Brink Home account",
-   "account_linking_login_description":"In order for us to verify your identity, we need your Brink Home username and password.",
-   "account_linking_confirm":"Connect and login to your Brink Home account",
-   "account_linking_lastname_required":"Please enter your surname",
-   "account_linking_firstname_required":"Enter your first name",
-   "account_linking_username_required":"Enter your username from your Brink Home account",
-   "account_linking_password_required":"Enter your password from your Brink Home account",
-   "account_linking_accept_terms_required":"You must agree to the privacy policy",
-   "account_linking_accept_usage_required":"You must agree to the terms of use",
-   "account_linking_wrong_username_or_password":"The username or password is invalid! Correct the entry and repeat the process.",
-   "account_linking_ip_access_denied":"Registration is not possible from your location!",
-   "account_linking_locked_out":"You have entered your password incorrectly too often. Your account has been blocked. If you have forgotten your password, click on \u0027I have forgotten my password\u0027 on the login screen.",
-   "account_linking_not_approved":"The registration of your Brink Home account is not yet complete.",
-   "account_linking_max_user_reached_email_subject":"Maximum number of registered users reached!",
-   "account_linking_max_user_reached_email_text":"Users will still be created. Increase limit!",
-   "account_linking_register_completed_email_subject":"Welcome to Brink Home",
-   "account_linking_register_completed_email_text":"Hello, we are pleased that you would like to use Brink Home",
-   "mail_template_greeting":"Hallo",
-   "mail_template_signatur_p1":"Best regards",
-   "mail_template_signatur_p2":"The Brink Home team",
-   "login_mail_required":"Enter your e-mail address",
-   "login_password_required":"Enter your",
-   "register_lastname_required":"Please enter your surname",
-   "register_firstname_required":"Enter your first name",
-   "register_streetname_required":"Enter your streetname",
-   "register_streetnumber_required":"Enter your streetnumber",
-   "register_zipcode_required":"Enter your zipcode",
-   "register_city_required":"Enter your city",
-   "profile_company_required":"Enter your company name",
-   "profile_telephone_number_required":"Enter your telephone number",
-   "profile_vat_number_required":"Enter your vat number",
-   "login_website_title":"Brink Home Login",
-   "app_website_title":"Brink Home",
-   "breadcrumb_historical_trend":"Historical trend",
-   "breadcrumb_live_trend":"Live trend",
-   "breadcrumb_trend_settings":"Settings",
-   "breadcrumb_shipping":"Shipping",
-   "breadcrumb_recipients":"Fault message recipients",
-   "breadcrumb_generel_settings":"General",
-   "breadcrumb_shares":"Manage access rights",
-   "breadcrumb_jobs":"Firmware updates",
-   "breadcrumb_changelog":"Change log",
-   "breadcrumb_eventlog":"Event log",
-   "breadcrumb_system_delete":"Delete",
-   "breadcrumb_overview_general_settings":"General",
-   "breadcrumb_overview_shares":"Manage access rights",
-   "breadcrumb_overview_jobs":"Firmware updates",
-   "breadcrumb_overview_changelog":"Change log",
-   "breadcrumb_overview_eventlog":"Event log",
-   "breadcrumb_overview_delete_system":"Delete",
-   "breadcrumb_imprint":"Imprint",
-   "breadcrumb_terms_of_use":"Terms of Use",
-   "breadcrumb_data_security":"Data security",
-   "breadcrumb_dashboard":"Dashboard",
-   "breadcrumb_map":"Map",
-   "breadcrumb_admin_system_list":"System list",
-   "breadcrumb_admin_system_general":"General",
-   "breadcrumb_admin_system_shares":"Access rights",
-   "breadcrumb_admin_system_jobs":"Firmware updates",
-   "breadcrumb_admin_system_logs":"Server logs",
-   "breadcrumb_admin_firmware_update_list":"Firmware updates",
-   "breadcrumb_admin_firmware_storage_share":"Distribute firmware",
-   "breadcrumb_admin_firmware_storage_list":"Firmware file",
-   "admin.userlist.header.dateLastConnect":"Last connected",
-   "maintenance_dialog_title":"Maintenance",
-   "maintenance_dialog_close_button":"Close",
-   "breadcrumb_profil":"Account settings",
-   "breadcrumb_profil_edit":"General",
-   "breadcrumb_profil_change_password":"Change password",
-   "breadcrumb_profil_delete_account":"Delete account",
-   "timeSeriesReceiverPeriods.Daily":"Daily",
-   "errorList.serialnumber":"Serial number",
-   "errorList.level":"Error category",
-   "gatewaConnection.mailtitle":"System status",
-   "goto_login":"Go to login",
-   "idsrv_logout_title":"Log out",
-   "idsrv_logout_description":"Do you want to log out from the portal?",
-   "page.maintenance.title":"Maintenance",
-   "Der Benutzername existiert bereits. Bitte geben Sie einen anderen Namen ein":"The username already exists. Please enter another name",
-   "user-delete-already-started":"The deletion process has already been started",
-   "accountservice.createuserGroupNotPermitted":"In order to create a new group, you must have the right to release systems",
-   "accountservice.groupNameAlreadyExists":"A group with this name already exists",
-   "accountService.userIsNotAllowedToModifyGroup":"Unfortunately, you are not authorised to change the user group",
-   "user.grouplist.header.groupPathNames":"Group",
-   "user.grouplist.header.level":"Level",
-   "user.grouplist.header.members":"Members",
-   "user.group.memberlist.accessRights.manageUsers":"Manage group members",
-   "user.group.memberlist.accessRights.manageSystems":"Release systems",
-   "user.groupMemberList.header.groupPathNames":"Group",
-   "user.groupMemberList.header.name":"Member name",
-   "user.groupMemberList.header.accessRights":"Group rights",
-   "accountService.userIsNotAllowedToAddMemberToGroup":"Unfortunately, you are not authorised to add new users to the group",
-   "accountservice.userUnknown":"User not known",
-   "accountservice.userIsAlreadyWithinGroupHierarchy":"The user is already a member of the group hierarchy",
-   "accountService.addGroupMember.selectedAccessRightsConstraintViolation":"You cannot issue more rights to a member than you hold yourself",
-   "accountService.userIsNotAllowedToUpdateMemberOfGroup":"Unfortunately, you are not authorised to change the group member",
-   "accountService.userIsNotAllowedToUpdateOneSelf":"You cannot change your rights yourself",
-   "accountService.userHasNoAccessToGroup":"Unfortunately, you are not authorised for the group",
-   "admin.maintenance.jobs.header.id":"ID",
-   "admin.maintenance.jobs.header.starttime":"Begin",
-   "admin.maintenance.jobs.header.endtime":"End",
-   "admin.maintenance.jobs.header.estimated.endtime":"Estimated end",
-   "admin.maintenance.jobs.header.isactive":"Active",
-   "admin.maintenance.jobs.header.logoutafterMin":"Logout time [min]",
-   "admin.maintenance.jobs.header.message.text.id":"Text ID",
-   "admin.maintenanceJobs.anotherJobAlreadyActivatedError":"Maintenance is already running",
-   "admin.maintenanceJobs.jobAlreadyFinishedError":"Maintenance has been completed and can no longer be changed",
-   "ModbusTcp":"Modbus TCP",
-   "ModbusRtu":"Modbus RTU",
-   "ComponentService.ComponentWithAddressAlreadyExists":"A device with this address already exists",
-   "ComponentService.ComponentWithSerialAlreadyExists":"The serial number has already been issued",
-   "addNewSystem.errorNoGroupFoundForUser":"You have to be a member of a group in order to add systems",
-   "addNewSystem.errorNotPermitted":"Unfortunately, you are not authorised to add a new system",
-   "createSystemShareNoPermitted":"Unfortunately, you are not authorised to carry out a release",
-   "createSystemShare.errorGroupNotFound":"Unfortunately, there is no group with this name",
-   "createSystemShare.errorShareAlreadyExist":"A release for this group already exists",
-   "createSystemShare.errorNotPermitted":"Unfortunately, you are not authorised to carry out the release",
-   "updateSystem.notPermitted":"Unfortunately, you are not authorised to change the system data",
-   "gateway-delete-already-started":"The deletion process has already been started",
-   "deleteSystemAsOwner.errorNotPermitted":"Unfortunately, you are not authorised to delete the system",
-   "user.group.systemShare.header.groupPathNames":"Group",
-   "user.group.systemShare.header.systemName":"System name",
-   "deleteUserGroupMember.userIsNotAllowedToDelete":"Unfortunately, you are not authorised to delete the group member",
-   "deleteUserGroup.userIsNotAllowedToDeleteGroup":"Unfortunately, you are not authorised to delete the group",
-   "deleteUserGroup.ErrorSystemAsOwnerExists":"The group \u0027{{0}}\u0027 cannot be deleted as system \u0027{{1}}\u0027 of the group is still assigned as owner. First delete the system",
-   "deleteSystemShare.notAllowedToDeleteOneSelf":"You cannot delete this release because you are the owner of the system",
-   "deleteSystemShare.deleteNotPermitted":"Unfortunately, you are not authorised to delete the release",
-   "system.groupSharesTable.title":"Released groups",
-   "system.groupSharesTable.header.groupPathNames":"Group",
-   "system.groupMemberSharesTable.title":"Access rights of group members",
-   "readWriteAccess.read":"Read",
-   "readWriteAccess.write":"Write only",
-   "readWriteAccess.readWrite":"Write",
-   "system.groupMemberSharesTable.header.groupPathNames":"Group",
-   "system.groupMemberSharesTable.header.userNameAlias":"Member name",
-   "system.groupMemberSharesTable.header.readWriteAccess":"Read/write",
-   "system.groupMemberSharesTable.header.role":"Role",
-   "updateSystemShareUserAccessRightNotPermitted":"Unfortunately, you are not authorised to adapt the access rights",
-   "admin_gateway_devices":"Devices",
-   "admin_gateway_redirects":"Redirect",
-   "admin_gateway_device_edit_dialog_tooltip":"Edit",
-   "admin_gateway_device_delete_dialog_tooltip":"Delete",
-   "admin_gateway_device_delete_dialog_message":"Do you really want to delete this device?",
-   "admin_gateway_device_edit_dialog_title":"Edit device",
-   "admin.userlist.settings.tooltip":"Further settings",
-   "admin_user_list_edit_user_profile":"User profile",
-   "admin_tab_title_system_shares_by_user":"Systems",
-   "admin-system-shares-by-user-details-tooltip":"To the plant",
-   "admin_user_delete_dialog_title":"Do you really want to delete this profile?",
-   "profile_section_delete_local_storage_confirmed":"The settings have been successfully reset",
-   "maintenance_dialog_logout_duration_estimated_endtime":"The maintenance work is expected to last until {{0}}. You will be {{1}} logged out.  ",
-   "maintenance_dialog_logout_duration":"You will be {{0}} logged out.",
-   "map.alerts_count":"Number of fault messages",
-   "map.to_alerts":"Go to fault messages",
-   "usergroups.createNewGroup.tooltip":"Create new subordinate group",
-   "usergroups.delete.tooltip":"Delete user group",
-   "usergroups.settings.tooltip":"Go to settings",
-   "usergroups.deleteDescandent.message":"Do you really want to delete the selected user group including all system accesses? Attention: Subordinate groups exist, which will also be deleted.",
-   "usergroups.delete.message":"Do you really want to delete the selected user group including all system accesses?",
-   "usergroups.delete.title":"Delete group?",
-   "user_group_general":"Settings",
-   "user_group_users":"Members",
-   "user_group_system_shares":"Systems",
-   "usergroups.delete.share.tooltip":"Delete release",
-   "usergroups.delete.shares.title":"Delete release?",
-   "usergroups.delete.shares.message":"Do you really want to delete the release for this group? Attention: The releases of subordinate groups may also be deleted.",
-   "usergroups.add.user.tooltip":"Add new member",
-   "usergroups.delete.user.tooltip":"Delete group member",
-   "usergroups.edit.user.tooltip":"Adjust rights",
-   "usergroups.delete.user.title":"Delete member?",
-   "usergroups.delete.user.message":"Do you really want to delete the group member?",
-   "change_parameter_dialog_message":"This parameter is password-protected. Please enter the password at {{0}}.",
-   "usergroup.share.memberEdit.tooltip":"Adapt access rights",
-   "usergroup.share.delete.tooltip":"Withdraw release for group",
-   "usergroups.deleteDescendants.share.message":"Do you really want to delete the release for this group? Attention: The releases of the subordinate groups will also be deleted.",
-   "usergroups.delete.share.message":"Do you really want to delete the release for this group?",
-   "usergroups.delete.share.title":"Withdraw release for group?",
-   "addGroupShareForm.emptyGroupList":"No groups available for selection. Please first create a new group.",
-   "system_details_shares_add_max_receiver_reached":"The maximum number of recipients has already been set up.",
-   "no_parameter_selected":" ",
-   "breadcrumb_general_settings":"General",
-   "breadcrumb_admin_maintenance":"Maintenance orders",
-   "breadcrumb_admin_system_devices":"Devices",
-   "breadcrumb_admin_system_redirects":"Redirect",
-   "breadcrumb_admin_system_shares_by_user":"Systems",
-   "breadcrumb_admin_edit_user_profile":"User profile",
-   "breadcrumb_admin_edit_user_system_quota":"Own systems",
-   "breadcrumb_user_groups":"User groups",
-   "breadcrumb_user_management_user_access":"User rights",
-   "breadcrumb_user_groups_settings":"Settings",
-   "breadcrumb_user_groups_users":"Members",
-   "breadcrumb_user_groups_system-shares":"Systems",
-   "nav_user_access_settings":"User administration",
-   "nav_user_groups_list":"User groups",
-   "nav_user_access_rights":"User rights",
-   "nav_maintenance":"Maintenance orders",
-   "admin.gateway.details.info.unlock":"Unlock",
-   "admin.gateway.details.info.reset.certificate":"Reset certificate",
-   "admin.gateway.details.info.cut.connection":"Cut connection",
-   "admin.gateway.details.info.delete.gateway":"Delete system",
-   "admin.gateway.details.info.delete.refresh":"Refresh",
-   "admin.user.details.delete":"Delete user",
-   "admin.user.details.refresh":"Refresh",
-   "profile_section_delete_local_storage":"Reset website settings",
-   "min_value":"Min",
-   "max_value":"Max",
-   "component_visualization_add_button":"Add",
-   "change_parameter_dialog_header":"Security query",
-   "change_parameter_dialog_btn_cancel":"Cancel",
-   "change_parameter_dialog_btn_save":"Yes, I want to perform this function",
-   "no_gateways_cant_add_new_gateways":"No systems have been set up for you as yet. Please contact your Sopra partner or Sopra AG.",
-   "system_overview_devices_edit_parameter_min_error":"The value is below the valid range",
-   "system_overview_devices_edit_parameter_max_error":"The value is above the valid range",
-   "timepicker_ok_button":"Accept",
-   "timepicker_close_button":"Cancel",
-   "L\u00FCftung":"Ventilation",
-   "Ventilation":"Ventilation",
-   "ventilation level":"ventilation level",
-   "regle la ventilation":"regulates ventilation",
-   "Feuchteschutz":"Moisture protection",
-   "feuchte schutz":"Moisture protection",
-   "Absence":"Absence",
-   "Reduzierte L\u00FCftung":"Reduced ventilation",
-   "Reduziert L\u00FCftung":"Reduces ventilation",
-   "Low":"low",
-   "nenn l\u00FCftung":"nominal ventilation",
-   "nennen l\u00FCftung":"name ventilation",
-   "Nennl\u00FCftung":"nominal ventilation",
-   "Medium":"Medium",
-   "Intensivl\u00FCftung":"Intensive ventilation",
-   "Boost":"Boost",
-   "Surventilation":"Over-ventilation",
-   "ventilation mode":"ventilation mode",
-   "mode":"mode",
-   "Fete":"Fete",
-   "Nachtk\u00FChlung":"Night cooling",
-   "Nacht k\u00FChlung":"Night cooling",
-   "Night cooling":"Night cooling",
-   "Night calling":"Night calling",
-   "Refroidissement nocturne":"Night cooling",
-   "Holiday":"Holiday",
-   "Vacances":"Holiday",
-   "Automatikl\u00FCftung":"Automatic ventilation",
-   "Automatik l\u00FCftung":"Automatic ventilation",
-   "Auto mode":"Auto mode",
-   "Mode automatique":"Auto mode",
-   "Flair 200":"Flair 200",
-   "Flair 225":"Flair 225",
-   "Flair 450":"Flair 450",
-   "Flair 600":"Flair 600",
-   "Internal  Wifi Module":"Internal  Wifi Module",
-   "Internal Wifi Module":"Internal Wifi Module",
-   "gateway_add_dialog_serialnumber_max_length":"Length restrictions apply",
-   "gateway_edit_name_required":"Name required",
-   "gateway_edit_name_max_length":"Length restrictions apply",
-   "gateway_edit_street_max_length":"Length restrictions apply",
-   "gateway_edit_streetno_max_length":"Length restrictions apply",
-   "gateway_edit_zipCode_max_length":"Length restrictions apply",
-   "gateway_edit_city_max_length":"Length restrictions apply",
-   "gateway_edit_country_title":"Country",
-   "gateway_edit_country_required":"Country required",
-   "submitButton":"Save",
-   "cancelButton":"Cancel",
-   "addGroupShareForm.title":"System release",
-   "addGroupShareForm.groupLabel":"Group",
-   "addGroupShareForm.groupRequiredMatch":"Please select a valid entry",
-   "user_group_edit_description":"Enter the data of the user group here",
-   "user_group_edit_dialog_created_by":"Created by",
-   "user_group_add_dialog_group_name":"Group name",
-   "user_group_add_dialog_groupname_required":"A group name must be stated",
-   "user_group_add_dialog_groupname_max_length":"Maximum length exceeded",
-   "user_group_add_dialog_customer_number":"Customer number",
-   "user_group_add_dialog_customer_number_max_length":"Maximum length exceeded",
-   "user_group_add_dialog_location_header":"Address",
-   "user_group_add_dialog_street":"Street",
-   "user_group_add_dialog_street_max_length":"Street name is too long",
-   "user_group_add_dialog_zipCode":"Zip code",
-   "user_group_add_dialog_zipCode_max_length":"Zip code is too long",
-   "user_group_add_dialog_city":"City",
-   "user_group_add_dialog_city_max_length":"City name is too long",
-   "user_group_add_dialog_country":"Country",
-   "user_group_add_dialog_description":"Create new user group",
-   "user_group_add_member_dialog_header":"Add new member to group \u0027{{0}}\u0027",
-   "user_group_users_add_dialog_userName":"Email",
-   "user_group_users_add_dialog_email_required":"An email address must be stated",
-   "user_group_users_add_dialog_email_max_length":"The email address is too long",
-   "user_group_users_add_dialog_email_unvalid":"Email address invalid",
-   "user_group_users_add_dialog_role":"Group rights",
-   "user_group_edit_member_dialog_header":"Adjust group rights of member",
-   "user_group_users_edit_dialog_role":"Group rights",
-   "editSystemShareUserAccessRightHeader":"Adapt access rights",
-   "editSystemShareUserAccessRight.readWriteAccess":"Write access",
-   "editSystemShareUserAccessRight.readWriteAccess.read":"Read",
-   "editSystemShareUserAccessRight.readWriteAccess.readWrite":"Write",
-   "admin.gateway.details.info.serialNumber":"Serial number",
-   "admin.gateway.details.info.accessCode":"Release code",
-   "admin.gateway.details.info.localDateTimeCalculated":"Gateway time (calculated)",
-   "admin.gateway.details.info.ianaTimeZone":"Time zone",
-   "admin.gateway.details.info.gatewayType":"Type",
-   "admin.gateway.details.info.hardwareVersion":"Hardware version",
-   "admin.gateway.details.info.softwareVersion":"Software version",
-   "admin.gateway.details.info.osVersion":"OS-Version",
-   "admin.gateway.details.info.hardwareInfo":"Hardware-Info",
-   "admin.gateway.details.info.osInfo":"OS-Info",
-   "admin.gateway.details.info.remoteEndpoint":"Public IP",
-   "admin.gateway.details.info.localEndpoint":"Local IP",
-   "admin.gateway.details.info.createdOn":"Created on",
-   "admin.gateway.details.info.lastDisconnect":"Last connection termination",
-   "admin.gateway.details.info.connectCounter":"Total number of connections",
-   "admin.gateway.details.info.disconnectsLast24Hour":"Connection terminations within the last 24 hours",
-   "admin.gateway.details.info.locationHeader":"Location",
-   "admin.gateway.details.info.street":"Street",
-   "admin.gateway.details.info.streetNumber":"Number",
-   "admin.gateway.details.info.twoLetterCountryCode":"Country",
-   "admin.gateway.details.info.zipCode":"Zip code",
-   "admin.gateway.details.info.city":"City",
-   "admin_gateway_redirects_enabled":"Active",
-   "dynamic_form_field_required":"The input field must not be empty",
-   "admin_gateway_redirects_host_name":"Host name",
-   "admin_gateway_redirects_host_name_max_length":"The host name is too long",
-   "admin_gateway_redirects_port":"Port",
-   "universal.minValidator":"The entered value is too small",
-   "universal.maxValidator":"The entered value is too large",
-   "admin_maintenance_add_header":"Add maintenance order",
-   "admin_maintenance_estimated_end_date":"Estimated end date",
-   "admin_maintenance_estimated_end_time":"Estimated end time",
-   "admin_maintenance_message_text_id":"Existing text ID from Excel file",
-   "admin_maintenance_message_text_id_required":"A text ID must be stated",
-   "admin_maintenance_is_active":"Active",
-   "admin_maintenance_logout_after_min":"Logout time [min]",
-   "admin_maintenance_edit_header":"Adapt maintenance order",
-   "admin.user.details.firstname":"First name",
-   "admin.user.details.surname":"Surname",
-   "admin.user.details.dateCreated":"Created on",
-   "admin.user.details.userRole":"Role",
-   "admin.user.details.adressHeader":"Address",
-   "admin.user.details.companyName":"Company",
-   "admin.user.details.customerNumber":"Client number",
-   "admin.user.details.streetName":"Street",
-   "admin.user.details.streetNumber":"No.",
-   "admin.user.details.zipCode":"Zip code",
-   "admin.user.details.twoLetterCountryCode":"Country",
-   "admin_gateway_device_add_dialog_title":"Add device",
-   "component_new_interface_title":"Interface",
-   "component_new_interface_required":"Interface required",
-   "component_new_protocol_title":"Protocol",
-   "component_new_protocol_required":"Protocol required",
-   "component_new_device_type_title":"Device type",
-   "component_new_device_type_required":"Device required",
-   "component_new_slave_adddress":"Slave address",
-   "component_new_slaveAddress_required":"Slave address required",
-   "component_new_slaveAddress_min":"The entered value is too small",
-   "component_new_slaveAddress_max":"The entered value is too large",
-   "component_new_ip_address":"IP address",
-   "component_new_ip_address_required":"IP address required",
-   "component_new_ip_address_unvalid":"IP address invalid",
-   "component_new_port":"Port",
-   "component_new_port_required":"Port required",
-   "component_new_port_min":"The entered value is too small",
-   "component_new_port_max":"The entered value is too large",
-   "admin.userlist.header.state":"Status",
-   "admin.userlist.header.groupNames":"Groups",
-   "adminSystemSharesByUser.systemNameHeader":"System name",
-   "adminSystemSharesByUser.serialNumberHeader":"Serial number gateway",
-   "adminSystemSharesByUser.ownerGroupPathHeader":"Owner",
-   "adminSystemSharesByUser.groupPathHeader":"Access via group",
-   "adminSystemSharesByUser.userRoleHeader":"Access with role",
-   "adminSystemSharesByUser.readWriteAccessHeader":"Read/write",
-   "adminGroupMemberSharesByGateway.groupPathNames":"Group",
-   "adminGroupMemberSharesByGateway.userNameAlias":"Member",
-   "adminGroupMemberSharesByGateway.userRoleHeader":"Access with role",
-   "adminGroupMemberSharesByGateway.readWriteAccessHeader":"Read/write",
-   "admin_system_list_header_systems_disconnect":"Last disconnected",
-   "componentList.Id":"ID",
-   "componentList.DeviceIndex":"Index",
-   "componentList.SoftwareVersion":"Software",
-   "componentList.TemplateVersion":"DP-Ver.",
-   "componentList.LastConnect":"Last connected",
-   "componentList.LastDisconnect":"Last disconnected",
-   "componentList.State":"Status",
-   "componentList.NotConnectedState":"Not connected",
-   "componentList.ConnectedState":"Connected",
-   "componentList.InterfaceName":"Interface",
-   "componentList.Protocol":"Protocol",
-   "componentList.Address":"Address",
-   "Imbalance fireplace":"Imbalance fireplace",
-   "Test mode":"Test mode",
-   "Status externes Nachheitzregister":"Status of the external post-heater",
-   "Stufe 4":"Speed 4",
-   "min":"min",
-   "admin_system_list_header_systems_group_name":"owner",
-   "componentList.Stale":"The unit is probably no longer part of the installation",
-   "gateway-visualization-not-available":"The system cannot be opened because the gateway password has been changed. You must first unlock the system",
-   "systemList.activeAlertCount":"Messages",
-   "systemList.serialNumber":"Serial number",
-   "systemList.stateOn":"System is connected",
-   "systemList.stateOff":"System is disconnected",
-   "systemList.stateLocked":"System is locked",
-   "forgotpassword_please_confirm_account_first":"Please complete the current registration for this mail address first. Log in to do so.",
-   "DeleteUserFailed.UserGroupContainsOtherAdmins":"The account cannot be deleted because the users \u0027{{1}}\u0027 still have access to the installation \u0027{{0}}\u0027. If you intend to delete the installation from the system, first remove the other users from the group \u0027{{2}}\u0027. If you want the other users to continue to have access to the system, have your name deleted from the group \u0027{{2}}\u0027.",
-   "DeleteUserFailed.SubGroupsExists":"First delete the user groups \u0027{{0}}\u0027.",
-   "user_group_add_dialog_is_public":"Is public?",
-   "user.grouplist.header.isPublic":"Public",
-   "add_systemshare_by_selection":"Service",
-   "add_systemshare_by_textinput":"Other",
-   "contactAddressList.contactAddressKind.Mail":"E-mail address",
-   "gateway_device_receiver_email_requiredMatch":"Select an address from the list or enter a valid e-mail address",
-   "gateway_device_delete_receiver_text":"Delete notification",
-   "gateway_device_edit_receiver_settings_text":"Clean filter",
-   "confirm_alert_receiver_dialog_content":"The confirmation is still pending. We have sent a mail with a confirmation link that you or the recipient must still activate in order to complete the setup.  Please also check the SPAM folder if the mail is not in your inbox.",
-   "confirm_alert_receiver_dialog_title":"Confirm notification",
-   "tooltipConfirmAlertReceiver":"Confirm notification",
-   "deleteAlertReceiverNotPermitted":"Unfortunately, you have no rectification to delete the notification.",
-   "updateAlertReceiverNotPermitted":"Unfortunately, you do not have the right to change the notification.",
-   "updateAlertCodeFilterSettingsNotPermitted":"Unfortunately, you do not have the option to change the filter settings.",
-   "createAlertReceiverNotPermitted":"Unfortunately, you do not have the option to create a new notification.",
-   "createAlertReceiverAddressNotAllowed":"The address is not allowed",
-   "confirmMailAddress.success":"The confirmation of the address was successful. You can now close this page",
-   "confirmMailAddress.alreadyConfirmed":"The confirmation of the address was successful. You can now close this page",
-   "confirmMailAddress.error":"Unfortunately, the address could not be confirmed because the link in the email is no longer valid. ",
-   "confirmMailAddress.loginButtonText":"To the login",
-   "confirmAlertReceiver.success":"The notification has been set up successfully. You can now close this page",
-   "confirmAlertReceiver.alreadyConfirmed":"The notification has been successfully set up. You can now close this page",
-   "confirmAlertReceiver.error":"The notification could not be set up finally because the link in the email is no longer valid",
-   "confirmAlertReceiver.loginButtonText":"To the login",
-   "alertReceiverVerifyMailByLink.mailBody":"The user {{0}} has set up a notification with your mail address for the installation \u0027{{1}}\u0027. Please click on the link below to receive the latest notifications for the facility in the future. If you do not wish to receive any messages, you can ignore the mail.",
-   "alertReceiverVerifyMailByLink.buttonText":"Confirm notifications",
-   "mailLinkUrlFallback":"If the button does not work, please copy the following URL into your browser\u0027s address bar:",
-   "contactAddressVerifyMailByLink.mailBody":"Please confirm that you are the owner of the email address {{0}} by clicking on the link below.",
-   "contactAddressVerifyMailByLink.buttonText":"Confirm mail address",
-   "alertReceiverVerifyByLink.subject":"Verification of your identity",
-   "contactAddressVerifyMailByLink.subject":"Verification of your identity",
-   "contact_address_edit_dialog_title":"Change address",
-   "contactAddress_add_dialog_email_required":"Enter a mail address",
-   "contactAddress_add_dialog_email_invalid":"Enter a valid mail address",
-   "contactAddress_add_dialog.language":"Language",
-   "contactAddress_add_dialog.title":"Enter new address",
-   "contactAddressList.addressValue":"Address",
-   "contactAddressList.cultureInfoCode":"Language",
-   "editProfileGeneral.mailAdressInfo":"Here you can change your login address. You can add new addresses on the \u0022Addresses\u0022 tab. A new address is only available for selection here after it has been confirmed.",
-   "profile_email_edit_askConfirmation_title":"Changing the login address",
-   "profile_email_edit_askConfirmation_content":"Please log in with your new address the next time you log in. Login with the previous address is no longer possible.",
-   "confirmation_dialog_btn_no":"Cancel",
-   "confirmation_dialog_btn_yes":"Change login address",
-   "profile_general_options_expert_role_label":"Request installer access",
-   "profile_address_list":"Addresses",
-   "contact_address_confirmation_code_send_success":"The address will only be activated after we have verified the identity of the address. We have sent a mail with a confirmation link to the recipient for this purpose.",
-   "contact_address_edit_success":"The changes were adopted",
-   "contact_address_delete_success":"The address has been deleted",
-   "alertCreateContactAddressDestinationAlreadyExist":"The address is already in use",
-   "tooltipEditContactAddress":"Change address",
-   "tooltipDeleteContactAddress":"Delete address",
-   "tooltipConfirmMailAddress":"Confirm address",
-   "contact_address_confirmation_title":"Confirm address",
-   "contact_address_confirmation_code_send_email":"The confirmation of the new address is still pending. We have sent you an email with a confirmation link that you still need to activate to complete the setup. You can resend the confirmation email. The previous confirmation mail will then become invalid. Please also check your SPAM folder if you do not find the mail in your inbox.",
-   "contact_address_confirmation_code_send_again_success":"We have sent a confirmation email again. Please check the inbox",
-   "contactAddress.delete.title":"Confirm delete",
-   "contactAddress.delete.content_p1":"All notifications set up for this address will also be deleted. Do you really want to delete?",
-   "contact_address_delete_btn_no":"cancel",
-   "contact_address_delete_btn_yes":"Delete",
-   "contact_address_confirmation_code_send_again":"Send confirmation email again",
-   "alertReceivers.emptyTable":"Add a first notification",
-   "alertReceivers.description":"Enter your e-mail address to receive the latest news about your plant.",
-   "alerts.emptyTable":"There are currently no reports",
-   "alerts.description":"Overview of active messages and message history",
-   "profile_general_clearStorage_info":"Here you can reset your settings for the website, such as saved filter settings.",
-   "breadcrumb_profil_address_list":"Addresses",
-   "breadcrumb_profil_edit_expert_role":"Request installer access",
-   "addressList.description":"Here you can create additional addresses that you can use for notifications of messages or time series.",
-   "addressListUserGroup.description":"Here you can create additional addresses for the group. These can then be used for notification of current messages or for time series dispatch.",
-   "contactAddress.delete.content_p2":"The following notifications are deleted:",
-   "contact_address_delete_dependet_alertReciever":"Messages from the system",
-   "contact_address_delete_depenedent_timeReceiver":"Time series dispatch of the system",
-   "addAlertReceiver.autoCompleteList.info":"The addresses of all group members are available for selection here. However, you can also enter a different e-mail address",
-   "createContactAddress.mailAddressAlreadyAdded":"You have already added this address",
-   "createContactAddress.mailAddressAlreadyUsedByAnother":"This address is already in use by another user",
-   "deleteContactAddress.deleteOfAccountAddressIsNotAllowed":"This address is your login address and cannot be deleted",
-   "breadcrumb_user_groups_address_list":"Addresses",
-   "addressList.isAccountAddress":"This is your login address",
-   "createOrUpdateTimeSeriesReceiver.addressNotAllowed":"The address is allowed",
-   "createOrUpdateTimeSeriesReceiver.addressAlreadyExist":"The address is already in use",
-   "createOrUpdateTimeSeriesReceiver.maxReceiverReached":"You can set up a maximum of {{0}} notifications for the group \u0027{{1}}\u0027. First delete another notification",
-   "createTimeSeriesReceiver.notPermitted":"Unfortunately, you do not have the option to create a new notification.",
-   "updateTimeSeriesReceiver.notPermitted":"Unfortunately, you do not have the right to change the notification.",
-   "deleteTimeSeriesReceiver.notPermitted":"Unfortunately, you have no rectification to delete the notification.",
-   "sendTimeSeriesesAsCsv.receiverIsNotConfirmed":"The address must first be confirmed. We have sent you a mail with a confirmation link for this purpose",
-   "timeSeriesReceivers.emptyTable":"Add a first notification",
-   "timeSeriesReceivers.description":"Enter your e-mail address to receive regular time series on your system.",
-   "timeSeriesReceivers.lastSendAt.header":"Last post on",
-   "timeSeriesReceivers.nextSendAt.header":"Next post on",
-   "addTimeSeriesReceiver.header":"New time series transmission",
-   "editTimeSeriesReceiver.header":"Change time series dispatch",
-   "addTimeSeriesReceiver.contactAddress":"E-mail address",
-   "addTimeSeriesReceiver.autoCompleteList.info":"The addresses of all group members are available for selection here. However, you can also enter a different e-mail address",
-   "addTimeSeriesReceiver.timePeriod":"Interval",
-   "addTimeSeriesReceiver.timePeriod.required":"Required interval",
-   "timeseriesReceiver.editTooltip":"Change time series dispatch",
-   "timeseriesReceiver.deleteTooltip":"Delete time series dispatch",
-   "timeseriesReceiver.adhocSendTooltip":"Send time series now",
-   "confirm_timeseries_receiver_dialog_title":"Confirm time series dispatch",
-   "confirm_timeseries_receiver_dialog_content":"The confirmation is still pending. We have sent a mail with a confirmation link that you or the recipient must still activate in order to complete the setup.  Please also check the SPAM folder if the mail is not in your inbox.",
-   "timeseriesReceiver.confirmReceiverTooltip":"Confirm time series dispatch",
-   "timeseriesReceiverVerifyMailByLink.title":"Confirm time series dispatch",
-   "timeseriesReceiverVerifyMailByLink.mailBody":"The user {{0}} has set up a time series dispatch for the installation \u0027{{1}}\u0027 with your mail address. Please click on the link below to receive time series of the installation by mail in the future. If you do not wish to receive time series, you can ignore the mail.",
-   "timeseriesReceiverVerifyMailByLink.buttonText":"Confirm time series dispatch",
-   "timeseriesReceiverVerifyByLink.subject":"Verification of your identity",
-   "confirmTimeseriesReceiver.loginButtonText":"To the login",
-   "confirmTimeseriesReceiver.alreadyConfirmed":"The time series dispatch has been set up successfully. You can now close this page",
-   "confirmTimeseriesReceiver.success":"The time series dispatch has been set up successfully. You can now close this page",
-   "confirmTimeseriesReceiver.error":"The time series dispatch could not be set up finally because the link in the e-mail is no longer valid",
-   "sendTimeSeriesesAsCsvNotAllowedForGroupAddresses":"No group addresses can be used for the time series dispatch",
-   "unlockSystemForm.submitButton":"Unlock",
-   "unlockSystemForm.cancelButton":"cancel",
-   "unlockSystemForm.header":"Unlock gateway",
-   "unlockSystemForm.description":"If you change the password on the ventilation system, access is blocked as a precaution. Enter the new password to be able to access the system again.",
-   "unlockSystemForm.serialNumber":"Serial number",
-   "unlockSystemForm.serialNumber.required":"Serial number required",
-   "unlockSystemForm.serialNumber.maxLength":"Serial number too long",
-   "unlockSystemForm.password":"Password",
-   "unlockSystemForm.password.required":"Password is required",
-   "unlockSystemPassword.onlyOwnerCanUnlock":"Unfortunately, you are not authorised to unlock the system. Please contact the owner of the system",
-   "admin_system_list_header_systems_software_version":"Soft-Vers.",
-   "nav_user_group":"User group",
-   "breadcrumb_admin_component_list":"Devices",
-   "nav_admin_devices_list":"Devices",
-   "adminDeviceList.Id":"Id",
-   "adminDeviceList.GatewayName":"Gateway",
-   "adminDeviceList.Name":"Name device",
-   "adminDeviceList.SerialNumber":"Serial number",
-   "adminDeviceList.TypeName":"Type device",
-   "adminDeviceList.SoftwareVersion":"Version",
-   "adminDeviceList.LastConnect":"Last connected",
-   "adminDeviceList.LastDisconnect":"Last disconnected",
-   "adminDeviceList.State":"Status",
-   "adminDeviceList.NotConnectedState":"Disconnected",
-   "adminDeviceList.ConnectedState":"Connected",
-   "adminDeviceList.GatewaySerialNumber":"GW Gerial number",
-   "default_cancel_button":"Cancel",
-   "add_new_system":"Add system",
-   "adminDeviceList.Stale":"The unit is probably no longer part of the installation",
-   "maintenance.defaultText":"There will be a maintenance of the portal shortly. We will be back for you soon. Thank you for your patience.",
-   "user.grouplist.header.id":"ID",
-   "device.deleteDialog.title":"Delete device",
-   "device.deleteDialog.message":"The unit no longer appears to be part of the installation. If you delete the unit, all stored data about the unit will be deleted, e.g. recorded time series and change log. Do you really want to delete?",
-   "gateway_add_dialog_usergroup":"User group",
-   "gateway_add_dialog_usergroup_required":"Select user group",
-   "accountService.updateProfile.newMailNotConfirmed":"The new login address has not yet been confirmed! We have sent you a mail with a confirmation link. Please activate the link first and then try again.",
-   "account_mail_changed_mailHeader":"New login address",
-   "account_mail_changed_mailContent":"You have changed the email address of your account. Please log in with the email address \u0027{{0}}\u0027 from now on. You can no longer log in with the previous address \u0027{{1}}\u0027.",
-   "account_mail_changed_mailSubject":"New login address",
-   "alertReceiverVerifyMailByLink.title":"Activate notifications",
-   "contactAddressVerifyMailByLink.title":"Confirm address",
-   "createUserContactAddress.mailAddressAlreadyAdded":"You have already added this address",
-   "createUserContactAddress.mailAddressAlreadyUsedByAnother":"This address is already being used by another user",
-   "adminSoftwareRolloutGatewayList.gatewayAlreadyStarted":"The gateway cannot be deselected because it has already been started.",
-   "adminSoftwareRolloutGatewayList.gatewayHasError":"The gateway has an error.",
-   "adminSoftwareRolloutGatewayList.gatewayFinished":"The gateway has already carried out the update and can no longer be removed.",
-   "createOrUpdateAlertReceiverAddressNotAllowed":"You do not have permission to create or edit the notification.",
-   "sendAdhocTimeSeriesReceiver.notPermitted":"Unfortunately, you do not have the authorisation to send",
-   "singleAlertNotificationSubject":"Brink Home Alarm Notification",
-   "admin-devices-list-btn-details":"To the system",
-   "admin.gatewayList.details.softwareRollouts":"SW-Rollouts",
-   "adminSoftwareRolloutList.start.tooltip":"Start rollout",
-   "adminSoftwareRolloutList.pause.tooltip":"Pause rollout",
-   "adminSoftwareRolloutList.end.tooltip":"Finish rollout",
-   "adminSoftwareRolloutList.goToDetails.tooltip":"Gateways",
-   "adminSoftwareRolloutList.comment.tooltip":"Comment",
-   "map.to_gateway_general":"Go to system",
-   "gateway_software_rollouts":"SW-Rollouts",
-   "breadcrumb_system_software_rollouts":"SW-Rollouts",
-   "breadcrumb_admin_system_software_rollouts":"SW-Rollouts",
-   "breadcrumb_admin_software_rollout_list":"SW-Rollouts",
-   "breadcrumb_admin_software_rollout_details":"Details",
-   "profile_expertRole_success":"Application has been forwarded. You will receive an email as soon as the application has been processed.",
-   "nav_software_rollouts":"FW-Rollouts",
-   "no_gateways_found":"No device found",
-   "gateways_favorite_title":"Favourite",
-   "gateway_name_title":"System name",
-   "gateway_status_title":"Status",
-   "gateway_access_right_title":"Access authorisation",
-   "gateway_owner_title":"Owner",
-   "gateway_location_title":"Location",
-   "systemList.favoriteOn":"Favourite",
-   "systemList.favoriteOff":"No favourite",
-   "contactAddress_add_dialog_email_max_length":"Email address too long",
-   "gateway_device_receiver_subject__max_length":"Note the length of the subject",
-   "profile_contactaddress_required":"E-mail address is required",
-   "profile_max_length":"Note length",
-   "profile_cultureInfoCode_required":"Language required",
-   "breadcrumb_admin_expert_role_request":"Installer applications",
-   "adminExpertRequests.status":"Status",
-   "adminExpertRequests.companyName":"Company name",
-   "adminExpertRequests.email":"Email",
-   "adminExpertRequests.vatNumber":"Tax number",
-   "adminExpertRequests.phoneNumber":"Telephone",
-   "adminExpertRequests.customerNumber":"Customer number",
-   "adminExpertRequests.publicVisibleGroup":"My company should be visible to other users",
-   "adminExpertRequests.userGroupName":"Group name",
-   "adminExpertRequest.status.notActiveAlert":"The request cannot be processed because it is no longer active.",
-   "adminExpertRequest.approve.tooltip":"Approve request",
-   "adminExpertRequest.decline.tooltip":"Request cancelled",
-   "adminExpertRequest.profile.description":"This form is intended for installers and similar industry professionals. Fill out the form in order to register an installer group. After sending, the request will be reviewed by Brink. You\u2019ll receive a notification about the status of your application.",
-   "adminExpertRequest.profile.publicVisibleGroupInfo":"Other users can find your company and give you remote access.",
-   "admin.expertRoleRequest.approved.mailbody":"You have registered your company on Brink Home. You are now registered as a professional and can manage your own group settings.",
-   "admin.expertRoleRequest.declined.mailbody_p1":"We\u2019ve received a request from you for installer access for the Brink Home Portal.",
-   "admin.expertRoleRequest.declined.mailbody_p2":"This section is intended for installers and similar industry professionals. Because we could not determine this for your account, your account type will remain unchanged.",
-   "admin.expertRoleRequest.approved.mailHeader":"Request installer access approved",
-   "admin.expertRoleRequest.declined.mailHeader":"Request installer access denied",
-   "profile_expertRole_alreadyExpert_error":"You are already an expert",
-   "user_requesting_expert_role_public_visible_group_text":"Visible to the public",
-   "user_requesting_expert_role_public_visible_group_true_text":"Yes",
-   "user_requesting_expert_role_public_visible_group_false_text":"No",
-   "admin.expertRoleReqeustList.approved.success":"Request was successfully confirmed",
-   "admin.expertRoleReqeustList.declined.success":"Request rejected",
-   "nav_admin_expertRoleRequests":"Installer requests",
-   "adminExpertRequest.list.publicVisibleGroup":"Public",
-   "adminExpertRequest.delete.tooltip":"remove",
-   "adminExpertRequests.createdOn":"Created on",
-   "accountservice.expertRole.groupNameAlreadyExists":"An enquiry with this company name already exists.",
-   "accountservice.userIsAlreadyExpert":"User already has the expert role",
-   "adminService.addToExpertGroup.userHasSystemShares":"User has approvals for a system and therefore cannot be added to the expert group. Please remove the approval to be able to add the user to this group.",
-   "userGroupMembershipChanged.userGroupDeleted.mailHeader":"Group has been deleted",
-   "userGroupMembershipChanged.userGroupDeleted.mailtitle":"Group has been deleted",
-   "userGroupMembershipChanged.userGroupDeleted.mailbody":"The group {{0}} has been deleted.",
-   "userGroupMembershipChanged.removedFromUserGroup.mailHeader":"You\u2019ve left the group ",
-   "userGroupMembershipChanged.removedFromUserGroup.mailtitle":"You\u2019ve left the group ",
-   "userGroupMembershipChanged.removedFromUserGroup.mailbody":"You\u2019ve left the group {{0}}",
-   "userGroupMembershipChanged.addedToUserGroup.mailHeader":"Added to group",
-   "userGroupMembershipChanged.addedToUserGroup.mailtitle":"Added to group",
-   "userGroupMembershipChanged.addedToUserGroup.mailbody":"You\u2019ve been added to the group {{0}}.",
-   "adminExpertRequest.profile.alreadyExpertDescription":"You\u0027ve already expert rights.",
-   "add_systemshare_by_textinput.tooltip":"Add remote access for other account",
-   "add_systemshare_by_selection.tooltip":"Choose a professional from list",
-   "adminExpertRequest.goToUserGroup.tooltip":"Go to group",
-   "confirmUserGroupMembership.mailHeader":"Invitation to join {{0}}",
-   "confirmUserGroupMembership.mailtitle":"Invitation to join {{0}}",
-   "confirmUserGroupMembership.mailbody_p1":"You\u2019ve been invited to join {{0}}.",
-   "confirmUserGroupMembership.mailbody_p2":"Please use the link below to create an account and start using Brink Home.",
-   "confirmUserGroupMembership.mailbody_p3":"Please use the link below to accept the invitation.",
-   "adminService.emailEmpty":"Email must not be empty",
-   "adminService.notApprovedUserGroupMember.alreadyExists":"A registration request has already been sent to {{0}}.",
-   "notApprovedUserGroupMemeber.notRegistered":"User must still register to join the group",
-   "notApprovedUserGroupMemeber.userNotApproved":"User must still confirm membership",
-   "notApprovedUserGroupMember.emailAlreadySend":"User has already been added to the group, but still needs to confirm membership",
-   "notApprovedUserGroupMember.confirm.success":"The confirmation of the group membership was successful. You can now close this page",
-   "notApprovedUserGroupMember.confirm.failure":"Unfortunately, the group membership could not be confirmed. Please contact the administrator of the group.",
-   "confirmUserGroupMembership.buttonText":"Confirm",
-   "notApprovedUserGroupMember.loginButtonText":"To the login",
-   "notApprovedUserGroupMemeber.notRegistered.buttonText":"To the login",
-   "accountService.addNotRegisteredUserGroupMember.alreadyExists":"A user with this email has already been added to the group",
-   "adminExpertRequests.publicVisibleGroup.no":"No",
-   "adminExpertRequests.publicVisibleGroup.yes":"Yes",
-   "adminExpertRequests.status.notifications":"In progress",
-   "adminExpertRequests.status.done":"Approved",
-   "adminExpertRequests.status.close":"Declined",
-   "adminExpertRequests.status.schedule":"Out of date",
-   "adminExpertRequests.status.group_remove":"Group was deleted",
-   "confirmUserGroupMembership.mailtitle.mailtitle":"Invitation to join \u0027{{0}}",
-   "new_user_registration_backoffice_mail_subject":"Registration of a new user",
-   "expertRoleRequest.delete.isActiveAlert":"The selected request is still open and therefore cannot be deleted",
-   "expertRoleRequest.delete.isApprovedAlert":"The selected request is already confirmed and therefore cannot be deleted",
-   "parameterService.datalogNotFound":"No parameters found",
-   "dynamic_table_detail_checkbox":"Show details",
-   "deleteSystemShare.notAllowedToDeleteSystemOwner":"Release of the group of the owner of the installation cannot be deleted",
-   "admin_gateway_connection_history":"Connection History",
-   "adminGatewayConnectionHistory.event":"Event ",
-   "adminGatewayConnectionHistory.message":"Error text",
-   "adminGatewayConnectionHistory.timestamp":"Time ",
-   "adminGatewayConnectionHistory.event.connect":"Connect",
-   "adminGatewayConnectionHistory.event.invalidPassword":"Invalid password",
-   "adminGatewayConnectionHistory.event.retryWithNewDestination":"Retry with new destination",
-   "adminGatewayConnectionHistory.event.busy":"Busy",
-   "adminGatewayConnectionHistory.event.alreadyConnected":"Already connected",
-   "adminGatewayConnectionHistory.event.disabled":"Disabled",
-   "adminGatewayConnectionHistory.event.remoteDisconnect":"Remote disconnect ",
-   "adminGatewayConnectionHistory.event.keepAliveWithError":"Keep alive with error",
-   "adminGatewayConnectionHistory.event.unexptectedMessageType":"Unexpected message type",
-   "adminGatewayConnectionHistory.event.notSpecified":"Not specified",
-   "adminGatewayConnectionHistory.event.decryptionError":"Decryption error",
-   "adminGatewayConnectionHistory.event.messageBufferOverflow":"Message buffer overflow",
-   "adminGatewayConnectionHistory.event.readTimeout":"Read timeout",
-   "adminGatewayConnectionHistory.event.unsupportedMessageFormat":"Unsupported message format",
-   "adminGatewayConnectionHistory.event.systemConfigError":"System config error",
-   "adminGatewayConnectionHistory.event.responseTimeout":"Response timeout",
-   "adminGatewayConnectionHistory.event.serverCanceled":"Server canceled",
-   "adminGatewayConnectionHistory.event.clientCertMismatch":"Client certificate mismatch",
-   "adminGatewayConnectionHistory.event.unknownGatewayType":"Unknown gateway type",
-   "adminGatewayConnectionHistory.event.notRegistered":"Not registered",
-   "adminGatewayConnectionHistory.event.localDisconnect":"Local disconnect",
-   "nav_admin_gateways_connection_history":"Connection History",
-   "admin_gateways_connection_history ":"Connection History",
-   "adminGatewaysConnectionHistory.gatewayId":"Gateway Id",
-   "adminGatewaysConnectionHistory.event":"Event ",
-   "adminGatewaysConnectionHistory.message":"Error text",
-   "adminGatewaysConnectionHistory.timestamp":"Time ",
-   "adminGatewaysConnectionHistory.event.connect":"Connect",
-   "adminGatewaysConnectionHistory.event.invalidPassword":"Invalid password",
-   "adminGatewaysConnectionHistory.event.retryWithNewDestination":"Retry with new destination",
-   "adminGatewaysConnectionHistory.event.busy":"Busy",
-   "adminGatewaysConnectionHistory.event.alreadyConnected":"Already connected",
-   "adminGatewaysConnectionHistory.event.disabled":"Disabled",
-   "adminGatewaysConnectionHistory.event.remoteDisconnect":"Remote disconnect ",
-   "adminGatewaysConnectionHistory.event.keepAliveWithError":"Keep alive with error",
-   "adminGatewaysConnectionHistory.event.unexptectedMessageType":"Unexpected message type",
-   "adminGatewaysConnectionHistory.event.notSpecified":"Not specified",
-   "adminGatewaysConnectionHistory.event.decryptionError":"Decryption error",
-   "adminGatewaysConnectionHistory.event.messageBufferOverflow":"Message buffer overflow",
-   "adminGatewaysConnectionHistory.event.readTimeout":"Read timeout",
-   "adminGatewaysConnectionHistory.event.unsupportedMessageFormat":"Unsupported message format",
-   "adminGatewaysConnectionHistory.event.systemConfigError":"System config error",
-   "adminGatewaysConnectionHistory.event.responseTimeout":"Response timeout",
-   "adminGatewaysConnectionHistory.event.serverCanceled":"Server canceled",
-   "adminGatewaysConnectionHistory.event.clientCertMismatch":"Client certificate mismatch",
-   "adminGatewaysConnectionHistory.event.unknownGatewayType":"Unknown gateway type",
-   "adminGatewaysConnectionHistory.event.notRegistered":"Not registered",
-   "adminGatewaysConnectionHistory.event.localDisconnect":"Local disconnect",
-   "breadcrumb_admin_gateways_connection_history":"Connection History",
-   "adminGatewaysConnectionHistory.userGroupNames":"Groups",
-   "breadcrumb_admin_system_connection_history":"Connection history",
-   "addGroupShareBySelectionForm.title":"System release for a public installer or Brink service",
-   "addGroupShareBySelectionForm.groupLabel":"Name/Company/Installer",
-   "addGroupShareBySelectionForm.groupRequiredMatch":"Please select a valid entry",
-   "addGroupShareByTextInputForm.title":"System release for a private user",
-   "addGroupShareByTextInputForm.groupLabel":"E-mail or group name ",
-   "addGroupShareByTextInputForm.EmailOrGroupNameRequired":"An email address or group name must be stated",
-   "addGroupShareByTextInputForm.EmailOrGroupNameMaxLength":"The email address or group name is too long",
-   "user.group.systemShare.header.gatewayId":"Id",
-   "user.group.systemShare.header.ownerGroupName":"Owner",
-   "usergroups.goTo.system.tooltip":"To the installation",
-   "usergroups.goTo.user.tooltip":"To the user",
-   "breadcrumb_admin_user_groups":"User groups",
-   "deleteSystemShare.ownerGroup.deleteNotPermitted":"You cannot delete this release because the selected group is the owner of the installation.",
-   "adminAddShareToUserGroup.systemName":"Attachment",
-   "adminAddShareToUserGroup.systemName.required":"Select an attachment from the list",
-   "adminAddShareToUserGroup.title":"Add system release",
-   "adminAddShareToSystem.title":"Add system release",
-   "adminAddShareToSystem.userGroupName":"User groups",
-   "adminAddShareToSystem.usergroup.required":"Select a user group from the list",
-   "admin_gateway_share_delete_dialog_tooltip":"Delete release",
-   "admin_gateway_share_delete_dialog_message":"Do you really want to delete this group\u0027s release?"
-}
\ No newline at end of file
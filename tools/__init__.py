@@ -0,0 +1 @@
+"""Developer tools for the Brink Home integration."""
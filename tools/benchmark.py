@@ -0,0 +1,334 @@
+"""Benchmark the per-poll hot paths of the Brink Home integration.
+
+Run from the repository root in an environment with Home Assistant:
+
+    python -m tools.benchmark --scenario 1x100 --scenario 100x1000 -o bench.json
+
+Each scenario is SYSTEMSxPARAMETERS. The results are written as JSON so the
+per-poll cost can be compared between commits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.brink_ventilation import async_get_devices
+from custom_components.brink_ventilation.const import (
+    PARAM_BYPASS_OPERATION,
+    PARAM_NAME_MAP,
+    PARAM_OPERATING_MODE,
+    PARAM_VENTILATION_LEVEL,
+)
+from custom_components.brink_ventilation.core.brink_home_cloud import BrinkHomeCloud
+from custom_components.brink_ventilation.fan import BrinkHomeVentilationFanEntity
+from custom_components.brink_ventilation.labels import load_labels
+from custom_components.brink_ventilation.select import (
+    BrinkHomeBypassOperationSelectEntity,
+    BrinkHomeModeSelectEntity,
+)
+from custom_components.brink_ventilation.sensor import (
+    SENSOR_DESCRIPTIONS,
+    BrinkHomeSensorEntity,
+)
+
+from .synthetic import build_parameter_values, build_systems, build_uidescription
+
+DEFAULT_SCENARIOS = ("1x100", "1x1000", "10x1000", "100x1000")
+LABELS = load_labels("en")
+
+
+class _Content:
+    """Body stream of an in-memory response."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+        self.total_bytes = len(body)
+
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self._body), size):
+            yield self._body[start : start + size]
+
+
+class _Response:
+    """In-memory stand-in for an aiohttp response."""
+
+    def __init__(self, body: bytes) -> None:
+        self.status = 200
+        self.headers: dict[str, str] = {}
+        self.content_length = len(body)
+        self.content = _Content(body)
+        self._body = body
+
+    async def json(self) -> Any:
+        return json.loads(self._body)
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def release(self) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class SyntheticSession:
+    """Serve pre-encoded synthetic payloads without any network I/O.
+
+    Every system shares one uidescription. Parameter-values responses
+    alternate between two variants so each poll sees changed values.
+    """
+
+    def __init__(self, systems: int, parameters: int, depth: int) -> None:
+        uidescription = build_uidescription(parameters, depth)
+        self._systems = json.dumps(
+            {"items": build_systems(systems), "totalCount": systems}
+        ).encode()
+        self._uidescription = json.dumps(uidescription).encode()
+        self._values = [
+            json.dumps(build_parameter_values(uidescription, seed)).encode()
+            for seed in (1, 2)
+        ]
+        self._polls = 0
+
+    def next_poll(self) -> None:
+        """Switch to the other parameter-values variant."""
+        self._polls += 1
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> _Response:
+        if "/uidescription" in url:
+            return _Response(self._uidescription)
+        if "/parameter-values" in url:
+            return _Response(self._values[self._polls % 2])
+        return _Response(self._systems)
+
+
+def _timed(samples: list[float], func: Callable[[], Any], repeat: int) -> None:
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+
+
+async def _timed_async(
+    samples: list[float],
+    func: Callable[[], Awaitable[Any]],
+    repeat: int,
+    reset: Callable[[], Any] | None = None,
+) -> None:
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        started = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - started)
+
+
+def _result(name: str, scenario: dict[str, Any], samples: list[float]) -> dict:
+    return {
+        "benchmark": name,
+        **scenario,
+        "repeat": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+
+def _iter_raw_parameters(nav_items: list[dict[str, Any]]):
+    for nav_item in nav_items:
+        for group in nav_item.get("parameterGroups", ()):
+            yield from group["parameters"]
+        yield from _iter_raw_parameters(nav_item.get("navigationItems", ()))
+
+
+def _new_client(session: SyntheticSession) -> BrinkHomeCloud:
+    client = BrinkHomeCloud(
+        session, "benchmark", "benchmark", stream_decode=True, labels=LABELS
+    )
+    # Registered like async_setup_entry does, so polls extract the working set.
+    client.register_consumer(*PARAM_NAME_MAP.values())
+    client.restore_tokens(
+        {"access_token": "benchmark", "expires_at": time.time() + 3600}
+    )
+    return client
+
+
+def _build_entities(client: BrinkHomeCloud, devices: dict[int, dict[str, Any]]):
+    coordinator = SimpleNamespace(data=devices, last_update_success=True)
+    sensors = [
+        BrinkHomeSensorEntity(client, coordinator, system_id, description)
+        for system_id in devices
+        for description in SENSOR_DESCRIPTIONS
+    ]
+    selects = [
+        entity_class(client, coordinator, system_id, key)
+        for system_id in devices
+        for entity_class, key in (
+            (BrinkHomeModeSelectEntity, PARAM_OPERATING_MODE),
+            (BrinkHomeBypassOperationSelectEntity, PARAM_BYPASS_OPERATION),
+        )
+    ]
+    fans = [
+        BrinkHomeVentilationFanEntity(
+            client, coordinator, system_id, PARAM_VENTILATION_LEVEL
+        )
+        for system_id in devices
+    ]
+    return sensors, selects, fans
+
+
+async def run_scenario(
+    systems: int, parameters: int, depth: int, repeat: int
+) -> list[dict[str, Any]]:
+    """Run every benchmark for one scenario."""
+    scenario = {"systems": systems, "parameters": parameters, "depth": depth}
+    session = SyntheticSession(systems, parameters, depth)
+    uidescription = build_uidescription(parameters, depth)
+    body = json.dumps(uidescription).encode()
+    nav_items = uidescription["root"]["navigationItems"]
+    list_items = [
+        param["listItems"]
+        for param in _iter_raw_parameters(nav_items)
+        if param["listItems"]
+    ]
+    results = []
+
+    # A cold run starts without any caches. With a warm catalog only the
+    # per-item cache is dropped, as after a navigation item changed.
+    extractor = _new_client(session)
+
+    def cold() -> None:
+        extractor._group_cache.clear()
+        extractor._catalogs.clear()
+
+    def warm_catalog() -> None:
+        extractor._group_cache.clear()
+
+    async def extract() -> None:
+        extractor._extract_parameters_incremental(1, nav_items)
+
+    async def stream() -> None:
+        await extractor._stream_parameters(1, _Response(body))
+
+    try:
+        for name, func in (
+            ("extract_parameters", extract),
+            ("stream_parameters", stream),
+        ):
+            for variant, reset in (("cold", cold), ("warm_catalog", warm_catalog)):
+                samples: list[float] = []
+                await _timed_async(samples, func, repeat, reset)
+                results.append(_result(f"{name}_{variant}", scenario, samples))
+    finally:
+        await extractor.close()
+
+    samples = []
+    _timed(
+        samples,
+        lambda: [
+            BrinkHomeCloud._extract_options(items, LABELS) for items in list_items
+        ],
+        repeat,
+    )
+    results.append(_result("extract_options", scenario, samples))
+
+    clients: list[BrinkHomeCloud] = []
+    devices: dict[int, dict[str, Any]] = {}
+
+    async def discover() -> None:
+        nonlocal devices
+        clients.append(_new_client(session))
+        devices = await async_get_devices(clients[-1])
+
+    try:
+        samples = []
+        await _timed_async(samples, discover, repeat)
+        results.append(_result("discovery_poll", scenario, samples))
+
+        async def poll() -> None:
+            nonlocal devices
+            session.next_poll()
+            devices = await async_get_devices(clients[-1])
+
+        samples = []
+        await _timed_async(samples, poll, repeat)
+        results.append(_result("async_get_devices", scenario, samples))
+
+        sensors, selects, fans = _build_entities(clients[-1], devices)
+        for name, entities, attribute in (
+            ("sensor_native_value", sensors, "native_value"),
+            ("select_current_option", selects, "current_option"),
+            ("fan_percentage", fans, "percentage"),
+        ):
+            samples = []
+            _timed(
+                samples,
+                lambda: [getattr(entity, attribute) for entity in entities],
+                repeat,
+            )
+            results.append(_result(name, scenario, samples))
+    finally:
+        for client in clients:
+            await client.close()
+    return results
+
+
+def _parse_scenario(value: str) -> tuple[int, int]:
+    systems, _, parameters = value.lower().partition("x")
+    try:
+        return int(systems), int(parameters)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Scenario must look like SYSTEMSxPARAMETERS, got {value!r}"
+        ) from None
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        type=_parse_scenario,
+        help="SYSTEMSxPARAMETERS, may be repeated "
+        f"(default: {', '.join(DEFAULT_SCENARIOS)})",
+    )
+    parser.add_argument("--depth", type=int, default=2, help="navigation depth")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark")
+    parser.add_argument("-o", "--output", help="JSON file, stdout by default")
+    args = parser.parse_args(argv)
+
+    scenarios = args.scenario or [_parse_scenario(s) for s in DEFAULT_SCENARIOS]
+    results: list[dict[str, Any]] = []
+    for systems, parameters in scenarios:
+        results.extend(
+            asyncio.run(run_scenario(systems, parameters, args.depth, args.repeat))
+        )
+
+    report = {
+        "created_at": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""Load-test the integration with several accounts against the mock cloud.
+
+Starts the mock cloud from tools/mock_cloud.py and a Home Assistant test
+instance, sets up N config entries with M systems each and lets their
+coordinators poll for the given duration. Requires
+pytest-homeassistant-custom-component, and must run from the repository
+root so custom_components is importable:
+
+    python -m tools.load_test --accounts 5 --systems 4 --duration 120 -o load.json
+
+The report holds event-loop lag, refresh cycle times, requests and entity
+state writes per second and the memory of the process, sampled over time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+from typing import Any
+
+from homeassistant import loader
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_URL,
+    CONF_USERNAME,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.brink_ventilation.const import (
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    DATA_COORDINATOR,
+    DOMAIN,
+)
+
+from .mock_cloud import MockBrinkCloud, MockCloudConfig
+
+_LAG_INTERVAL = 0.05
+_PASSWORD = "load-test"
+
+
+def _rss_bytes() -> int:
+    """Return the resident memory of the process."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is the peak, in KiB on Linux and bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _summary(values: list[float]) -> dict[str, float | None]:
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "max": None}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "p50": statistics.median(ordered),
+        "p95": ordered[max(0, round(0.95 * len(ordered)) - 1)],
+        "max": ordered[-1],
+    }
+
+
+class _LoopLagMonitor:
+    """Measure how late the event loop wakes up a sleeping task."""
+
+    def __init__(self) -> None:
+        self.lags: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def drain(self) -> list[float]:
+        lags, self.lags = self.lags, []
+        return lags
+
+    async def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(_LAG_INTERVAL)
+            self.lags.append(max(0.0, time.monotonic() - started - _LAG_INTERVAL))
+
+
+async def _setup_entries(
+    hass: HomeAssistant, base_url: str, args: argparse.Namespace
+) -> tuple[list[MockConfigEntry], list[float]]:
+    entries = []
+    for number in range(args.accounts):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"load-test-{number}",
+            unique_id=f"load-test-{number}@example.com",
+            data={
+                CONF_USERNAME: f"load-test-{number}@example.com",
+                CONF_PASSWORD: _PASSWORD,
+                CONF_URL: base_url,
+            },
+            options={
+                CONF_SCAN_INTERVAL: args.scan_interval,
+                CONF_MIN_SCAN_INTERVAL: args.min_scan_interval,
+                CONF_MAX_SCAN_INTERVAL: args.max_scan_interval,
+            },
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    async def setup(entry: MockConfigEntry) -> float:
+        started = time.monotonic()
+        if not await hass.config_entries.async_setup(entry.entry_id):
+            raise RuntimeError(f"Setting up {entry.title} failed")
+        return time.monotonic() - started
+
+    # All accounts set up at once, as after a Home Assistant restart.
+    setup_times = await asyncio.gather(*(setup(entry) for entry in entries))
+    await hass.async_block_till_done()
+    return entries, list(setup_times)
+
+
+async def run_load_test(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test and return its report."""
+    cloud = MockBrinkCloud(
+        MockCloudConfig(
+            username=None,
+            password=_PASSWORD,
+            systems=args.systems,
+            parameters=args.parameters,
+            latency=args.latency,
+            latency_jitter=args.latency_jitter,
+            error_rate=args.error_rate,
+        )
+    )
+    base_url = await cloud.start()
+    monitor = _LoopLagMonitor()
+    samples: list[dict[str, Any]] = []
+    cycles: list[float] = []
+    try:
+        async with async_test_home_assistant() as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            state_writes = 0
+
+            @callback
+            def count_state_write(_event: Event) -> None:
+                nonlocal state_writes
+                state_writes += 1
+
+            hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_write)
+            monitor.start()
+            entries, setup_times = await _setup_entries(hass, base_url, args)
+            coordinators = [
+                hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+                for entry in entries
+            ]
+            seen: set[tuple[int, float]] = set()
+
+            started = last_sample = time.monotonic()
+            last_requests = sum(cloud.stats.requests.values())
+            last_writes = state_writes
+            while time.monotonic() - started < args.duration:
+                await asyncio.sleep(args.sample_interval)
+                now = time.monotonic()
+                elapsed = now - last_sample
+                requests = sum(cloud.stats.requests.values())
+                lags = monitor.drain()
+                for number, coordinator in enumerate(coordinators):
+                    for trace in coordinator.cycles:
+                        key = (number, trace.started_at)
+                        if key not in seen and trace.duration is not None:
+                            seen.add(key)
+                            cycles.append(trace.duration)
+                samples.append(
+                    {
+                        "elapsed": now - started,
+                        "loop_lag_mean": statistics.fmean(lags) if lags else None,
+                        "loop_lag_max": max(lags, default=None),
+                        "requests_per_second": (requests - last_requests) / elapsed,
+                        "state_writes_per_second": (state_writes - last_writes)
+                        / elapsed,
+                        "rss_bytes": _rss_bytes(),
+                    }
+                )
+                last_sample, last_requests, last_writes = now, requests, state_writes
+
+            for entry in entries:
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+    finally:
+        await monitor.stop()
+        await cloud.stop()
+
+    lag_maxima = [s["loop_lag_max"] for s in samples if s["loop_lag_max"] is not None]
+    return {
+        "created_at": time.time(),
+        "config": vars(args),
+        "setup_seconds": _summary(setup_times),
+        "refresh_cycle_seconds": _summary(cycles),
+        "loop_lag_max_seconds": max(lag_maxima, default=None),
+        "mock_cloud": {
+            "requests": cloud.stats.requests,
+            "injected_errors": cloud.stats.injected_errors,
+            "logins": cloud.stats.logins,
+            "token_refreshes": cloud.stats.token_refreshes,
+        },
+        "samples": samples,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the load test and write the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=3, help="config entries")
+    parser.add_argument("--systems", type=int, default=2, help="systems per account")
+    parser.add_argument("--parameters", type=int, default=300)
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds")
+    parser.add_argument("--scan-interval", type=int, default=5, help="seconds")
+    parser.add_argument(
+        "--min-scan-interval",
+        type=int,
+        help="seconds, the scan interval by default so polling does not adapt",
+    )
+    parser.add_argument(
+        "--max-scan-interval",
+        type=int,
+        help="seconds, the scan interval by default so polling does not adapt",
+    )
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="seconds")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.05, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("-o", "--output", help="JSON file, stdout by default")
+    args = parser.parse_args(argv)
+    if args.min_scan_interval is None:
+        args.min_scan_interval = args.scan_interval
+    if args.max_scan_interval is None:
+        args.max_scan_interval = args.scan_interval
+    if not args.min_scan_interval <= args.scan_interval <= args.max_scan_interval:
+        parser.error("--scan-interval must lie between the minimum and maximum")
+
+    report = asyncio.run(run_load_test(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,413 @@
+"""Local stand-in for the Brink Home cloud.
+
+Emulates the OIDC authorization code flow with PKCE (authorize, login page
+with CSRF token and antiforgery cookie, callback and token endpoints) and
+the systems, uidescription and parameter-values API. Latency, injected
+errors and payload size are configurable.
+
+    python -m tools.mock_cloud --systems 10 --parameters 1000 --latency 0.05
+
+Point the client at it with BrinkHomeCloud(..., base_url=server.base_url).
+Use a host name rather than an IP address: the login session of the client
+does not accept cookies from IP addresses.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import html
+import json
+import random
+import secrets
+import time
+from dataclasses import dataclass, field
+from urllib.parse import quote, urlencode
+
+from aiohttp import web
+
+from .synthetic import build_parameter_values, build_systems, build_uidescription
+
+API_PREFIX = "/portal/api/v1.1"
+LOGIN_PATH = "/idsrv/Account/Login"
+CALLBACK_PATH = "/idsrv/connect/authorize/callback"
+ANTIFORGERY_COOKIE = ".AspNetCore.Antiforgery"
+SESSION_COOKIE = "idsrv.session"
+
+
+@dataclass
+class MockCloudConfig:
+    """Behaviour of the mock cloud.
+
+    With username set to None any username is accepted, which lets several
+    simulated accounts share one server.
+    """
+
+    username: str | None = "user@example.com"
+    password: str = "password"
+    systems: int = 1
+    parameters: int = 100
+    depth: int = 2
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    retry_after: int | None = None
+    login_error_rate: float = 0.0
+    token_lifetime: int = 3600
+    seed: int = 0
+
+
+@dataclass
+class MockCloudStats:
+    """Requests served by the mock cloud."""
+
+    requests: dict[str, int] = field(default_factory=dict)
+    injected_errors: int = 0
+    logins: int = 0
+    token_refreshes: int = 0
+
+    def count(self, route: str) -> None:
+        """Count one request to a route."""
+        self.requests[route] = self.requests.get(route, 0) + 1
+
+
+class MockBrinkCloud:
+    """aiohttp application emulating the Brink Home cloud."""
+
+    def __init__(self, config: MockCloudConfig | None = None) -> None:
+        self.config = config or MockCloudConfig()
+        self.stats = MockCloudStats()
+        self._rng = random.Random(self.config.seed)
+        self._uidescription = build_uidescription(
+            self.config.parameters, self.config.depth, seed=self.config.seed
+        )
+        self._uidescription_body = json.dumps(self._uidescription).encode()
+        self._etag = f'"{hashlib.sha256(self._uidescription_body).hexdigest()[:16]}"'
+        self._systems = build_systems(self.config.systems)
+        self._values = {
+            item["valueId"]: item
+            for item in build_parameter_values(self._uidescription, self.config.seed)
+        }
+        self._antiforgery: dict[str, str] = {}
+        self._authorize_requests: dict[str, dict[str, str]] = {}
+        self._sessions: set[str] = set()
+        self._codes: dict[str, dict[str, str]] = {}
+        self._access_tokens: dict[str, float] = {}
+        self._refresh_tokens: set[str] = set()
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_get(
+            "/idsrv/.well-known/openid-configuration", self._discovery
+        )
+        self.app.router.add_get("/idsrv/connect/authorize", self._authorize)
+        self.app.router.add_get(LOGIN_PATH, self._login_page)
+        self.app.router.add_post(LOGIN_PATH, self._login)
+        self.app.router.add_get(CALLBACK_PATH, self._callback)
+        self.app.router.add_post("/idsrv/connect/token", self._token)
+        self.app.router.add_get(f"{API_PREFIX}/systems", self._get_systems)
+        self.app.router.add_get(
+            f"{API_PREFIX}/systems/{{system_id}}/uidescription",
+            self._get_uidescription,
+        )
+        self.app.router.add_get(
+            f"{API_PREFIX}/systems/{{system_id}}/parameter-values",
+            self._get_parameter_values,
+        )
+        self.app.router.add_put(
+            f"{API_PREFIX}/systems/{{system_id}}/parameter-values",
+            self._put_parameter_values,
+        )
+
+    async def start(self, host: str = "localhost", port: int = 0) -> str:
+        """Serve the application and return its base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Add latency, inject errors and count requests."""
+        route = request.match_info.route.resource
+        self.stats.count(route.canonical if route is not None else request.path)
+        config = self.config
+        delay = config.latency + self._rng.uniform(0, config.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        error_rate = (
+            config.error_rate
+            if request.path.startswith(API_PREFIX)
+            else config.login_error_rate
+        )
+        if error_rate and self._rng.random() < error_rate:
+            self.stats.injected_errors += 1
+            headers = {}
+            if config.retry_after is not None:
+                headers["Retry-After"] = str(config.retry_after)
+            return web.Response(status=config.error_status, headers=headers)
+        return await handler(request)
+
+    async def _discovery(self, request: web.Request) -> web.Response:
+        base = f"{request.scheme}://{request.host}"
+        return web.json_response(
+            {
+                "issuer": f"{base}/idsrv",
+                "authorization_endpoint": f"{base}/idsrv/connect/authorize",
+                "token_endpoint": f"{base}/idsrv/connect/token",
+            }
+        )
+
+    async def _authorize(self, request: web.Request) -> web.Response:
+        query = request.query
+        required = ("client_id", "redirect_uri", "state", "code_challenge")
+        if query.get("response_type") != "code" or not all(
+            query.get(name) for name in required
+        ):
+            return web.Response(status=400, text="invalid_request")
+        if query.get("code_challenge_method") != "S256":
+            return web.Response(status=400, text="invalid_request")
+
+        request_id = secrets.token_urlsafe(16)
+        self._authorize_requests[request_id] = dict(query)
+        return_url = f"{CALLBACK_PATH}?request_id={request_id}"
+        raise web.HTTPFound(f"{LOGIN_PATH}?ReturnUrl={quote(return_url, safe='')}")
+
+    async def _login_page(self, request: web.Request) -> web.Response:
+        cookie = secrets.token_urlsafe(16)
+        csrf_token = secrets.token_urlsafe(32)
+        self._antiforgery[cookie] = csrf_token
+        return_url = html.escape(request.query.get("ReturnUrl", ""), quote=True)
+        body = (
+            "<html><body><form method='post'>"
+            "<input name='Username' type='text'>"
+            "<input name='Password' type='password'>"
+            f"<input name='__RequestVerificationToken' type='hidden' "
+            f"value='{csrf_token}'>"
+            f"<input name='ReturnUrl' type='hidden' value='{return_url}'>"
+            "</form></body></html>"
+        )
+        response = web.Response(text=body, content_type="text/html")
+        response.set_cookie(ANTIFORGERY_COOKIE, cookie, httponly=True)
+        return response
+
+    async def _login(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        cookie = request.cookies.get(ANTIFORGERY_COOKIE)
+        expected = self._antiforgery.pop(cookie, None) if cookie else None
+        if expected is None or form.get("__RequestVerificationToken") != expected:
+            return web.Response(status=400, text="Antiforgery token validation failed")
+        if (
+            self.config.username not in (None, form.get("Username"))
+            or form.get("Password") != self.config.password
+        ):
+            return web.Response(
+                text="<html><body>Invalid username or password</body></html>",
+                content_type="text/html",
+            )
+        return_url = str(form.get("ReturnUrl") or "")
+        if not return_url.startswith(CALLBACK_PATH):
+            return web.Response(status=400, text="invalid ReturnUrl")
+
+        session = secrets.token_urlsafe(16)
+        self._sessions.add(session)
+        response = web.HTTPFound(return_url)
+        response.set_cookie(SESSION_COOKIE, session, httponly=True)
+        raise response
+
+    async def _callback(self, request: web.Request) -> web.Response:
+        if request.cookies.get(SESSION_COOKIE) not in self._sessions:
+            return web.Response(status=401, text="login required")
+        params = self._authorize_requests.pop(request.query.get("request_id", ""), None)
+        if params is None:
+            return web.Response(status=400, text="unknown authorize request")
+        code = secrets.token_urlsafe(24)
+        self._codes[code] = params
+        query = urlencode({"code": code, "state": params["state"]})
+        raise web.HTTPFound(f"{params['redirect_uri']}?{query}")
+
+    async def _token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        grant_type = form.get("grant_type")
+        if grant_type == "authorization_code":
+            params = self._codes.pop(str(form.get("code")), None)
+            verifier = str(form.get("code_verifier") or "")
+            challenge = (
+                base64.urlsafe_b64encode(hashlib.sha256(verifier.encode()).digest())
+                .rstrip(b"=")
+                .decode()
+            )
+            if (
+                params is None
+                or params["code_challenge"] != challenge
+                or params["redirect_uri"] != form.get("redirect_uri")
+            ):
+                return web.json_response({"error": "invalid_grant"}, status=400)
+            self.stats.logins += 1
+        elif grant_type == "refresh_token":
+            refresh_token = str(form.get("refresh_token"))
+            if refresh_token not in self._refresh_tokens:
+                return web.json_response({"error": "invalid_grant"}, status=400)
+            self._refresh_tokens.discard(refresh_token)
+            self.stats.token_refreshes += 1
+        else:
+            return web.json_response({"error": "unsupported_grant_type"}, status=400)
+
+        access_token = secrets.token_urlsafe(32)
+        refresh_token = secrets.token_urlsafe(32)
+        expires_at = time.monotonic() + self.config.token_lifetime
+        self._access_tokens[access_token] = expires_at
+        self._refresh_tokens.add(refresh_token)
+        return web.json_response(
+            {
+                "access_token": access_token,
+                "expires_in": self.config.token_lifetime,
+                "refresh_token": refresh_token,
+                "token_type": "Bearer",
+            }
+        )
+
+    def _authorized(self, request: web.Request) -> bool:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        expires_at = self._access_tokens.get(token)
+        return scheme == "Bearer" and expires_at is not None and (
+            time.monotonic() < expires_at
+        )
+
+    def _system_id(self, request: web.Request) -> int | None:
+        try:
+            system_id = int(request.match_info["system_id"])
+        except ValueError:
+            return None
+        return system_id if 1 <= system_id <= self.config.systems else None
+
+    async def _get_systems(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        page_size = max(1, int(request.query.get("pageSize", 50)))
+        page_number = max(1, int(request.query.get("pageNumber", 1)))
+        start = (page_number - 1) * page_size
+        return web.json_response(
+            {
+                "items": self._systems[start : start + page_size],
+                "totalCount": len(self._systems),
+                "pageNumber": page_number,
+                "pageSize": page_size,
+            }
+        )
+
+    async def _get_uidescription(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        if self._system_id(request) is None:
+            return web.Response(status=404)
+        if request.headers.get("If-None-Match") == self._etag:
+            return web.Response(status=304, headers={"ETag": self._etag})
+        return web.Response(
+            body=self._uidescription_body,
+            content_type="application/json",
+            headers={"ETag": self._etag},
+        )
+
+    async def _get_parameter_values(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        if self._system_id(request) is None:
+            return web.Response(status=404)
+        try:
+            value_ids = [
+                int(value_id)
+                for value_id in request.query.get("valueIds", "").split(",")
+                if value_id
+            ]
+        except ValueError:
+            return web.Response(status=400)
+        values = []
+        for value_id in value_ids:
+            item = self._values.get(value_id)
+            if item is None:
+                continue
+            value = item["value"]
+            if value.isdigit() and int(value) > 1:
+                value = str(max(0, int(value) + self._rng.randint(-2, 2)))
+            values.append({**item, "value": value})
+        return web.json_response(values)
+
+    async def _put_parameter_values(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.Response(status=401)
+        if self._system_id(request) is None:
+            return web.Response(status=404)
+        payload = await request.json()
+        for item in payload.get("writeValues", ()):
+            current = self._values.get(item.get("valueId"))
+            if current is not None:
+                current["value"] = str(item.get("value"))
+        return web.json_response({})
+
+
+async def _serve(config: MockCloudConfig, host: str, port: int) -> None:
+    cloud = MockBrinkCloud(config)
+    base_url = await cloud.start(host, port)
+    print(f"Mock Brink cloud listening on {base_url}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await cloud.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the mock cloud until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--username", default=MockCloudConfig.username)
+    parser.add_argument("--password", default=MockCloudConfig.password)
+    parser.add_argument("--systems", type=int, default=1)
+    parser.add_argument("--parameters", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--retry-after", type=int)
+    parser.add_argument("--login-error-rate", type=float, default=0.0)
+    parser.add_argument("--token-lifetime", type=int, default=3600)
+    args = parser.parse_args(argv)
+
+    config = MockCloudConfig(
+        username=args.username,
+        password=args.password,
+        systems=args.systems,
+        parameters=args.parameters,
+        depth=args.depth,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=args.retry_after,
+        login_error_rate=args.login_error_rate,
+        token_lifetime=args.token_lifetime,
+    )
+    try:
+        asyncio.run(_serve(config, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Synthetic Brink Home API payloads for benchmarks and load tests."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+# Raw parameters the integration maps to entities, with a plausible value and
+# the list items of selectable parameters.
+KNOWN_PARAMETERS: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("deviceTypeTitle", "Flair 325", ()),
+    ("softwareLabel", "S1.02.03", ()),
+    ("Lüftungsstufe", "2", ("Aus", "Stufe 1", "Stufe 2", "Stufe 3")),
+    ("Betriebsart", "0", ("Automatisch", "Manuell")),
+    ("Status Filtermeldung", "0", ("Filter sauber", "Filter schmutzig")),
+    ("Restlaufzeit Betriebsartfunktion", "0", ()),
+    ("Aktive Regelung", "11", ()),
+    ("Ist-Wert Luftdurchsatz Zuluft", "150", ()),
+    ("Ist-Wert Luftdurchsatz Abluft", "148", ()),
+    ("Ablufttemperatur", "21.5", ()),
+    ("Frischlufttemperatur", "8.2", ()),
+    ("Zulufttemperatur", "19.8", ()),
+    ("Relative Feuchte", "45", ()),
+    ("Status Vorheizregister", "0", ("Aus", "Ein")),
+    ("Status Bypassklappe", "0", ("Geschlossen", "Offen")),
+    ("Funktion der Bypass Klappe", "0", ("Automatisch", "Zu", "Auf")),
+    ("PPM eBus CO2-sensor 1", "650", ()),
+    ("Anzahl der Tage seit Filterreset", "42", ()),
+)
+
+
+def build_parameter(
+    numeric_id: int,
+    name: str,
+    value: str,
+    labels: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    """Return one raw uidescription parameter."""
+    return {
+        "id": numeric_id,
+        "valueId": 10_000 + numeric_id,
+        "name": name,
+        "value": value,
+        "valueState": 1,
+        "readWrite": 1 if labels else 0,
+        "controlType": 1 if labels else 0,
+        "componentId": numeric_id % 7,
+        "minValue": 0,
+        "maxValue": max(len(labels) - 1, 100),
+        "unit": None if labels else "",
+        "listItems": [
+            {"value": str(position), "displayText": label, "isSelectable": True}
+            for position, label in enumerate(labels)
+        ],
+    }
+
+
+def build_uidescription(
+    parameter_count: int = 100,
+    depth: int = 2,
+    fanout: int = 3,
+    groups_per_item: int = 2,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Return a uidescription with parameter_count parameters.
+
+    Navigation items are nested depth levels deep with fanout children each.
+    The parameters the integration uses come first, the rest are filler
+    spread evenly over the groups of every navigation item.
+    """
+    rng = random.Random(seed)
+    raw: list[dict[str, Any]] = [
+        build_parameter(numeric_id, name, value, labels)
+        for numeric_id, (name, value, labels) in enumerate(KNOWN_PARAMETERS, 1)
+    ][:parameter_count]
+    for numeric_id in range(len(raw) + 1, parameter_count + 1):
+        labels = ("Aus", "Ein") if numeric_id % 5 == 0 else ()
+        value = str(rng.randint(0, 1)) if labels else str(rng.randint(0, 500))
+        raw.append(
+            build_parameter(numeric_id, f"Parameter {numeric_id}", value, labels)
+        )
+
+    items = (fanout ** (depth + 1) - 1) // (fanout - 1) if fanout > 1 else depth + 1
+    slots = items * groups_per_item
+    chunks = [raw[position::slots] for position in range(slots)]
+
+    def navigation_item(level: int) -> dict[str, Any]:
+        item: dict[str, Any] = {
+            "parameterGroups": [
+                {"parameters": chunks.pop()} for _ in range(groups_per_item)
+            ]
+        }
+        if level < depth:
+            item["navigationItems"] = [
+                navigation_item(level + 1) for _ in range(fanout)
+            ]
+        return item
+
+    return {"root": {"navigationItems": [navigation_item(0)]}}
+
+
+def build_systems(count: int) -> list[dict[str, Any]]:
+    """Return the items of a systems list with count online systems."""
+    return [
+        {
+            "systemShareId": system_id,
+            "systemName": f"Brink {system_id}",
+            "serialNumber": f"SN{system_id:06d}",
+            "gatewayState": 2,
+        }
+        for system_id in range(1, count + 1)
+    ]
+
+
+def build_parameter_values(
+    uidescription: dict[str, Any], seed: int = 0
+) -> list[dict[str, Any]]:
+    """Return a parameter-values list for every parameter of a uidescription.
+
+    Numeric values are varied slightly to mimic a new poll.
+    """
+    rng = random.Random(seed)
+    values: list[dict[str, Any]] = []
+    stack = list(uidescription["root"]["navigationItems"])
+    while stack:
+        item = stack.pop()
+        stack.extend(item.get("navigationItems", ()))
+        for group in item.get("parameterGroups", ()):
+            for param in group["parameters"]:
+                value = param["value"]
+                if not param["listItems"] and value.isdigit():
+                    value = str(max(0, int(value) + rng.randint(-2, 2)))
+                values.append(
+                    {"valueId": param["valueId"], "value": value, "valueState": 1}
+                )
+    return values